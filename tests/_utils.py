@@ -30,8 +30,8 @@ def _mock_response(
     text: str | None = None,
     url: str | None = None,
     async_mock: bool = False,
-) -> None:
-    """Mock response with status code 200."""
+) -> Any:
+    """Mock response with status code 200, returns the patched method mock."""
     mock_response = mocker.Mock(spec=Response)
     mock_response.status_code = status_code
     mock_response.raise_for_status = mocker.Mock()
@@ -41,6 +41,11 @@ def _mock_response(
             '404 Client Error: Not Found for url'
         )
 
+    # payload is measured at decode time for size-aware caching
+    mock_response.content = (
+        json.dumps(response_jsons[0]).encode() if response_jsons else b''
+    )
+
     if response_jsons is not None and len(response_jsons) == 1:
         mock_response.json.return_value = response_jsons[0]
 
@@ -54,7 +59,7 @@ def _mock_response(
         mock_response.url = url
 
     mock_class = mocker.AsyncMock if async_mock else mocker.Mock
-    mocker.patch(patched_method, new=mock_class(return_value=mock_response))
+    return mocker.patch(patched_method, new=mock_class(return_value=mock_response))
 
 
 def _process_chart_like_yfinance(chart_result: dict[str, Any]) -> pd.DataFrame:
@@ -0,0 +1,35 @@
+import re
+import subprocess
+import sys
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+BENCHMARK_KWARGS = dict(rounds=20, iterations=1, warmup_rounds=2)
+# cumulative import time budget (in microsecs) for bare `import yafin`
+IMPORT_TIME_BUDGET_US = 20_000
+
+
+def _import_yafin_us() -> int:
+    """Import yafin in a fresh interpreter and return its cumulative import time."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import yafin'],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # line format: import time: <self us> | <cumulative us> | <module>
+    match = re.search(r'\|\s*(\d+)\s*\|\s*yafin\s*$', completed.stderr, re.MULTILINE)
+    assert match is not None
+    return int(match.group(1))
+
+
+class TestPerformanceImport:
+    """Performance tests for import yafin."""
+
+    @pytest.mark.performance
+    def test_import_time(self, benchmark: BenchmarkFixture) -> None:
+        """Test import time of yafin package stays within budget."""
+        import_time_us = benchmark.pedantic(_import_yafin_us, **BENCHMARK_KWARGS)  # type: ignore[no-untyped-call, unused-ignore]
+
+        assert import_time_us < IMPORT_TIME_BUDGET_US
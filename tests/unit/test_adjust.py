@@ -0,0 +1,90 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from yafin.adjust import adjust_chart, get_adjustment_factors
+
+
+@pytest.fixture
+def chart(chart_json_mock: dict[str, Any]) -> dict[str, Any]:
+    """Chart result with data for 1y, 1d."""
+    return chart_json_mock['chart']['result'][0]
+
+
+@pytest.fixture
+def split_chart() -> dict[str, Any]:
+    """Intraday chart result with unadjusted prices and 4:1 split."""
+    return {
+        'meta': {'dataGranularity': '1h'},
+        'timestamp': [100, 200, 300, 400],
+        'events': {
+            'splits': {
+                '300': {'date': 300, 'numerator': 4, 'denominator': 1},
+            },
+        },
+        'indicators': {
+            'quote': [
+                {
+                    'open': [40.0, None, 10.0, 10.0],
+                    'high': [40.0, None, 10.0, 10.0],
+                    'low': [40.0, None, 10.0, 10.0],
+                    'close': [40.0, None, 10.0, 10.0],
+                    'volume': [100, None, 400, 400],
+                }
+            ],
+        },
+    }
+
+
+class TestUnitAdjust:
+    """Unit tests for yafin.adjust module."""
+
+    def test_adjust_chart_adjclose(self, chart: dict[str, Any]) -> None:
+        """Test adjusted close matches Yahoo adjclose of daily chart."""
+        adjusted_chart = adjust_chart(chart)
+        expected = chart['indicators']['adjclose'][0]['adjclose']
+
+        np.testing.assert_allclose(
+            adjusted_chart['indicators']['quote'][0]['close'], expected, rtol=1e-6
+        )
+        np.testing.assert_allclose(
+            adjusted_chart['indicators']['adjclose'][0]['adjclose'],
+            expected,
+            rtol=1e-6,
+        )
+        # original chart is not modified
+        assert chart['indicators']['adjclose'][0]['adjclose'] is expected
+
+    def test_get_adjustment_factors(self, chart: dict[str, Any]) -> None:
+        """Test factors decrease towards older bars and last bar is not adjusted."""
+        factors = get_adjustment_factors(chart)
+
+        assert factors.shape == (len(chart['timestamp']),)
+        assert factors[-1] == 1.0
+        assert (np.diff(factors) >= 0).all()
+        assert (get_adjustment_factors(chart, dividends=False) == 1.0).all()
+
+    def test_adjust_chart_splits(self, split_chart: dict[str, Any]) -> None:
+        """Test split adjusts prices and volume before the split, gaps stay None."""
+        adjusted_chart = adjust_chart(split_chart, splits=True)
+        adjusted_quote = adjusted_chart['indicators']['quote'][0]
+
+        assert adjusted_quote['close'] == [10.0, None, 10.0, 10.0]
+        assert adjusted_quote['open'] == [10.0, None, 10.0, 10.0]
+        assert adjusted_quote['volume'] == [400.0, None, 400.0, 400.0]
+
+    def test_adjust_chart_events(self, split_chart: dict[str, Any]) -> None:
+        """Test events of other chart are used for chart without events."""
+        events = split_chart.pop('events')
+        events['dividends'] = {
+            # before the first bar
+            '50': {'date': 50, 'amount': 1.0},
+            # previous bar with data is the 1st one, the 2nd is gap
+            '300': {'date': 300, 'amount': 1.0},
+        }
+
+        assert (get_adjustment_factors(split_chart, splits=True) == 1.0).all()
+
+        factors = get_adjustment_factors(split_chart, splits=True, events=events)
+        np.testing.assert_allclose(factors, [0.25 * (1 - 1 / 40), 0.25 * 0.975, 1, 1])
@@ -0,0 +1,127 @@
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests._utils import _get_json_fixture
+from yafin import analytics
+from yafin.panel import Panel, build_panel
+
+
+@pytest.fixture
+def panel() -> Panel:
+    """Daily panel of META and AAPL."""
+    charts = [
+        _get_json_fixture(f'{t}_1d_1y.json', 'chart')['chart']['result'][0]
+        for t in ('meta', 'aapl')
+    ]
+    return build_panel(charts)
+
+
+@pytest.fixture
+def returns_with_gaps() -> Any:
+    """Random returns of 6 tickers with missing returns."""
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0, 0.02, size=(6, 300))
+    returns[rng.random(returns.shape) < 0.1] = np.nan
+    # listed later
+    returns[2, :200] = np.nan
+    return returns
+
+
+class TestUnitAnalytics:
+    """Unit tests for yafin.analytics module."""
+
+    @pytest.mark.parametrize('log', [True, False])
+    def test_get_returns(self, panel: Panel, log: bool) -> None:
+        """Test get_returns function."""
+        close = panel.get_field('close')
+        result = analytics.get_returns(panel, log=log)
+        expected = np.diff(np.log(close)) if log else close[:, 1:] / close[:, :-1] - 1
+
+        assert result.shape == close.shape
+        assert np.isnan(result[:, 0]).all()
+        np.testing.assert_allclose(result[:, 1:], expected)
+
+    def test_get_returns_float32(self, panel: Panel) -> None:
+        """Test get_returns function with float32 dtype."""
+        result = analytics.get_returns(panel, dtype='float32')
+
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(
+            result[:, 1:], analytics.get_returns(panel)[:, 1:], rtol=1e-4, atol=1e-6
+        )
+
+    def test_rolling_volatility(self, returns_with_gaps: Any) -> None:
+        """Test rolling_volatility function."""
+        result = analytics.rolling_volatility(
+            returns_with_gaps, window=21, periods_per_year=252
+        )
+        expected = pd.DataFrame(returns_with_gaps.T).rolling(21).std().to_numpy().T
+
+        np.testing.assert_allclose(result, expected * np.sqrt(252))
+
+        with pytest.raises(ValueError):
+            analytics.rolling_volatility(returns_with_gaps, window=1)
+
+    @pytest.mark.parametrize('chunk_size', [None, 4])
+    def test_covariance_correlation(
+        self, returns_with_gaps: Any, chunk_size: int | None
+    ) -> None:
+        """Test pairwise complete covariance and correlation match pandas."""
+        returns_df = pd.DataFrame(returns_with_gaps.T)
+
+        np.testing.assert_allclose(
+            analytics.covariance(returns_with_gaps, chunk_size=chunk_size),
+            returns_df.cov().to_numpy(),
+        )
+        np.testing.assert_allclose(
+            analytics.correlation(returns_with_gaps, chunk_size=chunk_size),
+            returns_df.corr().to_numpy(),
+        )
+
+    def test_covariance_complete(self, panel: Panel) -> None:
+        """Test covariance and correlation of complete returns match numpy."""
+        returns = analytics.get_returns(panel)
+
+        np.testing.assert_allclose(
+            analytics.covariance(returns), np.cov(returns[:, 1:])
+        )
+        np.testing.assert_allclose(
+            analytics.correlation(returns, chunk_size=1), np.corrcoef(returns[:, 1:])
+        )
+
+    def test_covariance_out_min_periods(
+        self, returns_with_gaps: Any, tmp_path: Any
+    ) -> None:
+        """Test covariance into memmap and NaN for pairs with few common periods."""
+        out = np.memmap(
+            tmp_path.joinpath('cov.dat'), dtype=np.float64, mode='w+', shape=(6, 6)
+        )
+        result = analytics.covariance(
+            returns_with_gaps, min_periods=150, chunk_size=2, out=out
+        )
+
+        assert result is out
+        assert np.isnan(result[2]).all()
+        assert not np.isnan(result[0, 1])
+
+    def test_beta(self, returns_with_gaps: Any) -> None:
+        """Test beta vs benchmark over pairwise complete periods."""
+        benchmark = returns_with_gaps[0]
+        returns = returns_with_gaps.copy()
+        returns[1] = 1.5 * benchmark
+        result = analytics.beta(returns, benchmark)
+
+        assert result[0] == pytest.approx(1.0)
+        assert result[1] == pytest.approx(1.5)
+
+        returns_df = pd.DataFrame(returns.T)
+        expected = returns_df.cov()[0] / pd.Series(
+            [
+                benchmark[returns_df[i].notna() & returns_df[0].notna()].var(ddof=1)
+                for i in returns_df
+            ]
+        )
+        np.testing.assert_allclose(result, expected.to_numpy())
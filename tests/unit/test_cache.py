@@ -0,0 +1,215 @@
+import asyncio
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from yafin.cache import (
+    _MISSING,
+    _async_sized_cache,
+    _record_payload_size,
+    _sized_cache,
+    _SizedCache,
+    clear_cache,
+    get_cache_info,
+    no_cache,
+    set_cache_max_bytes,
+)
+
+
+@pytest.fixture
+def cache() -> _SizedCache:
+    """Fresh new instance of _SizedCache for each tests."""
+    return _SizedCache(max_bytes=100)
+
+
+@pytest.fixture
+def global_cache() -> Generator[None, None, None]:
+    """Cleared global cache with small budget, restored after each test."""
+    max_bytes = get_cache_info().max_bytes
+    clear_cache()
+    set_cache_max_bytes(100)
+    yield
+    clear_cache()
+    set_cache_max_bytes(max_bytes)
+
+
+class TestUnitSizedCache:
+    """Unit tests for yafin.cache._SizedCache."""
+
+    def test_get_set(self, cache: _SizedCache) -> None:
+        """Test get and set methods."""
+        assert cache.get('a') is _MISSING
+        cache.set('a', 1, size=10)
+        assert cache.get('a') == 1
+
+        info = cache.info()
+        assert info.hits == 1
+        assert info.misses == 1
+        assert info.entries == 1
+        assert info.current_bytes == 10
+        assert info.max_bytes == 100
+
+    def test_set_over_budget(self, cache: _SizedCache) -> None:
+        """Test value larger than budget is not cached."""
+        cache.set('a', 1, size=101)
+        assert cache.get('a') is _MISSING
+        assert cache.info().current_bytes == 0
+
+    def test_set_existing_key(self, cache: _SizedCache) -> None:
+        """Test overwriting key updates size accounting."""
+        cache.set('a', 1, size=10)
+        cache.set('a', 2, size=30)
+        assert cache.get('a') == 2
+        assert cache.info().current_bytes == 30
+
+    def test_evict_large_before_small(self, cache: _SizedCache) -> None:
+        """Test large entries are evicted before small ones with the same cost."""
+        cache.set('small', 1, size=10)
+        cache.set('large', 2, size=80)
+        cache.set('medium', 3, size=20)
+
+        assert cache.get('large') is _MISSING
+        assert cache.get('small') == 1
+        assert cache.get('medium') == 3
+        assert cache.info().current_bytes == 30
+
+    def test_evict_rarely_hit_first(self, cache: _SizedCache) -> None:
+        """Test frequently hit entries survive eviction."""
+        cache.set('hot', 1, size=40)
+        cache.set('cold', 2, size=40)
+
+        for _ in range(5):
+            cache.get('hot')
+
+        cache.set('new', 3, size=40)
+
+        assert cache.get('hot') == 1
+        assert cache.get('cold') is _MISSING
+        assert cache.get('new') == 3
+
+    def test_evict_cheap_first(self, cache: _SizedCache) -> None:
+        """Test expensive to fetch entries survive eviction."""
+        cache.set('expensive', 1, size=40, cost=10.0)
+        cache.set('cheap', 2, size=40, cost=0.1)
+        cache.set('new', 3, size=40, cost=1.0)
+
+        assert cache.get('expensive') == 1
+        assert cache.get('cheap') is _MISSING
+
+    def test_heap_rebuild(self, cache: _SizedCache) -> None:
+        """Test stale heap items do not grow unbounded."""
+        cache.set('a', 1, size=10)
+
+        for _ in range(1000):
+            cache.get('a')
+
+        assert len(cache._heap) <= 2 * len(cache._entries) + 65
+
+    def test_resize(self, cache: _SizedCache) -> None:
+        """Test resize method evicts over the new budget."""
+        cache.set('a', 1, size=40)
+        cache.set('b', 2, size=40)
+        cache.resize(50)
+
+        info = cache.info()
+        assert info.entries == 1
+        assert info.current_bytes == 40
+        assert info.max_bytes == 50
+
+    def test_clear(self, cache: _SizedCache) -> None:
+        """Test clear method."""
+        cache.set('a', 1, size=40)
+        cache.get('a')
+        cache.clear()
+        assert cache.info() == (0, 0, 0, 0, 100)
+
+
+class TestUnitSizedCacheDecorators:
+    """Unit tests for yafin.cache caching decorators."""
+
+    def test_sized_cache(self, global_cache: None) -> None:
+        """Test _sized_cache decorator records payload size."""
+        calls = []
+
+        @_sized_cache
+        def func(x: int) -> dict[str, Any]:
+            calls.append(x)
+            _record_payload_size(30)
+            return {'x': x}
+
+        assert func(1) == func(1) == {'x': 1}
+        assert calls == [1]
+
+        info = get_cache_info()
+        assert info.hits == 1
+        assert info.current_bytes == 30
+
+    def test_sized_cache_err(self, global_cache: None) -> None:
+        """Test _sized_cache decorator does not cache errors."""
+
+        @_sized_cache
+        def func() -> None:
+            raise ValueError
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                func()
+
+        assert get_cache_info().entries == 0
+
+    @pytest.mark.asyncio
+    async def test_async_sized_cache(self, global_cache: None) -> None:
+        """Test _async_sized_cache decorator shares in-flight requests."""
+        calls = []
+
+        @_async_sized_cache
+        async def func(x: int) -> dict[str, Any]:
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            _record_payload_size(30)
+            return {'x': x}
+
+        results = await asyncio.gather(func(1), func(1), func(1))
+        assert list(results) == [{'x': 1}] * 3
+        assert await func(1) == {'x': 1}
+        assert calls == [1]
+        assert get_cache_info().current_bytes == 30
+
+    @pytest.mark.asyncio
+    async def test_async_sized_cache_err(self, global_cache: None) -> None:
+        """Test _async_sized_cache decorator propagates errors to all waiters."""
+
+        @_async_sized_cache
+        async def func() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        results = await asyncio.gather(func(), func(), return_exceptions=True)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert get_cache_info().entries == 0
+
+    @pytest.mark.asyncio
+    async def test_no_cache(self, global_cache: None) -> None:
+        """Test no_cache context bypasses the cache of both decorators."""
+        calls = []
+
+        @_sized_cache
+        def func(x: int) -> int:
+            calls.append(x)
+            return x
+
+        @_async_sized_cache
+        async def async_func(x: int) -> int:
+            calls.append(x)
+            return x
+
+        with no_cache():
+            assert func(1) == func(1) == 1
+            assert await async_func(2) == await async_func(2) == 2
+
+        assert calls == [1, 1, 2, 2]
+        assert get_cache_info().entries == 0
+
+        assert func(1) == func(1) == 1
+        assert calls == [1, 1, 2, 2, 1]
@@ -1,9 +1,10 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Any, AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
-from curl_cffi.requests.exceptions import HTTPError
+from curl_cffi.requests.exceptions import ConnectionError, HTTPError
 from pytest_mock import MockerFixture
 
 from tests._assertions import (
@@ -24,12 +25,24 @@ from tests._assertions import (
 )
 from tests._utils import _get_json_fixture, _mock_response
 from yafin import AsyncClient, Client
-from yafin.client import _SingletonAsyncClientManager, _SingletonClientManager
+from yafin.client import (
+    _CircuitBreaker,
+    _LatencyTracker,
+    _single_attempt,
+    _SingletonAsyncClientManager,
+    _SingletonClientManager,
+)
 from yafin.const import (
     ANNUAL_INCOME_STATEMENT_TYPES,
     CALENDAR_EVENT_MODULES,
     QUOTE_SUMMARY_MODULES,
 )
+from yafin.deadline import deadline
+from yafin.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    RetriesExhaustedError,
+)
 
 
 @pytest.fixture
@@ -228,6 +241,36 @@ class TestUnitClient:
         response = client._get_request(client._CHART_URL.format(ticker=ticker), params)
         assert response
 
+    def test_get_request_deadline_timeout(self, mocker: MockerFixture) -> None:
+        """Test _get_request method caps request timeout by remaining deadline."""
+        get_mock = _mock_response(mocker, patched_method='yafin.client.Session.get')
+
+        with Client(timeout=5.0, deadline=1.0) as client:
+            client._get_request(client._CHART_URL.format(ticker='META'))
+
+        assert get_mock.call_args.kwargs['timeout'] <= 1.0
+
+    @pytest.mark.parametrize('client_deadline', [1.0, None])
+    def test_get_request_deadline_exceeded(
+        self, mocker: MockerFixture, client_deadline: float | None
+    ) -> None:
+        """Test _get_request method does not sleep beyond client or call deadline."""
+        get_mock = _mock_response(
+            mocker, patched_method='yafin.client.Session.get', status_code=500
+        )
+        get_mock.return_value.raise_for_status.side_effect = HTTPError('500')
+        sleep_mock = mocker.patch('yafin.client.sleep')
+
+        with (
+            Client(deadline=client_deadline) as client,
+            deadline(1.0),
+            pytest.raises(DeadlineExceededError),
+        ):
+            client._get_request(client._CHART_URL.format(ticker='META'))
+
+        get_mock.assert_called_once()
+        sleep_mock.assert_not_called()
+
     def test_get_request_http_err(
         self,
         client: Client,
@@ -264,6 +307,32 @@ class TestUnitClient:
         with pytest.raises(HTTPError):
             client._get_request(client._CHART_URL.format(ticker='xxxxxxxx'), params)
 
+    def test_get_request_retries_exhausted(self, mocker: MockerFixture) -> None:
+        """Test _get_request method gives up after max retries, without last sleep."""
+        get_mock = mocker.patch(
+            'yafin.client.Session.get', side_effect=ConnectionError('refused')
+        )
+        sleep_mock = mocker.patch('yafin.client.sleep')
+
+        with Client(max_retries=3) as client:
+            with pytest.raises(RetriesExhaustedError) as exc_info:
+                client._get_request(client._CHART_URL.format(ticker='META'))
+
+            assert exc_info.value.attempts == 3
+            assert isinstance(exc_info.value.__cause__, ConnectionError)
+            assert get_mock.call_count == 3
+            assert sleep_mock.call_count == 2
+
+            get_mock.reset_mock()
+            sleep_mock.reset_mock()
+
+            with _single_attempt(), pytest.raises(RetriesExhaustedError) as exc_info:
+                client._get_request(client._CHART_URL.format(ticker='META'))
+
+            assert exc_info.value.attempts == 1
+            get_mock.assert_called_once()
+            sleep_mock.assert_not_called()
+
     def test_get_crumb(self, client: Client, mocker: MockerFixture) -> None:
         """Test _get_crumb method."""
         _mock_response(
@@ -316,6 +385,25 @@ class TestUnitClient:
         with pytest.raises(err_cls):
             client.get_chart(**kwargs)
 
+    def test_get_chart_canonical_args(
+        self, client: Client, mocker: MockerFixture, chart_json_mock: dict[str, Any]
+    ) -> None:
+        """Test get_chart method hits cache for equal requests in any call style."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[chart_json_mock],
+        )
+        client.get_chart('META', '1d', '1y', events='split,div')
+        client.get_chart(
+            ticker=' meta ', interval='1d', period_range='1y', events=' div , split '
+        )
+
+        get_mock = client._session.get
+        get_mock.assert_called_once()
+        assert get_mock.call_args.kwargs['params']['events'] == 'div,split'
+        assert get_mock.call_args.kwargs['url'].endswith('/chart/META')
+
     def test_get_quote(
         self,
         client: Client,
@@ -440,6 +528,20 @@ class TestUnitClient:
         search = client.get_search(tickers)
         _assert_search_result(search)
 
+    def test_get_search_query(self, client: Client, mocker: MockerFixture) -> None:
+        """Test get_search method only strips free-text query."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[{'quotes': []}],
+        )
+        client.get_search(' Meta Platforms, Inc ')
+        client.get_search(tickers='Meta Platforms, Inc')
+
+        get_mock = client._session.get
+        get_mock.assert_called_once()
+        assert get_mock.call_args.kwargs['params']['q'] == 'Meta Platforms, Inc'
+
     def test_get_recommendations(
         self,
         client: Client,
@@ -613,6 +715,42 @@ class TestUnitAsyncClient:
         response = await async_client._get_request(url, params)
         assert response
 
+    @pytest.mark.asyncio
+    async def test_get_request_deadline_timeout(self, mocker: MockerFixture) -> None:
+        """Test _get_request method caps request timeout by remaining deadline."""
+        get_mock = _mock_response(
+            mocker, patched_method='yafin.client.AsyncSession.get', async_mock=True
+        )
+
+        async with AsyncClient(timeout=5.0, deadline=1.0) as async_client:
+            await async_client._get_request(
+                async_client._CHART_URL.format(ticker='META')
+            )
+
+        assert get_mock.call_args.kwargs['timeout'] <= 1.0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('client_deadline', [1.0, None])
+    async def test_get_request_deadline_exceeded(
+        self, mocker: MockerFixture, client_deadline: float | None
+    ) -> None:
+        """Test _get_request method does not sleep beyond client or call deadline."""
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            status_code=500,
+            async_mock=True,
+        )
+        get_mock.return_value.raise_for_status.side_effect = HTTPError('500')
+
+        async with AsyncClient(deadline=client_deadline) as async_client:
+            with deadline(1.0), pytest.raises(DeadlineExceededError):
+                await async_client._get_request(
+                    async_client._CHART_URL.format(ticker='META')
+                )
+
+        get_mock.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_request_http_err(
         self, async_client: AsyncClient, mocker: MockerFixture
@@ -709,6 +847,30 @@ class TestUnitAsyncClient:
         with pytest.raises(err_cls):
             await async_client.get_chart(**kwargs)
 
+    @pytest.mark.asyncio
+    async def test_get_chart_canonical_args(
+        self,
+        async_client: AsyncClient,
+        mocker: MockerFixture,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test get_chart method hits cache for equal requests in any call style."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        await async_client.get_chart('META', '1d', '1y', events='split,div')
+        await async_client.get_chart(
+            ticker=' meta ', interval='1d', period_range='1y', events=' div , split '
+        )
+
+        get_mock = async_client._session.get
+        get_mock.assert_called_once()
+        assert get_mock.call_args.kwargs['params']['events'] == 'div,split'
+        assert get_mock.call_args.kwargs['url'].endswith('/chart/META')
+
     @pytest.mark.asyncio
     async def test_get_quote(
         self,
@@ -985,6 +1147,291 @@ class TestUnitAsyncClient:
         with pytest.raises(ValueError):
             await async_client.get_calendar_events(modules='xxx')
 
+    @pytest.fixture
+    def chart_url(self) -> str:
+        """Chart url of META."""
+        return 'https://query2.finance.yahoo.com/v8/finance/chart/META'
+
+    def _mock_slow_first_get(
+        self, mocker: MockerFixture, delay: float, fail_second: bool = False
+    ) -> dict[str, Any]:
+        """Mock session get, first call is slow, following are fast."""
+        calls: dict[str, Any] = {'count': 0, 'cancelled': False}
+        response = mocker.Mock()
+        response.status_code = 200
+
+        async def get(**kwargs: Any) -> Any:
+            calls['count'] += 1
+
+            if calls['count'] == 1:
+                try:
+                    await asyncio.sleep(delay)
+
+                except asyncio.CancelledError:
+                    calls['cancelled'] = True
+                    raise
+
+                return response
+
+            if fail_second:
+                raise HTTPError('hedge failed')
+
+            return response
+
+        mocker.patch(
+            'yafin.client.AsyncSession.get', new=mocker.AsyncMock(side_effect=get)
+        )
+        calls['response'] = response
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_get_request_hedged(
+        self, mocker: MockerFixture, chart_url: str
+    ) -> None:
+        """Test slow request is hedged and the slow one is cancelled."""
+        calls = self._mock_slow_first_get(mocker, delay=1.0)
+
+        async with AsyncClient(hedge=True, hedge_max_ratio=1.0) as async_client:
+            for _ in range(20):
+                async_client._latency_tracker.add(AsyncClient._CHART_URL, latency=0.01)
+
+            response = await async_client._get_request(chart_url)
+
+        assert response is calls['response']
+        assert calls['count'] == 2
+        assert calls['cancelled']
+        assert async_client._hedged_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_request_hedge_failed(
+        self, mocker: MockerFixture, chart_url: str
+    ) -> None:
+        """Test failed hedge does not fail the slow, but successful request."""
+        calls = self._mock_slow_first_get(mocker, delay=0.05, fail_second=True)
+
+        async with AsyncClient(hedge=True, hedge_max_ratio=1.0) as async_client:
+            for _ in range(20):
+                async_client._latency_tracker.add(AsyncClient._CHART_URL, latency=0.01)
+
+            response = await async_client._get_request(chart_url)
+
+        assert response is calls['response']
+        assert calls['count'] == 2
+        assert not calls['cancelled']
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('warm', [True, False])
+    async def test_get_request_not_hedged(
+        self, mocker: MockerFixture, chart_url: str, warm: bool
+    ) -> None:
+        """Test no hedging over max ratio or before enough latency samples."""
+        calls = self._mock_slow_first_get(mocker, delay=0.05)
+        max_ratio = 0.0 if warm else 1.0
+
+        async with AsyncClient(hedge=True, hedge_max_ratio=max_ratio) as async_client:
+            for _ in range(20 if warm else 5):
+                async_client._latency_tracker.add(AsyncClient._CHART_URL, latency=0.01)
+
+            response = await async_client._get_request(chart_url)
+
+        assert response is calls['response']
+        assert calls['count'] == 1
+        assert async_client._hedged_count == 0
+
+
+class TestUnitLatencyTracker:
+    """Unit tests for yafin.client._LatencyTracker."""
+
+    def test_get_threshold(self) -> None:
+        """Test threshold is latency quantile of endpoint after enough samples."""
+        latency_tracker = _LatencyTracker(quantile=0.9, min_samples=10)
+
+        for latency in range(1, 10):
+            latency_tracker.add('a', latency)
+
+        assert latency_tracker.get_threshold('a') is None
+        assert latency_tracker.get_threshold('b') is None
+
+        latency_tracker.add('a', 10)
+        assert latency_tracker.get_threshold('a') == 10
+
+        latency_tracker.add('a', 0)
+        assert latency_tracker.get_threshold('a') == 9
+
+    def test_get_endpoint(self) -> None:
+        """Test formatted urls are mapped to their url templates."""
+        assert Client._get_endpoint(f'{Client._BASE_URL}/v8/finance/chart/META') == (
+            Client._CHART_URL
+        )
+        assert Client._get_endpoint(Client._QUOTE_URL) == Client._QUOTE_URL
+
+
+class TestUnitCircuitBreaker:
+    """Unit tests for yafin.client._CircuitBreaker."""
+
+    def test_open(self, mocker: MockerFixture) -> None:
+        """Test circuit opens after consecutive failures and fails fast."""
+        mocker.patch('yafin.client.monotonic', return_value=100.0)
+        circuit_breaker = _CircuitBreaker(failure_threshold=2, recovery_time=10.0)
+
+        circuit_breaker.record_failure('a')
+        circuit_breaker.record_success('a')
+        circuit_breaker.record_failure('a')
+        circuit_breaker.check('a')
+        assert circuit_breaker.get_state('a') == 'closed'
+
+        circuit_breaker.record_failure('a')
+        assert circuit_breaker.get_state('a') == 'open'
+        assert circuit_breaker.get_state('b') == 'closed'
+
+        with pytest.raises(CircuitOpenError):
+            circuit_breaker.check('a')
+
+        circuit_breaker.check('b')
+
+    @pytest.mark.parametrize('probe_succeeded', [True, False])
+    def test_half_open(self, mocker: MockerFixture, probe_succeeded: bool) -> None:
+        """Test single probe is let through after recovery time."""
+        monotonic_mock = mocker.patch('yafin.client.monotonic', return_value=100.0)
+        circuit_breaker = _CircuitBreaker(failure_threshold=1, recovery_time=10.0)
+        circuit_breaker.record_failure('a')
+
+        monotonic_mock.return_value = 110.0
+        circuit_breaker.check('a')
+        assert circuit_breaker.get_state('a') == 'half-open'
+
+        # other requests fail fast while probe is in flight
+        with pytest.raises(CircuitOpenError):
+            circuit_breaker.check('a')
+
+        if probe_succeeded:
+            circuit_breaker.record_success('a')
+            assert circuit_breaker.get_state('a') == 'closed'
+            circuit_breaker.check('a')
+
+        else:
+            circuit_breaker.record_failure('a')
+            assert circuit_breaker.get_state('a') == 'open'
+
+            with pytest.raises(CircuitOpenError):
+                circuit_breaker.check('a')
+
+    def test_get_request_circuit_open(self, mocker: MockerFixture) -> None:
+        """Test _get_request fails fast on endpoint with open circuit."""
+        get_mock = _mock_response(
+            mocker, patched_method='yafin.client.Session.get', status_code=500
+        )
+        get_mock.return_value.raise_for_status.side_effect = HTTPError('500')
+        sleep_mock = mocker.patch('yafin.client.sleep')
+
+        with Client(circuit_failure_threshold=2) as client:
+            with pytest.raises(CircuitOpenError):
+                client._get_request(client._CHART_URL.format(ticker='META'))
+
+            with pytest.raises(CircuitOpenError):
+                client._get_request(client._CHART_URL.format(ticker='AAPL'))
+
+            assert get_mock.call_count == 2
+            assert sleep_mock.call_count == 2
+            assert client._circuit_breaker is not None
+            assert client._circuit_breaker.get_state(client._CHART_URL) == 'open'
+            assert client._circuit_breaker.get_state(client._QUOTE_URL) == 'closed'
+
+    def test_get_request_circuit_connection_err(self, mocker: MockerFixture) -> None:
+        """Test connection errors are retried and open circuit."""
+        get_mock = mocker.patch(
+            'yafin.client.Session.get', side_effect=ConnectionError('refused')
+        )
+        sleep_mock = mocker.patch('yafin.client.sleep')
+
+        with Client(circuit_failure_threshold=2) as client:
+            with pytest.raises(CircuitOpenError):
+                client._get_request(client._CHART_URL.format(ticker='META'))
+
+            assert get_mock.call_count == 2
+            assert sleep_mock.call_count == 2
+            assert client._circuit_breaker is not None
+            assert client._circuit_breaker.get_state(client._CHART_URL) == 'open'
+
+    def test_get_request_connection_err(self, mocker: MockerFixture) -> None:
+        """Test connection error is retried without circuit breaker by default."""
+        response_mock = mocker.Mock(status_code=200)
+        get_mock = mocker.patch(
+            'yafin.client.Session.get',
+            side_effect=[ConnectionError('refused'), response_mock],
+        )
+        mocker.patch('yafin.client.sleep')
+
+        with Client() as client:
+            assert client._circuit_breaker is None
+            assert (
+                client._get_request(client._CHART_URL.format(ticker='META'))
+                is response_mock
+            )
+
+        assert get_mock.call_count == 2
+
+    def test_get_request_circuit_client_err(self, mocker: MockerFixture) -> None:
+        """Test client errors (e.g. unknown ticker) do not open circuit."""
+        get_mock = _mock_response(
+            mocker, patched_method='yafin.client.Session.get', status_code=404
+        )
+
+        with Client(circuit_failure_threshold=1) as client:
+            for _ in range(2):
+                with pytest.raises(HTTPError):
+                    client._get_request(client._CHART_URL.format(ticker='XXX'))
+
+        assert get_mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_get_request_circuit_open(self, mocker: MockerFixture) -> None:
+        """Test AsyncClient _get_request fails fast on endpoint with open circuit."""
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            status_code=500,
+            async_mock=True,
+        )
+        get_mock.return_value.raise_for_status.side_effect = HTTPError('500')
+
+        async with AsyncClient(circuit_failure_threshold=1) as async_client:
+            url = async_client._CHART_URL.format(ticker='META')
+
+            with deadline(1.0), pytest.raises(DeadlineExceededError):
+                await async_client._get_request(url)
+
+            with pytest.raises(CircuitOpenError):
+                await async_client._get_request(url)
+
+        get_mock.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_async_get_request_circuit_connection_err(
+        self, mocker: MockerFixture
+    ) -> None:
+        """Test AsyncClient connection errors open circuit."""
+        get_mock = mocker.patch(
+            'yafin.client.AsyncSession.get',
+            new=mocker.AsyncMock(side_effect=ConnectionError('refused')),
+        )
+
+        async with AsyncClient(circuit_failure_threshold=1) as async_client:
+            url = async_client._CHART_URL.format(ticker='META')
+
+            with deadline(1.0), pytest.raises(DeadlineExceededError):
+                await async_client._get_request(url)
+
+            with pytest.raises(CircuitOpenError):
+                await async_client._get_request(url)
+
+        get_mock.assert_called_once()
+
+    def test_disabled(self) -> None:
+        """Test circuit breaker is disabled with None failure threshold."""
+        with Client(circuit_failure_threshold=None) as client:
+            assert client._circuit_breaker is None
+
 
 class TestUnitClientManager:
     """Unit tests for yafin._ClientManager module."""
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from yafin.deadline import _check_remaining, _get_remaining, deadline
+from yafin.exceptions import DeadlineExceededError
+
+
+class TestUnitDeadline:
+    """Unit tests for yafin.deadline module."""
+
+    def test_deadline(self) -> None:
+        """Test deadline sets remaining budget only within the block."""
+        assert _get_remaining() is None
+
+        with deadline(10.0):
+            remaining = _get_remaining()
+            assert remaining is not None
+            assert 0 < remaining <= 10.0
+
+        assert _get_remaining() is None
+
+    def test_deadline_none(self) -> None:
+        """Test None deadline keeps the outer budget."""
+        with deadline(None):
+            assert _get_remaining() is None
+
+        with deadline(10.0), deadline(None):
+            assert _get_remaining() is not None
+
+    @pytest.mark.parametrize(
+        'outer, inner, expected',
+        [(1.0, 10.0, 1.0), (10.0, 1.0, 1.0)],
+    )
+    def test_deadline_nested(self, outer: float, inner: float, expected: float) -> None:
+        """Test nested deadline can only shorten the budget."""
+        with deadline(outer), deadline(inner):
+            remaining = _get_remaining()
+            assert remaining is not None
+            assert expected - 0.5 < remaining <= expected
+
+    def test_check_remaining(self) -> None:
+        """Test _check_remaining raises once the budget is spent."""
+        assert _check_remaining() is None
+
+        with deadline(0.0), pytest.raises(DeadlineExceededError):
+            _check_remaining()
+
+    def test_deadline_exceeded_error(self) -> None:
+        """Test DeadlineExceededError is TimeoutError."""
+        assert issubclass(DeadlineExceededError, TimeoutError)
+
+    @pytest.mark.asyncio
+    async def test_deadline_tasks(self) -> None:
+        """Test deadline propagates into tasks created within the block."""
+
+        async def get_remaining() -> float | None:
+            return _get_remaining()
+
+        with deadline(10.0):
+            results = await asyncio.gather(get_remaining(), get_remaining())
+
+        assert all(r is not None and r <= 10.0 for r in results)
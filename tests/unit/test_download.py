@@ -0,0 +1,221 @@
+import io
+import json
+import pathlib
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture, _mock_response
+from yafin.__main__ import main as yafin_main
+from yafin.cache import clear_cache
+from yafin.download import (
+    MANIFEST_FILE_NAME,
+    _RateLimiter,
+    build_jobs,
+    download,
+    main,
+    read_tickers,
+)
+
+
+@pytest.fixture
+def chart_json_mock() -> dict[str, Any]:
+    """Chart response json mock with data for 1y, 1d."""
+    return _get_json_fixture(file_name='aapl_1d_1y.json', folder_name='chart')
+
+
+@pytest.fixture(autouse=True)
+def cleared_cache() -> Generator[None, None, None]:
+    """Cleared response cache, so each download hits the mocked session."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+class TestUnitDownload:
+    """Unit tests for yafin.download module."""
+
+    def test_read_tickers(self, tmp_path: pathlib.Path) -> None:
+        """Test read_tickers normalizes, deduplicates and skips comments."""
+        tickers_file = tmp_path.joinpath('tickers.txt')
+        tickers_file.write_text('# universe\naapl\n META , msft\n\nAAPL\n')
+
+        assert read_tickers(tickers_file) == ['AAPL', 'META', 'MSFT']
+
+    def test_build_jobs(self) -> None:
+        """Test build_jobs creates job for each ticker and spec combination."""
+        jobs = build_jobs(
+            ['AAPL', 'META'],
+            endpoints=('chart', 'cash_flow'),
+            intervals=('1d', '1wk'),
+            period_ranges=('1y',),
+        )
+
+        assert len(jobs) == 6
+        assert jobs[0].key == 'chart/1d/1y/AAPL'
+        assert jobs[0].kwargs == {'interval': '1d', 'period_range': '1y'}
+        assert jobs[2].key == 'cash_flow/annual/AAPL'
+        assert jobs[2].kwargs == {'frequency': 'annual'}
+
+    @pytest.mark.parametrize(
+        'kwargs',
+        [
+            {'endpoints': ('xxx',)},
+            {'intervals': ('xxx',)},
+            {'period_ranges': ('xxx',)},
+            {'endpoints': ('cash_flow',), 'frequency': 'xxx'},
+        ],
+    )
+    def test_build_jobs_invalid(self, kwargs: dict[str, Any]) -> None:
+        """Test build_jobs raises on invalid spec before any request is made."""
+        with pytest.raises(ValueError):
+            build_jobs(['AAPL'], **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_download(
+        self,
+        mocker: MockerFixture,
+        tmp_path: pathlib.Path,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test download writes partitioned files and manifest, then resumes."""
+        _mock_response(
+            mocker,
+            'yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        jobs = build_jobs(['AAPL', 'META'], endpoints=('chart',))
+        progress_stream = io.StringIO()
+
+        stats = await download(jobs, tmp_path, progress_stream=progress_stream)
+
+        assert stats.total == stats.succeeded == 2
+        assert stats.skipped == stats.failed == 0
+        assert '2/2 jobs, 0 failed' in progress_stream.getvalue()
+        chart_path = tmp_path.joinpath('chart', '1d', '1y', 'AAPL.json')
+        chart_result = chart_json_mock['chart']['result'][0]
+        assert json.loads(chart_path.read_text()) == chart_result
+        manifest_lines = tmp_path.joinpath(MANIFEST_FILE_NAME).read_text()
+        assert len(manifest_lines.splitlines()) == 2
+
+        clear_cache()
+        stats = await download(jobs, tmp_path)
+
+        assert (stats.skipped, stats.succeeded) == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_download_malformed_manifest(
+        self,
+        mocker: MockerFixture,
+        tmp_path: pathlib.Path,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test half-written manifest line of interrupted run is dropped."""
+        _mock_response(
+            mocker,
+            'yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        jobs = build_jobs(['AAPL', 'META'], endpoints=('chart',))
+        manifest_path = tmp_path.joinpath(MANIFEST_FILE_NAME)
+        manifest_path.write_text(
+            json.dumps({'key': jobs[0].key}) + '\n' + '{"key": "chart/1d'
+        )
+
+        stats = await download(jobs, tmp_path)
+
+        assert (stats.skipped, stats.succeeded, stats.failed) == (1, 1, 0)
+        assert [
+            json.loads(line)['key'] for line in manifest_path.read_text().splitlines()
+        ] == [job.key for job in jobs]
+
+    @pytest.mark.asyncio
+    async def test_download_failed_jobs_resumed(
+        self,
+        mocker: MockerFixture,
+        tmp_path: pathlib.Path,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test failed jobs are not in manifest and are retried in the next run."""
+        _mock_response(
+            mocker, 'yafin.client.AsyncSession.get', status_code=404, async_mock=True
+        )
+        jobs = build_jobs(['AAPL'], endpoints=('chart',))
+
+        stats = await download(jobs, tmp_path)
+
+        assert (stats.succeeded, stats.failed) == (0, 1)
+        assert not tmp_path.joinpath('chart', '1d', '1y', 'AAPL.json').exists()
+
+        _mock_response(
+            mocker,
+            'yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        stats = await download(jobs, tmp_path)
+
+        assert (stats.skipped, stats.succeeded, stats.failed) == (0, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter(self, mocker: MockerFixture) -> None:
+        """Test rate limiter spaces out job starts."""
+        sleep_mock = mocker.patch(
+            'yafin.download.asyncio.sleep', new=mocker.AsyncMock()
+        )
+        rate_limiter = _RateLimiter(rate=10)
+
+        await rate_limiter.acquire()
+        await rate_limiter.acquire()
+
+        sleep_mock.assert_awaited_once()
+        assert 0 < sleep_mock.await_args.args[0] <= 0.1
+
+    def test_main(
+        self,
+        mocker: MockerFixture,
+        tmp_path: pathlib.Path,
+        chart_json_mock: dict[str, Any],
+    ) -> None:
+        """Test command line interface via python -m yafin download."""
+        _mock_response(
+            mocker,
+            'yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        tickers_file = tmp_path.joinpath('tickers.txt')
+        tickers_file.write_text('AAPL\n')
+        output_dir = tmp_path.joinpath('out')
+
+        exit_code = yafin_main(
+            [
+                'download',
+                str(tickers_file),
+                str(output_dir),
+                '--endpoints',
+                'chart',
+                '--concurrency',
+                '2',
+            ]
+        )
+
+        assert exit_code == 0
+        assert output_dir.joinpath('chart', '1d', '1y', 'AAPL.json').exists()
+
+    @pytest.mark.parametrize(
+        'spec_args', [['--intervals', 'xxx'], ['--frequency', 'trailing']]
+    )
+    def test_main_invalid_spec(
+        self, tmp_path: pathlib.Path, spec_args: list[str]
+    ) -> None:
+        """Test command line interface exits on invalid spec."""
+        tickers_file = tmp_path.joinpath('tickers.txt')
+        tickers_file.write_text('AAPL\n')
+
+        with pytest.raises(SystemExit):
+            main([str(tickers_file), str(tmp_path), *spec_args])
@@ -0,0 +1,136 @@
+import multiprocessing
+from collections.abc import Generator
+from typing import Any
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture, _mock_response
+from yafin.cache import clear_cache
+from yafin.executor import (
+    ChartColumns,
+    ShardedExecutor,
+    _SharedRateLimiter,
+    chart_columns,
+)
+
+
+@pytest.fixture
+def chart_json_mock() -> dict[str, Any]:
+    """Chart response json mock with data for 1y, 1d."""
+    return _get_json_fixture(file_name='aapl_1d_1y.json', folder_name='chart')
+
+
+@pytest.fixture(autouse=True)
+def cleared_cache() -> Generator[None, None, None]:
+    """Cleared response cache, so each worker hits the mocked session."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
+class TestUnitShardedExecutor:
+    """Unit tests for yafin.executor.ShardedExecutor."""
+
+    def test_map(self, mocker: MockerFixture, chart_json_mock: dict[str, Any]) -> None:
+        """Test map streams result of each ticker from forked workers."""
+        _mock_response(
+            mocker,
+            'yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        # fork, so the mocked session is inherited by worker processes
+        executor = ShardedExecutor(processes=2, mp_context='fork')
+
+        results = list(
+            executor.map('get_chart', 'aapl,META, msft,AAPL,', interval='1d')
+        )
+
+        assert sorted(r.ticker for r in results) == ['AAPL', 'META', 'MSFT']
+        assert all(r.error is None for r in results)
+        assert all(r.result == chart_json_mock['chart']['result'][0] for r in results)
+
+    def test_map_reducer(
+        self, mocker: MockerFixture, chart_json_mock: dict[str, Any]
+    ) -> None:
+        """Test map streams results reduced in workers into numpy columns."""
+        _mock_response(
+            mocker,
+            'yafin.client.AsyncSession.get',
+            response_jsons=[chart_json_mock],
+            async_mock=True,
+        )
+        chart = chart_json_mock['chart']['result'][0]
+        executor = ShardedExecutor(processes=2, mp_context='fork')
+
+        results = list(
+            executor.map('get_chart', 'AAPL,META', reducer=chart_columns, interval='1d')
+        )
+
+        assert len(results) == 2
+
+        for r in results:
+            assert isinstance(r.result, ChartColumns)
+            assert r.result.meta == chart['meta']
+            assert r.result.timestamp.dtype == np.int64
+            assert r.result.timestamp.tolist() == chart['timestamp']
+            np.testing.assert_array_equal(
+                r.result.close,
+                np.array(chart['indicators']['quote'][0]['close'], dtype=np.float64),
+            )
+
+    def test_map_error(self, mocker: MockerFixture) -> None:
+        """Test failed tickers are streamed back with error message."""
+        _mock_response(
+            mocker, 'yafin.client.AsyncSession.get', status_code=404, async_mock=True
+        )
+        executor = ShardedExecutor(processes=2, mp_context='fork')
+
+        results = list(executor.map('get_chart', ['AAPL', ' '], interval='1d'))
+
+        assert len(results) == 1
+        assert results[0].result is None
+        assert results[0].error is not None
+        assert '404' in results[0].error
+
+    def test_map_invalid_method(self) -> None:
+        """Test map raises on method, that is not AsyncSymbol get method."""
+        executor = ShardedExecutor(processes=1)
+
+        # raised on call, before any worker is started
+        with pytest.raises(ValueError):
+            executor.map('close', ['AAPL'])
+
+
+class TestUnitSharedRateLimiter:
+    """Unit tests for yafin.executor._SharedRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_acquire(self, mocker: MockerFixture) -> None:
+        """Test limiters sharing next start time space out requests together."""
+        sleep_mock = mocker.patch(
+            'yafin.executor.asyncio.sleep', new=mocker.AsyncMock()
+        )
+        next_start = multiprocessing.Value('d', 0.0)
+        rate_limiters = [_SharedRateLimiter(next_start, rate=10) for _ in range(2)]
+
+        await rate_limiters[0].acquire()
+        await rate_limiters[1].acquire()
+
+        sleep_mock.assert_awaited_once()
+        assert 0 < sleep_mock.await_args.args[0] <= 0.1
+
+    @pytest.mark.asyncio
+    async def test_acquire_no_limit(self, mocker: MockerFixture) -> None:
+        """Test limiter without rate never waits."""
+        sleep_mock = mocker.patch(
+            'yafin.executor.asyncio.sleep', new=mocker.AsyncMock()
+        )
+        rate_limiter = _SharedRateLimiter(multiprocessing.Value('d', 0.0))
+
+        for _ in range(3):
+            await rate_limiter.acquire()
+
+        sleep_mock.assert_not_awaited()
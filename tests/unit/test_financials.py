@@ -0,0 +1,103 @@
+from typing import Any
+
+import pytest
+
+from tests._utils import _get_json_fixture
+from yafin.financials import Financials, pivot_financials
+from yafin.results import TickerResults
+
+
+def _get_results(file_name: str) -> list[dict[str, Any]]:
+    """Timeseries results of fixture."""
+    return _get_json_fixture(file_name, 'timeseries')['timeseries']['result']
+
+
+@pytest.fixture
+def income_statements() -> list[list[dict[str, Any]]]:
+    """Income statement results of META and AAPL."""
+    return [
+        _get_results('income_statement_meta.json'),
+        _get_results('income_statement_aapl.json'),
+    ]
+
+
+class TestUnitFinancials:
+    """Unit tests for yafin.financials module."""
+
+    def test_pivot_financials(
+        self, income_statements: list[list[dict[str, Any]]]
+    ) -> None:
+        """Test tidy table matches values of results."""
+        table = pivot_financials(income_statements)
+        columns = {len(column) for column in table}
+
+        assert len(columns) == 1
+        assert set(table.ticker) == {'META', 'AAPL'}
+        assert set(table.frequency) == {'annual'}
+        assert 'NetIncome' in table.type
+
+        expected = {
+            entry['asOfDate']: entry['reportedValue']['raw']
+            for series in income_statements[0]
+            if series['meta']['type'] == ['annualNetIncome']
+            for entry in series['annualNetIncome']
+            if entry is not None
+        }
+        assert {
+            as_of_date: value
+            for ticker, typ, as_of_date, value in zip(
+                table.ticker, table.type, table.as_of_date, table.value, strict=True
+            )
+            if ticker == 'META' and typ == 'NetIncome'
+        } == expected
+
+    def test_pivot_financials_ticker_results(
+        self, income_statements: list[list[dict[str, Any]]]
+    ) -> None:
+        """Test ticker keyed results and skipping of unknown types."""
+        results = TickerResults(
+            ['META', 'AAPL'],
+            [
+                ('META', income_statements[0] + _get_results('other_meta.json')),
+                ('AAPL', income_statements[1]),
+            ],
+        )
+
+        assert pivot_financials(results) == pivot_financials(income_statements)
+
+    def test_to_wide(self, income_statements: list[list[dict[str, Any]]]) -> None:
+        """Test wide view of single type."""
+        table = pivot_financials(income_statements)
+        wide = table.to_wide('NetIncome', periods=2)
+
+        assert wide.tickers == ['META', 'AAPL']
+        assert len(wide.as_of_dates) == 2
+        assert wide.as_of_dates == sorted(wide.as_of_dates)
+
+        for ticker, row in zip(wide.tickers, wide.values, strict=True):
+            for as_of_date, value in zip(wide.as_of_dates, row, strict=True):
+                assert value is None or value in [
+                    table.value[i]
+                    for i in range(len(table.value))
+                    if table.ticker[i] == ticker
+                    and table.type[i] == 'NetIncome'
+                    and table.as_of_date[i] == as_of_date
+                ]
+
+        assert table.to_wide('NetIncome', frequency='quarterly').tickers == []
+
+    def test_to_wide_multiple_frequencies(self) -> None:
+        """Test mixed frequencies without frequency raise ValueError."""
+        table = Financials(
+            ['META', 'META'],
+            ['NetIncome', 'NetIncome'],
+            ['annual', 'quarterly'],
+            ['2024-12-31', '2024-12-31'],
+            ['USD', 'USD'],
+            [1.0, 2.0],
+        )
+
+        assert table.to_wide('NetIncome', frequency='quarterly').values == [[2.0]]
+
+        with pytest.raises(ValueError):
+            table.to_wide('NetIncome')
@@ -0,0 +1,175 @@
+import asyncio
+import math
+from typing import Any
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture, _mock_response
+from yafin.fx import AsyncFxService, FxRates, FxService
+
+NOW = 1_000_000.0
+
+
+@pytest.fixture
+def fx_quote_json() -> dict[str, Any]:
+    """Quote response json of FX tickers."""
+    return {
+        'quoteResponse': {
+            'result': [
+                {'symbol': 'EUR=X', 'regularMarketPrice': 0.8},
+                {'symbol': 'GBP=X', 'regularMarketPrice': 0.5},
+                {'symbol': 'JPY=X', 'regularMarketPrice': 150.0},
+            ],
+            'error': None,
+        }
+    }
+
+
+@pytest.fixture
+def fx_rates() -> FxRates:
+    """Rates of EUR, GBP and JPY, CHF without USD rate."""
+    return FxRates({'EUR': 0.8, 'GBP': 0.5, 'JPY': 150.0, 'CHF': None}, NOW)
+
+
+class TestUnitFxRates:
+    """Unit tests for yafin.fx.FxRates."""
+
+    def test_rates(self, fx_rates: FxRates) -> None:
+        """Test cross rates are derived from USD rates."""
+        assert fx_rates.currencies == ['USD', 'EUR', 'GBP', 'JPY', 'CHF']
+        assert fx_rates.rates.shape == (5, 5)
+        assert 'EUR' in fx_rates
+        assert 'CZK' not in fx_rates
+        assert fx_rates.get_rate('USD', 'EUR') == pytest.approx(0.8)
+        assert fx_rates.get_rate('EUR') == pytest.approx(1.25)
+        assert fx_rates.get_rate('EUR', 'GBP') == pytest.approx(0.625)
+        assert fx_rates.get_rate('GBP', 'JPY') == pytest.approx(300.0)
+        assert fx_rates.get_rate('JPY', 'JPY') == pytest.approx(1.0)
+        # minor units
+        assert fx_rates.get_rate('GBp') == pytest.approx(0.02)
+        assert fx_rates.get_rate('USD', 'GBp') == pytest.approx(50.0)
+        assert math.isnan(fx_rates.get_rate('CHF'))
+        assert math.isnan(fx_rates.get_rate('CZK'))
+        assert math.isnan(fx_rates.get_rate('USD', 'CZK'))
+
+    def test_convert(self, fx_rates: FxRates) -> None:
+        """Test values in different currencies are converted at once."""
+        converted = fx_rates.convert(
+            [10.0, 8.0, 150.0, 500.0, 1.0, 1.0],
+            ['USD', 'EUR', 'JPY', 'GBp', 'CZK', None],
+        )
+
+        np.testing.assert_allclose(
+            converted, [10.0, 10.0, 1.0, 10.0, np.nan, np.nan], equal_nan=True
+        )
+        np.testing.assert_allclose(
+            fx_rates.convert([[1.0, 2.0], [3.0, 4.0]], ['USD', 'EUR'], 'EUR'),
+            [[0.8, 1.6], [3.0, 4.0]],
+        )
+
+    def test_convert_err(self, fx_rates: FxRates) -> None:
+        """Test values and currencies of different lengths raise ValueError."""
+        with pytest.raises(ValueError):
+            fx_rates.convert([1.0, 2.0], ['USD'])
+
+
+class TestUnitFxService:
+    """Unit tests for yafin.fx.FxService."""
+
+    def test_get_rates(
+        self, mocker: MockerFixture, fx_quote_json: dict[str, Any]
+    ) -> None:
+        """Test rates are refreshed in a single request after ttl expires."""
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[fx_quote_json],
+        )
+
+        with FxService('USD,EUR,GBp,JPY', ttl=60) as fx:
+            rates = fx.get_rates(NOW)
+
+            assert fx.get_rates(NOW + 59) is rates
+            assert fx.get_rates(NOW + 60) is not rates
+
+        quote_calls = [
+            call for call in get_mock.call_args_list if 'quote' in call.kwargs['url']
+        ]
+        assert len(quote_calls) == 2
+        assert quote_calls[0].kwargs['params']['symbols'] == 'EUR=X,GBP=X,JPY=X'
+        assert rates.currencies == ['USD', 'EUR', 'GBP', 'JPY']
+        assert rates.get_rate('EUR', 'GBP') == pytest.approx(0.625)
+
+    def test_get_rates_currencies(
+        self, mocker: MockerFixture, fx_quote_json: dict[str, Any]
+    ) -> None:
+        """Test currencies are taken from get_currencies if not given."""
+        currencies_json = _get_json_fixture('currencies.json')
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[currencies_json, fx_quote_json],
+        )
+
+        with FxService() as fx:
+            rates = fx.get_rates()
+            converted = fx.convert([8.0, 150.0], ['EUR', 'JPY'])
+
+        assert len(rates.currencies) == len(currencies_json['currencies']['result'])
+        assert rates.get_rate('JPY', 'EUR') == pytest.approx(0.8 / 150)
+        np.testing.assert_allclose(converted, [10.0, 1.0])
+
+    def test_ttl_err(self) -> None:
+        """Test negative ttl raises ValueError."""
+        with pytest.raises(ValueError):
+            FxService('EUR', ttl=-1)
+
+
+class TestUnitAsyncFxService:
+    """Unit tests for yafin.fx.AsyncFxService."""
+
+    @pytest.mark.asyncio
+    async def test_get_rates(
+        self, mocker: MockerFixture, fx_quote_json: dict[str, Any]
+    ) -> None:
+        """Test rates are shared within ttl and used for conversion."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[fx_quote_json],
+            async_mock=True,
+        )
+
+        async with AsyncFxService('EUR,GBP,JPY', ttl=60) as fx:
+            rates = await fx.get_rates()
+
+            assert await fx.get_rates() is rates
+            np.testing.assert_allclose(
+                await fx.convert([8.0, 0.5], ['EUR', 'GBP'], 'JPY'),
+                [1500.0, 150.0],
+            )
+
+        assert rates.get_rate('GBP', 'JPY') == pytest.approx(300.0)
+
+    @pytest.mark.asyncio
+    async def test_get_rates_single_flight(
+        self, mocker: MockerFixture, fx_quote_json: dict[str, Any]
+    ) -> None:
+        """Test concurrent callers of expired rates share a single refresh."""
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[fx_quote_json],
+            async_mock=True,
+        )
+
+        async with AsyncFxService('EUR,GBP,JPY', ttl=60) as fx:
+            results = await asyncio.gather(*(fx.get_rates(NOW) for _ in range(5)))
+
+        assert all(rates is results[0] for rates in results)
+        quote_calls = [
+            call for call in get_mock.call_args_list if 'quote' in call.kwargs['url']
+        ]
+        assert len(quote_calls) == 1
@@ -0,0 +1,224 @@
+import copy
+import itertools
+from typing import Any
+
+import numpy as np
+import pytest
+
+from tests._utils import _get_json_fixture
+from yafin import indicators
+
+GAPS = [3, 40, 41, 120]
+
+
+def _sma_reference(values: list[float], window: int) -> list[float]:
+    """Per row simple moving average."""
+    return [
+        sum(values[i - window + 1 : i + 1]) / window if i >= window - 1 else np.nan
+        for i in range(len(values))
+    ]
+
+
+def _ema_reference(values: list[float], alpha: float) -> list[float]:
+    """Per row exponential moving average, seeded by first value."""
+    result = [values[0]]
+
+    for value in values[1:]:
+        result.append((1 - alpha) * result[-1] + alpha * value)
+
+    return result
+
+
+def _wilder_reference(values: list[float], window: int, start: int) -> list[float]:
+    """Per row Wilder's smoothing, seeded by mean of window values ending at start."""
+    result = [np.nan] * start + [sum(values[start - window + 1 : start + 1]) / window]
+
+    for value in values[start + 1 :]:
+        result.append((result[-1] * (window - 1) + value) / window)
+
+    return result
+
+
+@pytest.fixture
+def chart(chart_json_mock: dict[str, Any]) -> dict[str, Any]:
+    """Chart result with data for 1y, 1d."""
+    return chart_json_mock['chart']['result'][0]
+
+
+@pytest.fixture
+def quote(chart: dict[str, Any]) -> dict[str, list[float]]:
+    """Chart OHLCV lists."""
+    return chart['indicators']['quote'][0]
+
+
+@pytest.fixture
+def chart_with_gaps(chart: dict[str, Any]) -> dict[str, Any]:
+    """Chart result with None gaps in OHLCV."""
+    chart_with_gaps = copy.deepcopy(chart)
+
+    for values in chart_with_gaps['indicators']['quote'][0].values():
+        for i in GAPS:
+            values[i] = None
+
+    return chart_with_gaps
+
+
+class TestUnitIndicators:
+    """Unit tests for yafin.indicators module."""
+
+    def test_sma(self, chart: dict[str, Any], quote: dict[str, list[float]]) -> None:
+        """Test sma function."""
+        result = indicators.sma(chart, window=20)
+        np.testing.assert_allclose(result, _sma_reference(quote['close'], 20))
+
+    def test_ema(self, chart: dict[str, Any], quote: dict[str, list[float]]) -> None:
+        """Test ema function."""
+        result = indicators.ema(chart, window=20)
+        np.testing.assert_allclose(result, _ema_reference(quote['close'], 2 / 21))
+
+    @pytest.mark.parametrize('window', [1, 2, 200])
+    def test_ema_window(
+        self, chart: dict[str, Any], quote: dict[str, list[float]], window: int
+    ) -> None:
+        """Test ema function is precise over blocks for short and long windows."""
+        result = indicators.ema(chart, window=window, field='volume')
+        expected = _ema_reference(quote['volume'], 2 / (window + 1))
+        np.testing.assert_allclose(result, expected, rtol=1e-9)
+
+    def test_rsi(self, chart: dict[str, Any], quote: dict[str, list[float]]) -> None:
+        """Test rsi function."""
+        close = quote['close']
+        deltas = [np.nan] + [b - a for a, b in itertools.pairwise(close)]
+        avg_gain = _wilder_reference([max(d, 0) for d in deltas], 14, 14)
+        avg_loss = _wilder_reference([max(-d, 0) for d in deltas], 14, 14)
+        expected = [100 * g / (g + loss) for g, loss in zip(avg_gain, avg_loss)]
+
+        result = indicators.rsi(chart, window=14)
+        np.testing.assert_allclose(result, expected)
+        assert np.nanmin(result) >= 0
+        assert np.nanmax(result) <= 100
+
+    def test_atr(self, chart: dict[str, Any], quote: dict[str, list[float]]) -> None:
+        """Test atr function."""
+        high, low, close = quote['high'], quote['low'], quote['close']
+        true_range = [high[0] - low[0]] + [
+            max(h - lo, abs(h - c), abs(lo - c))
+            for h, lo, c in zip(high[1:], low[1:], close, strict=False)
+        ]
+
+        result = indicators.atr(chart, window=14)
+        np.testing.assert_allclose(result, _wilder_reference(true_range, 14, 13))
+
+    def test_bollinger_bands(
+        self, chart: dict[str, Any], quote: dict[str, list[float]]
+    ) -> None:
+        """Test bollinger_bands function."""
+        bands = indicators.bollinger_bands(chart, window=20, num_std=2.0)
+        std = [
+            np.std(quote['close'][i - 19 : i + 1]) if i >= 19 else np.nan
+            for i in range(len(quote['close']))
+        ]
+
+        np.testing.assert_allclose(bands.middle, _sma_reference(quote['close'], 20))
+        np.testing.assert_allclose(bands.upper, bands.middle + 2 * np.array(std))
+        np.testing.assert_allclose(bands.lower, bands.middle - 2 * np.array(std))
+
+    def test_vwap(self, chart: dict[str, Any], quote: dict[str, list[float]]) -> None:
+        """Test vwap function accumulates over whole daily chart."""
+        typical = [
+            (h + lo + c) / 3
+            for h, lo, c in zip(quote['high'], quote['low'], quote['close'])
+        ]
+        price_volume = np.cumsum(np.array(typical) * quote['volume'])
+
+        result = indicators.vwap(chart)
+        np.testing.assert_allclose(result, price_volume / np.cumsum(quote['volume']))
+
+    def test_vwap_reset_daily(self) -> None:
+        """Test vwap function restarts accumulation at each exchange day."""
+        day = 86400
+        chart = {
+            'meta': {'gmtoffset': -18000, 'dataGranularity': '1h'},
+            # 2 bars per exchange day, the 2nd day starts at 5:00 UTC
+            'timestamp': [day + 3600 * 14, day + 3600 * 15, 2 * day + 3600 * 14],
+            'indicators': {
+                'quote': [
+                    {
+                        'high': [1.0, 3.0, 5.0],
+                        'low': [1.0, 3.0, 5.0],
+                        'close': [1.0, 3.0, 5.0],
+                        'volume': [1, 1, 1],
+                    }
+                ]
+            },
+        }
+
+        np.testing.assert_allclose(indicators.vwap(chart), [1.0, 2.0, 5.0])
+        np.testing.assert_allclose(
+            indicators.vwap(chart, reset_daily=False), [1.0, 2.0, 3.0]
+        )
+
+    @pytest.mark.parametrize(
+        'func', ['sma', 'ema', 'rsi', 'atr', 'bollinger_bands', 'vwap']
+    )
+    def test_gaps(
+        self, chart: dict[str, Any], chart_with_gaps: dict[str, Any], func: str
+    ) -> None:
+        """Test gaps are NaN and indicators are computed over bars with data only."""
+        result = getattr(indicators, func)(chart_with_gaps)
+        middle = result.middle if func == 'bollinger_bands' else result
+
+        without_gaps = copy.deepcopy(chart_with_gaps)
+        without_gaps['timestamp'] = [
+            t for i, t in enumerate(chart['timestamp']) if i not in GAPS
+        ]
+        quote = without_gaps['indicators']['quote'][0]
+
+        for field, values in quote.items():
+            quote[field] = [v for v in values if v is not None]
+
+        expected = getattr(indicators, func)(without_gaps)
+        expected_middle = expected.middle if func == 'bollinger_bands' else expected
+
+        assert np.isnan(middle[GAPS]).all()
+        np.testing.assert_allclose(np.delete(middle, GAPS), expected_middle)
+
+    def test_batch(self) -> None:
+        """Test batch of charts gives 2D array, padded for shorter charts."""
+        charts = [
+            _get_json_fixture(f'{t}_1d_1y.json', 'chart')['chart']['result'][0]
+            for t in ('meta', 'aapl')
+        ]
+        short_chart = copy.deepcopy(charts[1])
+        short_chart['timestamp'] = short_chart['timestamp'][:100]
+        charts[1] = short_chart
+
+        for field, values in short_chart['indicators']['quote'][0].items():
+            short_chart['indicators']['quote'][0][field] = values[:100]
+
+        result = indicators.rsi(charts)
+
+        assert result.shape == (2, len(charts[0]['timestamp']))
+        np.testing.assert_allclose(result[0], indicators.rsi(charts[0]))
+        np.testing.assert_allclose(result[1, :100], indicators.rsi(short_chart))
+        assert np.isnan(result[1, 100:]).all()
+
+    def test_short_chart(self, chart: dict[str, Any]) -> None:
+        """Test chart shorter than window and chart without bars."""
+        assert np.isnan(indicators.sma(chart, window=1000)).all()
+        assert np.isnan(indicators.rsi(chart, window=1000)).all()
+        assert np.isnan(indicators.atr(chart, window=1000)).all()
+        assert indicators.ema({'meta': {}, 'indicators': {'quote': [{}]}}).size == 0
+
+    def test_invalid_window(self, chart: dict[str, Any]) -> None:
+        """Test invalid window raises ValueError."""
+        with pytest.raises(ValueError):
+            indicators.sma(chart, window=0)
+
+    def test_missing_field(self, chart: dict[str, Any]) -> None:
+        """Test missing chart field raises ValueError."""
+        chart_without_adjclose = {**chart, 'indicators': chart['indicators'].copy()}
+        del chart_without_adjclose['indicators']['adjclose']
+
+        with pytest.raises(ValueError):
+            indicators.sma(chart_without_adjclose, field='adjclose')
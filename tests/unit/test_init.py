@@ -0,0 +1,48 @@
+import subprocess
+import sys
+
+import pytest
+
+import yafin
+
+
+def _run_python(code: str) -> str:
+    """Run code in a fresh interpreter and return its stdout."""
+    completed = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True
+    )
+    return completed.stdout.strip()
+
+
+class TestUnitInit:
+    """Unit tests for yafin package init."""
+
+    @pytest.mark.parametrize(
+        'module_name',
+        ['curl_cffi', 'async_lru', 'importlib.metadata', 'yafin.client', 'yafin.const'],
+    )
+    def test_import_is_lazy(self, module_name: str) -> None:
+        """Test heavy modules are not imported by bare import yafin."""
+        code = f'import sys, yafin; print({module_name!r} in sys.modules)'
+        assert _run_python(code) == 'False'
+
+    @pytest.mark.parametrize('name', yafin.__all__)
+    def test_lazy_attrs(self, name: str) -> None:
+        """Test public classes are resolved from their submodules."""
+        cls = getattr(yafin, name)
+        assert cls.__name__ == name
+        assert name in dir(yafin)
+
+    @pytest.mark.parametrize('name', sorted(yafin._LAZY_SUBMODULES))
+    def test_lazy_submodules(self, name: str) -> None:
+        """Test submodules are resolved as package attributes."""
+        assert getattr(yafin, name).__name__ == f'yafin.{name}'
+
+    def test_version(self) -> None:
+        """Test package version is resolved lazily."""
+        assert isinstance(yafin.__version__, str)
+
+    def test_invalid_attr(self) -> None:
+        """Test unknown attribute raises AttributeError."""
+        with pytest.raises(AttributeError):
+            yafin.xxx  # noqa: B018
@@ -0,0 +1,111 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from tests._utils import _get_json_fixture
+from yafin.panel import Panel, build_panel
+from yafin.results import TickerResults
+
+
+def _make_chart(
+    symbol: str, timestamps: list[int], closes: list[float | None]
+) -> dict[str, Any]:
+    """Intraday chart result with close only."""
+    return {
+        'meta': {'symbol': symbol, 'dataGranularity': '1h', 'gmtoffset': 0},
+        'timestamp': timestamps,
+        'indicators': {'quote': [{'close': closes}]},
+    }
+
+
+@pytest.fixture
+def charts() -> list[dict[str, Any]]:
+    """Charts with different timestamps and gap."""
+    return [
+        _make_chart('AAA', [100, 200, 300], [1.0, 2.0, 3.0]),
+        _make_chart('BBB', [200, 300, 400], [20.0, None, 40.0]),
+    ]
+
+
+class TestUnitPanel:
+    """Unit tests for yafin.panel module."""
+
+    def test_build_panel_union(self, charts: list[dict[str, Any]]) -> None:
+        """Test union of timestamps, missing bars are NaN and masked."""
+        panel = build_panel(charts, fields=('close',))
+
+        assert panel.tickers == ['AAA', 'BBB']
+        assert panel.timestamps.tolist() == [100, 200, 300, 400]
+        assert panel.shape == (2, 4, 1)
+        np.testing.assert_array_equal(
+            panel.get_field('close'),
+            [[1.0, 2.0, 3.0, np.nan], [np.nan, 20.0, np.nan, 40.0]],
+        )
+        assert panel.mask.tolist() == [
+            [True, True, True, False],
+            [False, True, False, True],
+        ]
+
+    def test_build_panel_intersection(self, charts: list[dict[str, Any]]) -> None:
+        """Test intersection of timestamps."""
+        panel = build_panel(charts, fields=('close',), how='intersection')
+
+        assert panel.timestamps.tolist() == [200, 300]
+        np.testing.assert_array_equal(
+            panel.get_field('close'), [[2.0, 3.0], [20.0, np.nan]]
+        )
+
+    def test_build_panel_ticker_results(self) -> None:
+        """Test daily charts of ticker keyed results are aligned by day."""
+        charts = [
+            _get_json_fixture(f'{t}_1d_1y.json', 'chart')['chart']['result'][0]
+            for t in ('meta', 'aapl')
+        ]
+        # other exchange timezone, same days
+        charts[1]['meta'] = {**charts[1]['meta'], 'gmtoffset': 3600}
+        charts[1]['timestamp'] = [t - 6 * 3600 for t in charts[1]['timestamp']]
+        results = TickerResults(
+            ['AAPL', 'META'], [('META', charts[0]), ('AAPL', charts[1])]
+        )
+
+        panel = build_panel(results)
+
+        assert panel.tickers == ['AAPL', 'META']
+        assert panel.shape == (2, len(charts[0]['timestamp']), 5)
+        assert (panel.timestamps % 86400 == 0).all()
+        assert panel.mask.all()
+        np.testing.assert_allclose(
+            panel.get_field('close')[1], charts[0]['indicators']['quote'][0]['close']
+        )
+
+    def test_select(self, charts: list[dict[str, Any]]) -> None:
+        """Test selection of tickers and time range."""
+        panel = build_panel(charts, fields=('close',))
+
+        selected = panel.select(start=200, end=400)
+        assert selected.timestamps.tolist() == [200, 300]
+        assert np.shares_memory(selected.values, panel.values)
+
+        selected = panel.select('bbb', start=200)
+        assert isinstance(selected, Panel)
+        assert selected.tickers == ['BBB']
+        np.testing.assert_array_equal(selected.values[..., 0], [[20.0, np.nan, 40.0]])
+
+        with pytest.raises(KeyError):
+            panel.select('CCC')
+
+        with pytest.raises(KeyError):
+            panel.get_field('open')
+
+    def test_build_panel_invalid(self, charts: list[dict[str, Any]]) -> None:
+        """Test invalid how and missing field raise ValueError."""
+        with pytest.raises(ValueError):
+            build_panel(charts, how='xxx')  # type: ignore[arg-type]
+
+        with pytest.raises(ValueError):
+            build_panel(charts, fields=('adjclose',))
+
+    def test_build_panel_empty(self) -> None:
+        """Test panel without charts."""
+        assert build_panel([]).shape == (0, 0, 5)
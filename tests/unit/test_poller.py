@@ -0,0 +1,133 @@
+import copy
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture, _mock_response
+from yafin.poller import AsyncQuotePoller, QuoteDelta, QuotePoller, QuoteSnapshots
+
+
+@pytest.fixture
+def quotes_json_mocks() -> list[dict[str, Any]]:
+    """Quote response json of META and AAPL and the same with changed fields."""
+    quote_json = _get_json_fixture('meta_aapl.json', 'quote')
+    changed_quote_json = copy.deepcopy(quote_json)
+    meta_quote = changed_quote_json['quoteResponse']['result'][0]
+    meta_quote['regularMarketPrice'] += 1
+    meta_quote['regularMarketTime'] += 5
+    return [quote_json, changed_quote_json]
+
+
+class TestUnitQuoteSnapshots:
+    """Unit tests for yafin.poller.QuoteSnapshots."""
+
+    def test_update(self) -> None:
+        """Test only changed fields are emitted, new tickers with all fields."""
+        snapshots = QuoteSnapshots()
+
+        assert snapshots.update([]) == []
+        assert snapshots.update(
+            [
+                {'symbol': 'AAA', 'price': 1.0, 'name': 'A', 'tags': ['x']},
+                {'symbol': 'BBB', 'price': 2},
+            ]
+        ) == [
+            QuoteDelta(
+                'AAA', {'symbol': 'AAA', 'price': 1.0, 'name': 'A', 'tags': ['x']}
+            ),
+            QuoteDelta('BBB', {'symbol': 'BBB', 'price': 2}),
+        ]
+        assert snapshots.update(
+            [
+                {'symbol': 'BBB', 'price': 3, 'volume': 10},
+                {'symbol': 'AAA', 'price': 1.0, 'name': 'A', 'tags': ['x', 'y']},
+                {'symbol': 'CCC', 'price': 4.0},
+            ]
+        ) == [
+            QuoteDelta('BBB', {'price': 3, 'volume': 10}),
+            QuoteDelta('AAA', {'tags': ['x', 'y']}),
+            QuoteDelta('CCC', {'symbol': 'CCC', 'price': 4.0}),
+        ]
+        # missing field is changed to None
+        assert snapshots.update([{'symbol': 'BBB', 'price': 3}]) == [
+            QuoteDelta('BBB', {'volume': None})
+        ]
+        assert len(snapshots) == 3
+
+    def test_update_fields(self) -> None:
+        """Test only tracked fields are diffed."""
+        snapshots = QuoteSnapshots(fields=['price'])
+        snapshots.update([{'symbol': 'AAA', 'price': 1.0, 'volume': 1}])
+
+        assert snapshots.update([{'symbol': 'AAA', 'price': 2.0, 'volume': 2}]) == [
+            QuoteDelta('AAA', {'price': 2.0})
+        ]
+
+
+class TestUnitQuotePoller:
+    """Unit tests for yafin.poller.QuotePoller."""
+
+    def test_poll(
+        self, mocker: MockerFixture, quotes_json_mocks: list[dict[str, Any]]
+    ) -> None:
+        """Test polls yield only changed fields."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[*quotes_json_mocks, quotes_json_mocks[-1]],
+        )
+        sleep_mock = mocker.patch('yafin.poller.sleep')
+
+        with QuotePoller('META,AAPL', interval=1.0) as poller:
+            deltas = poller.poll()
+            assert [delta.ticker for delta in deltas] == ['META', 'AAPL']
+
+            # unchanged poll is not yielded
+            assert next(iter(poller)) == [
+                QuoteDelta(
+                    'META',
+                    {
+                        'regularMarketPrice': quotes_json_mocks[1]['quoteResponse'][
+                            'result'
+                        ][0]['regularMarketPrice'],
+                        'regularMarketTime': quotes_json_mocks[1]['quoteResponse'][
+                            'result'
+                        ][0]['regularMarketTime'],
+                    },
+                )
+            ]
+            assert poller.poll() == []
+
+        sleep_mock.assert_not_called()
+
+    def test_invalid_interval(self) -> None:
+        """Test non-positive interval raises ValueError."""
+        with pytest.raises(ValueError):
+            QuotePoller('META', interval=0)
+
+
+class TestUnitAsyncQuotePoller:
+    """Unit tests for yafin.poller.AsyncQuotePoller."""
+
+    @pytest.mark.asyncio
+    async def test_poll(
+        self, mocker: MockerFixture, quotes_json_mocks: list[dict[str, Any]]
+    ) -> None:
+        """Test polls yield only changed fields."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=quotes_json_mocks,
+            async_mock=True,
+        )
+
+        async with AsyncQuotePoller('META,AAPL', interval=0.01) as poller:
+            async for deltas in poller:
+                assert len(deltas) == 2
+                break
+
+            deltas = await poller.poll()
+
+        assert [delta.ticker for delta in deltas] == ['META']
+        assert set(deltas[0].changes) == {'regularMarketPrice', 'regularMarketTime'}
@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from yafin.resample import resample_chart
+
+NEW_YORK = ZoneInfo('America/New_York')
+
+
+def _ts(year: int, month: int, day: int, hour: int, minute: int = 0) -> int:
+    """New York local time to UTC timestamp."""
+    return int(datetime(year, month, day, hour, minute, tzinfo=NEW_YORK).timestamp())
+
+
+def _make_chart(
+    timestamps: list[int], closes: list[float | None], granularity: str
+) -> dict[str, Any]:
+    """Chart result with OHLC equal to close and volume 1 (None for gaps)."""
+    volumes = [None if close is None else 1 for close in closes]
+    return {
+        'meta': {
+            'exchangeTimezoneName': 'America/New_York',
+            'dataGranularity': granularity,
+            'currentTradingPeriod': {
+                'regular': {
+                    'start': _ts(2025, 11, 26, 9, 30),
+                    'end': _ts(2025, 11, 26, 16),
+                    'gmtoffset': -18000,
+                },
+            },
+        },
+        'timestamp': timestamps,
+        'indicators': {
+            'quote': [
+                {
+                    'open': closes,
+                    'high': closes,
+                    'low': closes,
+                    'close': closes,
+                    'volume': volumes,
+                }
+            ],
+        },
+    }
+
+
+class TestUnitResample:
+    """Unit tests for yafin.resample module."""
+
+    def test_resample_chart_minutes(self) -> None:
+        """Test 1m bars are aggregated into 3m buckets anchored to market open."""
+        timestamps = [_ts(2025, 11, 26, 9, 30 + i) for i in range(8)]
+        closes: list[float | None] = [1.0, 3.0, 2.0, 4.0, None, 0.5, 6.0, 7.0]
+        chart = _make_chart(timestamps, closes, '1m')
+
+        resampled_chart = resample_chart(chart, '3m')
+        quote = resampled_chart['indicators']['quote'][0]
+
+        assert resampled_chart['meta']['dataGranularity'] == '3m'
+        assert resampled_chart['timestamp'] == [
+            _ts(2025, 11, 26, 9, 30),
+            _ts(2025, 11, 26, 9, 33),
+            _ts(2025, 11, 26, 9, 36),
+        ]
+        assert quote['open'] == [1.0, 4.0, 6.0]
+        assert quote['high'] == [3.0, 4.0, 7.0]
+        assert quote['low'] == [1.0, 0.5, 6.0]
+        assert quote['close'] == [2.0, 0.5, 7.0]
+        assert quote['volume'] == [3.0, 2.0, 2.0]
+        # original chart is not modified
+        assert chart['meta']['dataGranularity'] == '1m'
+
+    def test_resample_chart_days(self) -> None:
+        """Test intraday bars are aggregated into exchange days across DST change."""
+        timestamps = [
+            _ts(2025, 7, 1, 9, 30),
+            _ts(2025, 7, 1, 15, 55),
+            _ts(2025, 12, 1, 9, 30),
+            _ts(2025, 12, 1, 15, 55),
+        ]
+        chart = _make_chart(timestamps, [1.0, 2.0, 3.0, 4.0], '5m')
+
+        resampled_chart = resample_chart(chart, '1d')
+        quote = resampled_chart['indicators']['quote'][0]
+
+        assert resampled_chart['timestamp'] == [
+            _ts(2025, 7, 1, 9, 30),
+            _ts(2025, 12, 1, 9, 30),
+        ]
+        assert quote['open'] == [1.0, 3.0]
+        assert quote['close'] == [2.0, 4.0]
+
+    def test_resample_chart_hours(self) -> None:
+        """Test 2h buckets do not cross exchange days."""
+        timestamps = [
+            _ts(2025, 12, 1, 15, 30),
+            _ts(2025, 12, 2, 9, 30),
+        ]
+        chart = _make_chart(timestamps, [1.0, 2.0], '30m')
+
+        resampled_chart = resample_chart(chart, '2h')
+
+        assert resampled_chart['timestamp'] == [
+            _ts(2025, 12, 1, 15, 30),
+            _ts(2025, 12, 2, 9, 30),
+        ]
+
+    def test_resample_chart_daily(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test daily chart resampled into 1d is unchanged."""
+        chart = chart_json_mock['chart']['result'][0]
+        resampled_chart = resample_chart(chart, '1d')
+
+        assert resampled_chart['timestamp'] == chart['timestamp']
+
+        for field, values in chart['indicators']['quote'][0].items():
+            assert resampled_chart['indicators']['quote'][0][field] == pytest.approx(
+                values
+            )
+
+    def test_resample_chart_empty(self) -> None:
+        """Test chart without bars."""
+        chart = _make_chart([], [], '1m')
+        resampled_chart = resample_chart(chart, '5m')
+
+        assert resampled_chart['timestamp'] == []
+        assert resampled_chart['indicators']['quote'][0]['close'] == []
+
+    @pytest.mark.parametrize(
+        'granularity, interval',
+        [('1m', '2d'), ('1m', 'xx'), ('1m', '0m'), ('5m', '7m'), ('1wk', '1d')],
+    )
+    def test_resample_chart_invalid(self, granularity: str, interval: str) -> None:
+        """Test invalid interval or interval finer than chart raises ValueError."""
+        chart = _make_chart([_ts(2025, 12, 1, 9, 30)], [1.0], granularity)
+
+        with pytest.raises(ValueError):
+            resample_chart(chart, interval)
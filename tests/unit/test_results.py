@@ -0,0 +1,218 @@
+from typing import Any
+
+import numpy as np
+import pytest
+
+from tests._utils import _get_fixture_path, _get_json_fixture
+from yafin.results import (
+    ChartMeta,
+    CurrentTradingPeriod,
+    OptionContract,
+    PartialResults,
+    Quote,
+    TickerResults,
+    TimeseriesPoint,
+    TradingPeriod,
+    decode_chart_meta,
+    decode_option_contracts,
+    decode_quotes,
+    decode_timeseries_points,
+)
+
+
+class TestUnitResults:
+    """Unit tests for yafin.results module."""
+
+    @pytest.mark.parametrize('as_bytes', [True, False])
+    def test_decode_quotes(self, tickers_name: str, as_bytes: bool) -> None:
+        """Test decode_quotes function."""
+        path = _get_fixture_path(f'{tickers_name}.json', 'quote')
+        data = (
+            path.read_bytes()
+            if as_bytes
+            else _get_json_fixture(f'{tickers_name}.json', 'quote')
+        )
+        quotes = decode_quotes(data)
+        expected = _get_json_fixture(f'{tickers_name}.json', 'quote')['quoteResponse'][
+            'result'
+        ]
+
+        assert [q.symbol for q in quotes] == [r['symbol'] for r in expected]
+
+        for quote, result in zip(quotes, expected):
+            assert isinstance(quote, Quote)
+            assert quote.regular_market_price == result['regularMarketPrice']
+            assert quote.market_cap == result['marketCap']
+            assert not hasattr(quote, '__dict__')
+
+    def test_quote_missing_keys(self) -> None:
+        """Test missing json keys are decoded as None."""
+        quote = Quote.from_json({'symbol': 'META'})
+        assert quote.symbol == 'META'
+        assert quote.pre_market_price is None
+
+    def test_quote_to_dict(self) -> None:
+        """Test to_dict method keeps original json keys."""
+        quote = Quote.from_json({'symbol': 'META', 'regularMarketPrice': 1.0})
+        quote_dict = quote.to_dict()
+        assert quote_dict['regularMarketPrice'] == 1.0
+        assert Quote.from_json(quote_dict) == quote
+        assert 'META' in repr(quote)
+
+    def test_decode_chart_meta(self, ticker: str) -> None:
+        """Test decode_chart_meta function."""
+        chart_json = _get_json_fixture(f'{ticker.lower()}_1d_1y.json', 'chart')
+        (meta,) = decode_chart_meta(chart_json)
+        expected = chart_json['chart']['result'][0]['meta']
+
+        assert isinstance(meta, ChartMeta)
+        assert meta.symbol == ticker
+        assert meta.exchange_timezone_name == expected['exchangeTimezoneName']
+
+        # lazy sub-object is kept raw until first access
+        assert isinstance(getattr(meta, '_current_trading_period'), dict)
+        period = meta.current_trading_period
+        assert isinstance(period, CurrentTradingPeriod)
+        assert meta.current_trading_period is period
+        assert isinstance(period.regular, TradingPeriod)
+        assert (
+            period.regular.start == expected['currentTradingPeriod']['regular']['start']
+        )
+        assert (
+            meta.to_dict()['currentTradingPeriod'] == expected['currentTradingPeriod']
+        )
+
+    def test_decode_option_contracts(self, ticker: str) -> None:
+        """Test decode_option_contracts function."""
+        options_json = _get_json_fixture(f'{ticker.lower()}.json', 'options')
+        option = options_json['optionChain']['result'][0]['options'][0]
+        contracts = decode_option_contracts(options_json)
+
+        assert len(contracts) == len(option['calls']) + len(option['puts'])
+        assert all(isinstance(c, OptionContract) for c in contracts)
+        assert {c.option_type for c in contracts} <= {'call', 'put'}
+        assert contracts[0].contract_symbol == option['calls'][0]['contractSymbol']
+
+        # options result, e.g. from Symbol.get_options
+        result = options_json['optionChain']['result'][0]
+        assert decode_option_contracts(result) == contracts
+
+    def test_decode_timeseries_points(self, ticker: str) -> None:
+        """Test decode_timeseries_points function."""
+        file_name = f'income_statement_{ticker.lower()}.json'
+        timeseries_json: dict[str, Any] = _get_json_fixture(file_name, 'timeseries')
+        results = timeseries_json['timeseries']['result']
+        points = decode_timeseries_points(timeseries_json)
+
+        expected_count = sum(
+            1
+            for r in results
+            for item in r.get(r['meta']['type'][0]) or []
+            if item is not None
+        )
+        assert len(points) == expected_count
+        assert all(isinstance(p, TimeseriesPoint) for p in points)
+        assert all(p.ticker == ticker for p in points)
+        assert decode_timeseries_points(results) == points
+
+
+class TestUnitTickerResults:
+    """Unit tests for yafin.results.TickerResults."""
+
+    @pytest.fixture
+    def quote_results(self) -> list[dict[str, Any]]:
+        """Quote results out of order, with duplicate and without one ticker."""
+        return [
+            {'symbol': 'AAPL', 'regularMarketPrice': 200.0},
+            {'symbol': 'META', 'regularMarketPrice': {'raw': 600.0, 'fmt': '600'}},
+            {'symbol': 'AAPL', 'regularMarketPrice': 201.0},
+            {'symbol': 'GOOGL'},
+        ]
+
+    def test_from_symbol_results(self, quote_results: list[dict[str, Any]]) -> None:
+        """Test indexing by symbol records missing and duplicate tickers."""
+        results = TickerResults.from_symbol_results(
+            ['meta', 'AAPL', 'MSFT', 'GOOGL'], quote_results
+        )
+
+        assert list(results) == ['META', 'AAPL', 'GOOGL']
+        assert len(results) == 3
+        assert results['aapl'] is quote_results[0]
+        assert 'MSFT' not in results
+        assert results.missing == ['MSFT']
+        assert results.duplicates == ['AAPL']
+        assert results.unexpected == []
+
+    def test_from_ordered_results(self) -> None:
+        """Test indexing in order of tickers."""
+        results = TickerResults.from_ordered_results(
+            ['META', 'AAPL'], [{'meta': {'symbol': 'META'}}, {'meta': None}]
+        )
+
+        assert results['META'] == {'meta': {'symbol': 'META'}}
+        assert results.values_of('meta.symbol') == ['META', None]
+
+        with pytest.raises(ValueError):
+            TickerResults.from_ordered_results(['META', 'AAPL'], [{}])
+
+    def test_unexpected(self) -> None:
+        """Test results for not requested tickers are kept and recorded."""
+        results = TickerResults.from_symbol_results(['META'], [{'symbol': 'AAPL'}])
+
+        assert list(results) == ['AAPL']
+        assert results.missing == ['META']
+        assert results.unexpected == ['AAPL']
+
+    def test_values_of(self, quote_results: list[dict[str, Any]]) -> None:
+        """Test field extraction in order of requested tickers."""
+        results = TickerResults.from_symbol_results(
+            ['META', 'AAPL', 'MSFT', 'GOOGL'], quote_results
+        )
+
+        assert results.values_of('regularMarketPrice', default=0) == [
+            {'raw': 600.0, 'fmt': '600'},
+            200.0,
+            0,
+            0,
+        ]
+
+    def test_to_array(self, quote_results: list[dict[str, Any]]) -> None:
+        """Test numeric field extraction into array with NaN gaps."""
+        results = TickerResults.from_symbol_results(
+            ['META', 'AAPL', 'MSFT', 'GOOGL'], quote_results
+        )
+        prices = results.to_array('regularMarketPrice')
+
+        assert prices.dtype == np.float64
+        np.testing.assert_array_equal(prices, [600.0, 200.0, np.nan, np.nan])
+
+
+class TestUnitPartialResults:
+    """Unit tests for yafin.results.PartialResults."""
+
+    def test_partial_results(self) -> None:
+        """Test failed tickers are recorded and raised together."""
+        error = ConnectionError('reset')
+        results = PartialResults(
+            ['META', 'AAPL', 'MSFT'],
+            [('META', {}), ('MSFT', {})],
+            {'AAPL': error},
+            {'META': 1, 'AAPL': 3, 'MSFT': 2},
+        )
+
+        assert list(results) == ['META', 'MSFT']
+        assert results.failed == results.missing == ['AAPL']
+        assert (
+            repr(results) == "PartialResults(tickers=['META', 'MSFT'], failed=['AAPL'])"
+        )
+
+        with pytest.raises(ExceptionGroup) as exc_info:
+            results.raise_for_errors()
+
+        assert exc_info.value.exceptions == (error,)
+
+    def test_raise_for_errors_no_errors(self) -> None:
+        """Test raise_for_errors does nothing if all tickers succeeded."""
+        results = PartialResults(['META'], [('META', {})], {}, {'META': 1})
+
+        results.raise_for_errors()
@@ -0,0 +1,237 @@
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture, _mock_response
+from yafin.scheduler import AsyncRefreshScheduler, RefreshScheduler, SchedulerBase
+
+NOW = 1_000_000.0
+
+
+def _quote(symbol: str, market_state: str | None = None) -> dict[str, Any]:
+    """Quote result with market state."""
+    quote: dict[str, Any] = {'symbol': symbol}
+
+    if market_state is not None:
+        quote['marketState'] = market_state
+
+    return quote
+
+
+class TestUnitSchedulerBase:
+    """Unit tests for yafin.scheduler.SchedulerBase."""
+
+    def test_pop_due_update(self) -> None:
+        """Test tickers are rescheduled by market state of their quotes."""
+        scheduler = SchedulerBase(
+            'AAA,BBB,CCC,DDD,EEE',
+            regular_interval=5,
+            extended_interval=30,
+            closed_interval=900,
+        )
+
+        tickers = scheduler.pop_due(NOW)
+        assert tickers == ['AAA', 'BBB', 'CCC', 'DDD', 'EEE']
+        assert scheduler.pop_due(NOW) == []
+        assert scheduler.get_next_due() is None
+
+        scheduler.update(
+            tickers,
+            [
+                _quote('AAA', 'REGULAR'),
+                _quote('BBB', 'POST'),
+                _quote('CCC', 'CLOSED'),
+                _quote('EEE', 'POSTPOST'),
+            ],
+            NOW,
+        )
+
+        assert scheduler.get_next_due() == NOW + 5
+        assert scheduler.pop_due(NOW + 29) == ['AAA']
+        assert scheduler.pop_due(NOW + 30) == ['BBB']
+        # ticker without quote is retried as closed, overnight market is closed
+        assert scheduler.pop_due(NOW + 900) == ['CCC', 'DDD', 'EEE']
+
+    def test_trading_periods(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test closed market is refreshed at next session start of trading period."""
+        chart = chart_json_mock['chart']['result'][0]
+        ticker = chart['meta']['symbol']
+        trading_period = chart['meta']['currentTradingPeriod']
+        pre_start = trading_period['pre']['start']
+        regular_start = trading_period['regular']['start']
+        scheduler = SchedulerBase(ticker, closed_interval=86400)
+        scheduler.set_trading_periods([chart])
+
+        # market state from trading periods
+        assert scheduler.get_interval(ticker, {}, regular_start) == 5
+        assert scheduler.get_interval(ticker, {}, pre_start) == 30
+        assert scheduler.get_interval(ticker, {}, pre_start - 100) == 100
+        assert (
+            scheduler.get_interval(ticker, _quote(ticker, 'CLOSED'), pre_start - 100)
+            == 100
+        )
+        assert scheduler.get_interval(ticker, _quote(ticker), NOW) == 86400
+
+        scheduler.extended_interval = None
+        assert scheduler.get_interval(ticker, _quote(ticker, 'PRE'), pre_start) == (
+            regular_start - pre_start
+        )
+
+    def test_trading_periods_projected(self, chart_json_mock: dict[str, Any]) -> None:
+        """Test ended sessions are projected to next weekday in exchange timezone."""
+        chart = chart_json_mock['chart']['result'][0]
+        ticker = chart['meta']['symbol']
+        trading_period = chart['meta']['currentTradingPeriod']
+        # Wednesday 4:00 and 9:30 New York time
+        pre_start = trading_period['pre']['start']
+        regular_start = trading_period['regular']['start']
+        closed_quote = _quote(ticker, 'CLOSED')
+        scheduler = SchedulerBase(ticker, closed_interval=7 * 86400)
+        scheduler.set_trading_periods([chart])
+
+        # Wednesday evening to Thursday pre market
+        now = regular_start + 10 * 3600
+        assert scheduler.get_interval(ticker, closed_quote, now) == (
+            pre_start + 86400 - now
+        )
+        # Friday evening to Monday pre market
+        now += 2 * 86400
+        assert scheduler.get_interval(ticker, closed_quote, now) == (
+            pre_start + 5 * 86400 - now
+        )
+
+        scheduler.extended_interval = None
+        assert scheduler.get_interval(ticker, closed_quote, now) == (
+            regular_start + 5 * 86400 - now
+        )
+
+    def test_add_remove_tickers(self) -> None:
+        """Test removed tickers are not refreshed nor rescheduled."""
+        scheduler = SchedulerBase('AAA,BBB')
+        tickers = scheduler.pop_due(NOW)
+        scheduler.remove_tickers('bbb')
+        scheduler.update(tickers, [_quote('AAA'), _quote('BBB')], NOW)
+        scheduler.add_tickers('CCC', due=NOW + 1)
+
+        assert scheduler.pop_due(NOW + 1) == ['CCC']
+        assert scheduler.pop_due(NOW + 5) == ['AAA']
+        assert scheduler.get_next_due() is None
+
+    def test_invalid_interval(self) -> None:
+        """Test non-positive interval raises ValueError."""
+        with pytest.raises(ValueError):
+            SchedulerBase('AAA', regular_interval=0)
+
+
+class TestUnitRefreshScheduler:
+    """Unit tests for yafin.scheduler.RefreshScheduler."""
+
+    def test_refresh(self, mocker: MockerFixture) -> None:
+        """Test due tickers are refreshed in a single request and rescheduled."""
+        quote_json = _get_json_fixture('meta_aapl.json', 'quote')
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[quote_json],
+        )
+        scheduler = RefreshScheduler('META,AAPL')
+
+        assert len(scheduler.refresh(NOW)) == 2
+        assert scheduler.refresh(NOW) == []
+        quote_calls = [
+            call for call in get_mock.call_args_list if 'quote' in call.kwargs['url']
+        ]
+        assert len(quote_calls) == 1
+        assert quote_calls[0].kwargs['params']['symbols'] == 'AAPL,META'
+        # both markets are closed in fixture
+        assert scheduler.get_next_due() == NOW + scheduler.closed_interval
+
+    def test_refresh_trading_periods(self, mocker: MockerFixture) -> None:
+        """Test trading periods of closed exchange are refreshed once within ttl."""
+        quote_json = _get_json_fixture('meta_aapl.json', 'quote')
+        chart_json = _get_json_fixture('aapl_1d_1y.json', 'chart')
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[quote_json, chart_json, quote_json],
+        )
+        trading_period = chart_json['chart']['result'][0]['meta'][
+            'currentTradingPeriod'
+        ]
+        # Wednesday evening New York time, sessions of fixture ended
+        now = trading_period['post']['end'] + 3600
+        scheduler = RefreshScheduler('META,AAPL', closed_interval=7 * 86400)
+
+        scheduler.refresh(now)
+        next_due = scheduler.get_next_due()
+        scheduler.refresh(next_due)
+
+        chart_calls = [
+            call for call in get_mock.call_args_list if 'chart' in call.kwargs['url']
+        ]
+        # both tickers are on the same exchange, single chart is requested
+        assert len(chart_calls) == 1
+        assert chart_calls[0].kwargs['url'].endswith('/AAPL')
+        assert chart_calls[0].kwargs['params']['range'] == '1d'
+        assert scheduler._trading_periods['META'] == trading_period
+        # Thursday pre market
+        assert next_due == trading_period['pre']['start'] + 86400
+        # still closed in pre market (e.g. holiday), Thursday regular market
+        assert scheduler.get_next_due() == trading_period['regular']['start'] + 86400
+
+    def test_refresh_err(self, mocker: MockerFixture) -> None:
+        """Test failed refresh reschedules tickers after regular interval."""
+        mocker.patch('yafin.client.Session.get', side_effect=ValueError)
+        scheduler = RefreshScheduler('META')
+
+        with pytest.raises(ValueError):
+            scheduler.refresh(NOW)
+
+        assert scheduler.get_next_due() == NOW + scheduler.regular_interval
+
+
+class TestUnitAsyncRefreshScheduler:
+    """Unit tests for yafin.scheduler.AsyncRefreshScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_aiter(self, mocker: MockerFixture) -> None:
+        """Test due tickers are refreshed and yielded."""
+        quote_json = _get_json_fixture('meta_aapl.json', 'quote')
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[quote_json],
+            async_mock=True,
+        )
+        scheduler = AsyncRefreshScheduler('META,AAPL')
+
+        async for quotes in scheduler:
+            assert {quote['symbol'] for quote in quotes} == {'META', 'AAPL'}
+            break
+
+        assert scheduler.pop_due() == []
+
+    @pytest.mark.asyncio
+    async def test_refresh_trading_periods(self, mocker: MockerFixture) -> None:
+        """Test trading periods of closed markets are refreshed from chart meta."""
+        chart_json = _get_json_fixture('aapl_1d_1y.json', 'chart')
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[_get_json_fixture('meta_aapl.json', 'quote'), chart_json],
+            async_mock=True,
+        )
+        trading_period = chart_json['chart']['result'][0]['meta'][
+            'currentTradingPeriod'
+        ]
+        now = trading_period['post']['end'] + 3600
+        scheduler = AsyncRefreshScheduler('META,AAPL', closed_interval=7 * 86400)
+
+        await scheduler.refresh(now)
+
+        chart_calls = [
+            call for call in get_mock.call_args_list if 'chart' in call.kwargs['url']
+        ]
+        assert len(chart_calls) == 1
+        assert scheduler.get_next_due() == trading_period['pre']['start'] + 86400
@@ -0,0 +1,230 @@
+import os
+from pathlib import Path
+from time import time
+
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture, _mock_response
+from yafin.search import (
+    DEFAULT_SEARCH_TTL,
+    AsyncSymbolSearch,
+    SearchEntry,
+    SearchIndex,
+    SymbolSearch,
+)
+
+NOW = 1_000_000.0
+
+
+@pytest.fixture
+def search_index() -> SearchIndex:
+    """Search index of a few symbols."""
+    return SearchIndex(
+        [
+            SearchEntry('META', 'Meta Platforms, Inc.', 'NMS', 'EQUITY', NOW),
+            SearchEntry('MET', 'MetLife, Inc.', 'NYQ', 'EQUITY', NOW),
+            SearchEntry('AAPL', 'Apple Inc.', 'NMS', 'EQUITY', NOW),
+            SearchEntry('MSFT', 'Microsoft Corporation', 'NMS', 'EQUITY', NOW),
+            SearchEntry('^GSPC', 'S&P 500', 'SNP', 'INDEX', NOW),
+        ]
+    )
+
+
+class TestUnitSearchIndex:
+    """Unit tests for yafin.search.SearchIndex."""
+
+    def test_search(self, search_index: SearchIndex) -> None:
+        """Test symbols are matched first, then names and their words."""
+        assert len(search_index) == 5
+        assert 'meta' in search_index
+        assert [e.symbol for e in search_index.search('met')] == ['MET', 'META']
+        assert [e.symbol for e in search_index.search('META')] == ['META']
+        assert [e.symbol for e in search_index.search('apple')] == ['AAPL']
+        assert [e.symbol for e in search_index.search('platf')] == ['META']
+        assert [e.symbol for e in search_index.search('inc')] == [
+            'AAPL',
+            'MET',
+            'META',
+        ]
+        assert [e.symbol for e in search_index.search('m', limit=2)] == [
+            'MET',
+            'META',
+        ]
+        assert [e.symbol for e in search_index.search('^gs')] == ['^GSPC']
+        assert search_index.search('xyz') == []
+        assert search_index.search(' ') == []
+
+    def test_add_replace(self, search_index: SearchIndex) -> None:
+        """Test replaced entry is searched by its new name only."""
+        search_index.add([SearchEntry('meta', 'Facebook, Inc.', updated=NOW + 1)])
+
+        assert len(search_index) == 5
+        assert search_index.get('META') == SearchEntry(
+            'META', 'Facebook, Inc.', updated=NOW + 1
+        )
+        assert [e.symbol for e in search_index.search('face')] == ['META']
+        assert search_index.search('platf') == []
+
+    def test_add_duplicates(self) -> None:
+        """Test last entry of symbol duplicated in one batch wins."""
+        for entries in (
+            [SearchEntry('MSFT', 'Microsoft'), SearchEntry('ZZZ', 'Zeta')],
+            [],
+        ):
+            search_index = SearchIndex(entries)
+            search_index.add(
+                [SearchEntry('A', 'Apple'), SearchEntry('a', 'Banana Corp')]
+            )
+
+            assert len(search_index) == len(entries) + 1
+            assert search_index.get('A') == SearchEntry('A', 'Banana Corp')
+            assert search_index.search('apple') == []
+            assert [e.symbol for e in search_index.search('banana')] == ['A']
+            assert [e.symbol for e in search_index.search('micro')] == (
+                ['MSFT'] if entries else []
+            )
+
+    def test_add_bulk(self) -> None:
+        """Test bulk added entries are searchable."""
+        search_index = SearchIndex(
+            SearchEntry(f'T{i:03}', f'Ticker {i}') for i in range(200)
+        )
+        search_index.add([SearchEntry('T0000', 'Ticker zero')])
+
+        assert len(search_index) == 201
+        assert [e.symbol for e in search_index.search('t000')] == ['T000', 'T0000']
+        assert [e.symbol for e in search_index.search('ticker 19', 3)] == [
+            'T019',
+            'T190',
+            'T191',
+        ]
+
+    def test_add_results(self) -> None:
+        """Test search and quote type results are added."""
+        search_json = _get_json_fixture('meta.json', 'search')
+        quote_type_json = _get_json_fixture('aapl.json', 'quote_type')
+        search_index = SearchIndex()
+        search_index.add_search_results(search_json['quotes'], NOW)
+        search_index.add_quote_type_results(quote_type_json['quoteType']['result'], NOW)
+
+        assert len(search_index) == len(search_json['quotes']) + 1
+        assert search_index.get('META') == SearchEntry(
+            'META', 'Meta Platforms, Inc.', 'NMS', 'EQUITY', NOW
+        )
+        assert search_index.search('apple')[0].symbol == 'AAPL'
+
+    def test_csv(self, search_index: SearchIndex, tmp_path: Path) -> None:
+        """Test symbols are saved into and loaded from csv."""
+        path = tmp_path / 'symbols.csv'
+        search_index.save_csv(path)
+        loaded_index = SearchIndex()
+        loaded_index.load_csv(path, now=NOW)
+
+        assert len(loaded_index) == len(search_index)
+        assert loaded_index.get('AAPL') == search_index.get('AAPL')
+        assert [e.symbol for e in loaded_index.search('met')] == ['MET', 'META']
+
+    def test_load_csv_stamped(self, search_index: SearchIndex, tmp_path: Path) -> None:
+        """Test symbols of old csv are stamped at load time, so they are not stale."""
+        path = tmp_path / 'symbols.csv'
+        search_index.save_csv(path)
+        os.utime(path, (0, 0))
+        loaded_index = SearchIndex()
+        loaded_index.load_csv(path)
+
+        entry = loaded_index.get('AAPL')
+        assert entry is not None
+        assert time() - entry.updated < DEFAULT_SEARCH_TTL
+
+
+class TestUnitSymbolSearch:
+    """Unit tests for yafin.search.SymbolSearch."""
+
+    def test_search(self, mocker: MockerFixture, search_index: SearchIndex) -> None:
+        """Test network is searched only on miss or stale entries."""
+        search_json = _get_json_fixture('meta.json', 'search')
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[search_json],
+        )
+
+        with SymbolSearch(search_index, ttl=60) as search:
+            # local hit
+            assert search.search('aap', now=NOW)[0].symbol == 'AAPL'
+            assert get_mock.call_count == 0
+
+            # miss written back into index
+            entries = search.search('wpm', now=NOW)
+            assert [e.symbol for e in entries] == ['WPM']
+            assert get_mock.call_count == 1
+            assert get_mock.call_args.kwargs['params']['q'] == 'WPM'
+
+            # miss without results is not searched again within ttl
+            assert search.search('xyz', now=NOW) == []
+            assert search.search('xyz', now=NOW + 30) == []
+            assert get_mock.call_count == 2
+
+            # stale entries are refreshed
+            assert search.search('wpm', now=NOW + 30)[0].updated == NOW
+            assert search.search('wpm', now=NOW + 60)[0].updated == NOW + 60
+            assert get_mock.call_count == 3
+
+            assert search.search('', now=NOW) == []
+            assert get_mock.call_count == 3
+
+    def test_add_tickers(self, mocker: MockerFixture) -> None:
+        """Test tickers are added from quote type results."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[_get_json_fixture('meta_aapl.json', 'quote_type')],
+        )
+
+        with SymbolSearch() as search:
+            search.add_tickers('META,AAPL', now=NOW)
+
+        assert len(search.index) == 2
+        assert search.index.search('apple')[0].symbol == 'AAPL'
+
+    def test_ttl_err(self) -> None:
+        """Test negative ttl raises ValueError."""
+        with pytest.raises(ValueError):
+            SymbolSearch(ttl=-1)
+
+
+class TestUnitAsyncSymbolSearch:
+    """Unit tests for yafin.search.AsyncSymbolSearch."""
+
+    @pytest.mark.asyncio
+    async def test_search(self, mocker: MockerFixture) -> None:
+        """Test miss is searched on network and answered locally afterwards."""
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[_get_json_fixture('meta.json', 'search')],
+            async_mock=True,
+        )
+
+        async with AsyncSymbolSearch() as search:
+            entries = await search.search('meta', now=NOW)
+            assert await search.search('meta p', now=NOW + 1) == entries[:1]
+
+        assert entries[0].symbol == 'META'
+        assert get_mock.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_add_tickers(self, mocker: MockerFixture) -> None:
+        """Test tickers are added from quote type results."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[_get_json_fixture('meta_aapl.json', 'quote_type')],
+            async_mock=True,
+        )
+
+        async with AsyncSymbolSearch() as search:
+            await search.add_tickers('META,AAPL', now=NOW)
+
+        assert search.index.get('META') is not None
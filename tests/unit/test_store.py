@@ -0,0 +1,217 @@
+import sqlite3
+from typing import Any
+
+import numpy as np
+import pytest
+from pytest_mock import MockerFixture
+
+from tests._utils import _get_json_fixture
+from yafin.financials import pivot_financials
+from yafin.store import SQL_FILE_NAME, ChartStore, SqlStore
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+
+def _slice_chart(chart: dict[str, Any], start: int, stop: int | None) -> dict[str, Any]:
+    """Chart result with bars of index range."""
+    quote = chart['indicators']['quote'][0]
+    return {
+        'meta': chart['meta'],
+        'timestamp': chart['timestamp'][start:stop],
+        'indicators': {
+            'quote': [{field: values[start:stop] for field, values in quote.items()}]
+        },
+    }
+
+
+class TestUnitChartStore:
+    """Unit tests for yafin.store.ChartStore."""
+
+    def test_append_read(self, tmp_path: Any, chart_json_mock: dict[str, Any]) -> None:
+        """Test appended charts are read back as memory-mapped range slices."""
+        chart = chart_json_mock['chart']['result'][0]
+        ticker = chart['meta']['symbol']
+        timestamps = chart['timestamp']
+        store = ChartStore(tmp_path)
+
+        assert store.get_range(ticker, '1d') is None
+        assert store.append(_slice_chart(chart, 0, 100)) == 100
+        # overlapping append replaces the overlapping bars
+        assert store.append(_slice_chart(chart, 99, None)) == len(timestamps) - 99
+        assert store.get_range(ticker, '1d') == (timestamps[0], timestamps[-1])
+
+        bars = store.read(ticker, '1d', start=timestamps[10], end=timestamps[20])
+
+        assert isinstance(bars.close, np.memmap)
+        assert bars.timestamp.tolist() == timestamps[10:20]
+        np.testing.assert_allclose(
+            bars.close, chart['indicators']['quote'][0]['close'][10:20]
+        )
+
+        stored_chart = ChartStore(tmp_path).read_chart(ticker.lower(), '1d')
+
+        assert stored_chart['meta'] == chart['meta']
+        assert stored_chart['timestamp'] == timestamps
+
+        for field, values in stored_chart['indicators']['quote'][0].items():
+            assert values == pytest.approx(chart['indicators']['quote'][0][field])
+
+    def test_append_rewrite(self, tmp_path: Any) -> None:
+        """Test chart starting before stored bars rewrites them, gaps are None."""
+        meta = {'symbol': 'AAA', 'dataGranularity': '1m'}
+        store = ChartStore(tmp_path)
+
+        store.append(
+            {
+                'meta': meta,
+                'timestamp': [300, 360],
+                'indicators': {'quote': [{field: [1.0, 2.0] for field in FIELDS}]},
+            }
+        )
+        bars = store.read('AAA', '1m')
+        store.append(
+            {
+                'meta': meta,
+                'timestamp': [240, 180, 240],
+                'indicators': {
+                    'quote': [{field: [3.0, None, 4.0] for field in FIELDS}]
+                },
+            },
+            start=120,
+        )
+
+        assert store.get_range('AAA', '1m') == (120, 240)
+        chart = store.read_chart('AAA', '1m', start=0)
+        assert chart['timestamp'] == [180, 240]
+        assert chart['indicators']['quote'][0]['close'] == [None, 4.0]
+        # views read before rewrite keep their data
+        assert bars.timestamp.tolist() == [300, 360]
+        assert bars.close.tolist() == [1.0, 2.0]
+
+    def test_append_interval(self, tmp_path: Any) -> None:
+        """Test bars are stored under given interval instead of dataGranularity."""
+        store = ChartStore(tmp_path)
+        store.append(
+            {
+                'meta': {'symbol': 'AAA', 'dataGranularity': '1d'},
+                'timestamp': [300],
+                'indicators': {'quote': [{field: [1.0] for field in FIELDS}]},
+            },
+            interval='5d',
+        )
+
+        assert store.get_range('AAA', '5d') == (300, 300)
+        assert store.get_range('AAA', '1d') is None
+
+    def test_append_invalid(self, tmp_path: Any) -> None:
+        """Test chart without symbol raises ValueError and empty store reads."""
+        store = ChartStore(tmp_path)
+
+        with pytest.raises(ValueError):
+            store.append({'meta': {}, 'timestamp': []})
+
+        assert store.read('AAA', '1d').timestamp.tolist() == []
+
+
+class TestUnitSqlStore:
+    """Unit tests for yafin.store.SqlStore."""
+
+    def test_query_bars(
+        self, tmp_path: Any, mocker: MockerFixture, chart_json_mock: dict[str, Any]
+    ) -> None:
+        """Test bars of all charts are queried by SQL, appended charts are synced."""
+        chart = chart_json_mock['chart']['result'][0]
+        ticker = chart['meta']['symbol']
+        timestamps = chart['timestamp']
+        other_chart = _slice_chart(chart, 0, 10)
+        other_chart['meta'] = {**chart['meta'], 'symbol': 'AAA'}
+        chart_store = ChartStore(tmp_path)
+        chart_store.append(chart)
+        chart_store.append(other_chart)
+        read_spy = mocker.spy(chart_store, 'read')
+
+        with SqlStore(tmp_path, chart_store) as store:
+            rows = store.query(
+                'SELECT timestamp, close FROM bars '
+                "WHERE ticker = ? AND interval = '1d' AND timestamp >= ?",
+                (ticker, timestamps[-5]),
+            )
+            assert [row['timestamp'] for row in rows] == timestamps[-5:]
+            assert [row['close'] for row in rows] == (
+                chart['indicators']['quote'][0]['close'][-5:]
+            )
+            assert store.query(
+                'SELECT ticker, count(*) AS bars FROM bars GROUP BY ticker'
+            ) == [
+                {'ticker': 'AAA', 'bars': 10},
+                {'ticker': ticker, 'bars': len(timestamps)},
+            ]
+
+            plan = store.query(
+                'EXPLAIN QUERY PLAN SELECT * FROM bars '
+                "WHERE ticker = 'AAA' AND interval = '1d' AND timestamp > 0"
+            )
+            assert 'PRIMARY KEY' in plan[0]['detail']
+            # unchanged charts are not copied again
+            assert read_spy.call_count == 2
+
+            chart_store.append(
+                _slice_chart(chart, 5, 20) | {'meta': other_chart['meta']}
+            )
+            rows = store.query("SELECT count(*) AS bars FROM bars WHERE ticker = 'AAA'")
+
+            assert rows == [{'bars': 20}]
+            assert read_spy.call_count == 3
+            # bars are not stored in database file
+            assert (
+                store.query("SELECT name FROM sqlite_master WHERE name LIKE '%bars%'")
+                == []
+            )
+
+        assert tmp_path.joinpath(SQL_FILE_NAME).exists()
+
+    def test_query_bars_no_chart_store(self) -> None:
+        """Test SqlStore without chart store has no table bars."""
+        with SqlStore(':memory:') as store, pytest.raises(sqlite3.OperationalError):
+            store.query('SELECT * FROM bars')
+
+    def test_add_quotes(self) -> None:
+        """Test quote snapshots and latest quotes view."""
+        quote = _get_json_fixture('meta.json', 'quote')['quoteResponse']['result'][0]
+        later_quote = {
+            **quote,
+            'regularMarketTime': quote['regularMarketTime'] + 60,
+            'regularMarketPrice': 1.0,
+        }
+
+        with SqlStore(':memory:') as store:
+            store.add_quotes([quote, later_quote])
+
+            assert len(store.query('SELECT * FROM quote_snapshots')) == 2
+            assert store.query('SELECT ticker, price FROM latest_quotes') == [
+                {'ticker': quote['symbol'], 'price': 1.0}
+            ]
+            assert store.query(
+                "SELECT json_extract(quote, '$.currency') AS currency "
+                'FROM latest_quotes'
+            ) == [{'currency': quote['currency']}]
+
+    def test_add_financials(self) -> None:
+        """Test financials are stored and read back as tidy table."""
+        results = [
+            _get_json_fixture(f'income_statement_{t}.json', 'timeseries')['timeseries'][
+                'result'
+            ]
+            for t in ('meta', 'aapl')
+        ]
+        table = pivot_financials(results)
+
+        with SqlStore(':memory:') as store:
+            store.add_financials(results)
+            store.add_financials(results)
+            stored_table = store.get_financials('meta,aapl')
+
+            assert len(stored_table.value) == len(table.value)
+            assert store.get_financials('META', typ='NetIncome').to_wide(
+                'NetIncome'
+            ) == pivot_financials(results[:1]).to_wide('NetIncome')
@@ -0,0 +1,313 @@
+import asyncio
+import base64
+import hashlib
+import json
+import struct
+from typing import Self
+
+import pytest
+
+from yafin.streamer import AsyncStreamer, PricingData, decode_pricing_data
+
+_WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+
+
+def _varint(value: int) -> bytes:
+    """Encode protobuf varint."""
+    value &= (1 << 64) - 1
+    encoded = bytearray()
+
+    while value >= 0x80:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _encode_pricing_data(
+    ticker: str, price: float, time: int, day_volume: int = 0, change: float = 0.0
+) -> str:
+    """Encode base64 protobuf PricingData message as sent by Yahoo."""
+    encoded_ticker = ticker.encode()
+    data = (
+        _varint(1 << 3 | 2)
+        + _varint(len(encoded_ticker))
+        + encoded_ticker
+        + _varint(2 << 3 | 5)
+        + struct.pack('<f', price)
+        # sint64 fields are zigzag encoded
+        + _varint(3 << 3)
+        + _varint(time << 1 ^ time >> 63)
+        + _varint(9 << 3)
+        + _varint(day_volume << 1 ^ day_volume >> 63)
+        + _varint(12 << 3 | 5)
+        + struct.pack('<f', change)
+        + _varint(33 << 3 | 1)
+        + struct.pack('<d', 1.5e12)
+        # unknown field is skipped
+        + _varint(99 << 3)
+        + _varint(1)
+    )
+    return base64.b64encode(data).decode()
+
+
+class _WebSocketServer:
+    """Minimal local websocket server standing in for Yahoo streamer."""
+
+    def __init__(self) -> None:
+        self.received: list[dict[str, list[str]]] = []
+        self.url = ''
+        self.connections = 0
+        self._writers: list[asyncio.StreamWriter] = []
+        self._server: asyncio.Server | None = None
+        self._subscribed = asyncio.Event()
+
+    async def __aenter__(self) -> Self:
+        self._server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f'ws://127.0.0.1:{port}/'
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.drop()
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def wait_subscribed(self) -> None:
+        await asyncio.wait_for(self._subscribed.wait(), 5)
+        self._subscribed.clear()
+
+    def send(self, message: str) -> None:
+        data = message.encode()
+        header = bytes([0x81, len(data)]) if len(data) < 126 else None
+
+        if header is None:
+            header = bytes([0x81, 126]) + struct.pack('>H', len(data))
+
+        for writer in self._writers:
+            writer.write(header + data)
+
+    def drop(self) -> None:
+        for writer in self._writers:
+            writer.close()
+
+        self._writers.clear()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        request = (await reader.readuntil(b'\r\n\r\n')).decode()
+        headers = {
+            key.lower(): value
+            for key, _, value in (
+                line.partition(': ') for line in request.split('\r\n')[1:]
+            )
+        }
+        accept = base64.b64encode(
+            hashlib.sha1((headers['sec-websocket-key'] + _WS_GUID).encode()).digest()
+        ).decode()
+        writer.write(
+            'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n'
+            f'Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n'.encode()
+        )
+        self.connections += 1
+        self._writers.append(writer)
+
+        try:
+            while True:
+                first, second = await reader.readexactly(2)
+                length = second & 0x7F
+
+                if length == 126:
+                    length = struct.unpack('>H', await reader.readexactly(2))[0]
+
+                elif length == 127:
+                    length = struct.unpack('>Q', await reader.readexactly(8))[0]
+
+                mask = await reader.readexactly(4)
+                data = bytes(
+                    byte ^ mask[i % 4]
+                    for i, byte in enumerate(await reader.readexactly(length))
+                )
+
+                if first & 0x0F == 1:
+                    self.received.append(json.loads(data))
+                    self._subscribed.set()
+
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+
+async def _collect(
+    streamer: AsyncStreamer, count: int, tickers: str | None = None
+) -> list[PricingData]:
+    """Collect first count pricing data of listener."""
+    collected = []
+
+    async for data in streamer.listen(tickers):
+        collected.append(data)
+
+        if len(collected) == count:
+            break
+
+    return collected
+
+
+class TestUnitDecodePricingData:
+    """Unit tests for yafin.streamer.decode_pricing_data."""
+
+    def test_decode_pricing_data(self) -> None:
+        """Test protobuf fields are decoded, missing ones are None."""
+        data = decode_pricing_data(
+            _encode_pricing_data('AAPL', 227.5, 1_700_000_000_000, 123_456, -1.25)
+        )
+
+        assert data.id == 'AAPL'
+        assert data.price == 227.5
+        assert data.time == 1_700_000_000_000
+        assert data.day_volume == 123_456
+        assert data.change == -1.25
+        assert data.market_cap == 1.5e12
+        assert data.currency is None
+        assert data.bid is None
+
+    def test_decode_pricing_data_negative(self) -> None:
+        """Test zigzag decoding of negative sint64."""
+        data = decode_pricing_data(_encode_pricing_data('X', 1.0, -5, -7))
+
+        assert data.time == -5
+        assert data.day_volume == -7
+
+    @pytest.mark.parametrize('message', ['not base64!', base64.b64encode(b'\x0a\x05')])
+    def test_decode_pricing_data_invalid(self, message: str | bytes) -> None:
+        """Test invalid message raises ValueError."""
+        with pytest.raises(ValueError):
+            decode_pricing_data(message)
+
+
+class TestUnitAsyncStreamer:
+    """Unit tests for yafin.streamer.AsyncStreamer."""
+
+    @pytest.mark.asyncio
+    async def test_subscribe(self) -> None:
+        """Test subscriptions are sent once, unsubscriptions only if subscribed."""
+        async with (
+            _WebSocketServer() as ws_server,
+            AsyncStreamer(ws_server.url) as streamer,
+        ):
+            await streamer.subscribe('aapl, meta')
+            await ws_server.wait_subscribed()
+            await streamer.subscribe('AAPL,MSFT')
+            await ws_server.wait_subscribed()
+            await streamer.unsubscribe('META,NVDA')
+            await ws_server.wait_subscribed()
+
+            assert streamer.subscriptions == {'AAPL', 'MSFT'}
+
+        assert ws_server.received == [
+            {'subscribe': ['AAPL', 'META']},
+            {'subscribe': ['MSFT']},
+            {'unsubscribe': ['META']},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_listen(self) -> None:
+        """Test pricing data are fanned out to all matching listeners."""
+        async with (
+            _WebSocketServer() as ws_server,
+            AsyncStreamer(ws_server.url) as streamer,
+        ):
+            all_task = asyncio.create_task(_collect(streamer, 3))
+            meta_task = asyncio.create_task(_collect(streamer, 1, 'meta'))
+            await streamer.subscribe('AAPL,META')
+            await ws_server.wait_subscribed()
+
+            ws_server.send(
+                json.dumps(
+                    {
+                        'type': 'pricing',
+                        'message': _encode_pricing_data('AAPL', 1.0, 1000),
+                    }
+                )
+            )
+            # not pricing and undecodable messages are skipped
+            ws_server.send(json.dumps({'type': 'heartbeat'}))
+            ws_server.send('{not json')
+            ws_server.send(_encode_pricing_data('META', 2.0, 2000))
+            ws_server.send(_encode_pricing_data('AAPL', 3.0, 3000))
+
+            all_data = await asyncio.wait_for(all_task, 5)
+            meta_data = await asyncio.wait_for(meta_task, 5)
+
+        assert [(d.id, d.price, d.time) for d in all_data] == [
+            ('AAPL', 1.0, 1000),
+            ('META', 2.0, 2000),
+            ('AAPL', 3.0, 3000),
+        ]
+        assert [(d.id, d.price) for d in meta_data] == [('META', 2.0)]
+
+    @pytest.mark.asyncio
+    async def test_listen_close(self) -> None:
+        """Test listeners end, when streamer is closed."""
+        async with _WebSocketServer() as ws_server:
+            streamer = AsyncStreamer(ws_server.url)
+            task = asyncio.create_task(_collect(streamer, 1))
+            await streamer.subscribe('AAPL')
+            await ws_server.wait_subscribed()
+            await streamer.close()
+
+        assert await asyncio.wait_for(task, 5) == []
+
+    @pytest.mark.asyncio
+    async def test_listen_queue_size(self) -> None:
+        """Test slow listener drops the oldest pricing data, not blocking others."""
+        async with (
+            _WebSocketServer() as ws_server,
+            AsyncStreamer(ws_server.url, queue_size=2) as streamer,
+        ):
+            slow_listener = streamer.listen()
+            fast_listener = streamer.listen()
+            slow_task = asyncio.ensure_future(anext(slow_listener))
+            fast_task = asyncio.ensure_future(anext(fast_listener))
+            await streamer.subscribe('AAPL')
+            await ws_server.wait_subscribed()
+            fast_data = []
+
+            for i in range(5):
+                ws_server.send(_encode_pricing_data('AAPL', float(i), i))
+                fast_data.append(await asyncio.wait_for(fast_task, 5))
+                fast_task = asyncio.ensure_future(anext(fast_listener))
+
+            slow_data = [await asyncio.wait_for(slow_task, 5)]
+            slow_data += [await anext(slow_listener) for _ in range(2)]
+            fast_task.cancel()
+            await slow_listener.aclose()
+
+        assert [d.price for d in fast_data] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert [d.price for d in slow_data] == [0.0, 3.0, 4.0]
+
+    @pytest.mark.asyncio
+    async def test_reconnect(self) -> None:
+        """Test dropped connection is reopened with all subscriptions."""
+        async with (
+            _WebSocketServer() as ws_server,
+            AsyncStreamer(ws_server.url, reconnect_delay=0.01) as streamer,
+        ):
+            await streamer.subscribe('AAPL,META')
+            await ws_server.wait_subscribed()
+            ws_server.drop()
+            await ws_server.wait_subscribed()
+            task = asyncio.create_task(_collect(streamer, 1))
+            await asyncio.sleep(0)
+            ws_server.send(_encode_pricing_data('META', 2.0, 2000))
+            data = await asyncio.wait_for(task, 5)
+
+        assert ws_server.connections == 2
+        assert ws_server.received == [
+            {'subscribe': ['AAPL', 'META']},
+            {'subscribe': ['AAPL', 'META']},
+        ]
+        assert data[0].id == 'META'
@@ -25,6 +25,7 @@ from yafin.const import (
     ANNUAL_INCOME_STATEMENT_TYPES,
     QUOTE_SUMMARY_MODULES,
 )
+from yafin.store import ChartStore
 
 
 @pytest.fixture
@@ -364,6 +365,42 @@ class TestUnitSymbol:
         with pytest.raises(err_cls):
             symbol.get_chart(**kwargs)
 
+    def test_get_stored_chart(
+        self,
+        symbol: Symbol,
+        mocker: MockerFixture,
+        chart_json_mock: dict[str, Any],
+        tmp_path: Any,
+    ) -> None:
+        """Test get_stored_chart method fetches only bars missing in store."""
+        chart = chart_json_mock['chart']['result'][0]
+        timestamps = chart['timestamp']
+        store = ChartStore(tmp_path)
+        get_chart_mock = mocker.patch.object(symbol, 'get_chart', return_value=chart)
+
+        stored_chart = symbol.get_stored_chart(store, '1d', period1=timestamps[0])
+        assert stored_chart['timestamp'] == timestamps
+        assert get_chart_mock.call_args.kwargs['period1'] == timestamps[0]
+
+        # stored period is served from disk
+        stored_chart = symbol.get_stored_chart(
+            store, '1d', period1=timestamps[10], period2=timestamps[20]
+        )
+        assert stored_chart['timestamp'] == timestamps[10:20]
+        assert get_chart_mock.call_count == 1
+
+        # open-ended period fetches from the last stored bar
+        symbol.get_stored_chart(store, '1d', period1=timestamps[10])
+        assert get_chart_mock.call_args.kwargs['period1'] == timestamps[-1]
+
+        # bars are stored under requested interval, not dataGranularity of meta
+        symbol.get_stored_chart(store, '5d', period1=timestamps[0])
+        symbol.get_stored_chart(
+            store, '5d', period1=timestamps[0], period2=timestamps[20]
+        )
+        assert get_chart_mock.call_count == 3
+        assert store.get_range(symbol.ticker, '5d') is not None
+
     def test_get_quote(
         self,
         symbol: Symbol,
@@ -1087,6 +1124,39 @@ class TestUnitAsyncSymbol:
         with pytest.raises(err_cls):
             await async_symbol.get_chart(**kwargs)
 
+    @pytest.mark.asyncio
+    async def test_get_stored_chart(
+        self,
+        async_symbol: AsyncSymbol,
+        mocker: MockerFixture,
+        chart_json_mock: dict[str, Any],
+        tmp_path: Any,
+    ) -> None:
+        """Test get_stored_chart method fetches only bars missing in store."""
+        chart = chart_json_mock['chart']['result'][0]
+        timestamps = chart['timestamp']
+        store = ChartStore(tmp_path)
+        get_chart_mock = mocker.patch.object(
+            async_symbol, 'get_chart', return_value=chart
+        )
+
+        stored_chart = await async_symbol.get_stored_chart(
+            store, '1d', period1=timestamps[0]
+        )
+        assert stored_chart['timestamp'] == timestamps
+        assert get_chart_mock.call_args.kwargs['period1'] == timestamps[0]
+
+        # stored period is served from disk
+        stored_chart = await async_symbol.get_stored_chart(
+            store, '1d', period1=timestamps[10], period2=timestamps[20]
+        )
+        assert stored_chart['timestamp'] == timestamps[10:20]
+        assert get_chart_mock.call_count == 1
+
+        # open-ended period fetches from the last stored bar
+        await async_symbol.get_stored_chart(store, '1d', period1=timestamps[10])
+        assert get_chart_mock.call_args.kwargs['period1'] == timestamps[-1]
+
     @pytest.mark.asyncio
     async def test_get_quote(
         self,
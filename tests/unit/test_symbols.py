@@ -2,6 +2,8 @@ from typing import Any, AsyncGenerator, Generator
 
 import pytest
 import pytest_asyncio
+from curl_cffi.requests import Response
+from curl_cffi.requests.exceptions import ConnectionError, HTTPError
 from pytest_mock import MockerFixture
 
 from tests._assertions import (
@@ -19,12 +21,16 @@ from tests._assertions import (
 )
 from tests._utils import _get_json_fixture, _mock_response
 from yafin import AsyncSymbols, Symbols
+from yafin.cache import clear_cache
 from yafin.const import (
     ANNUAL_BALANCE_SHEET_TYPES,
     ANNUAL_CASH_FLOW_TYPES,
     ANNUAL_INCOME_STATEMENT_TYPES,
     QUOTE_SUMMARY_MODULES,
 )
+from yafin.deadline import deadline
+from yafin.exceptions import DeadlineExceededError, RetriesExhaustedError
+from yafin.symbols import _is_retryable
 
 
 @pytest.fixture
@@ -33,6 +39,14 @@ def tickers_list(tickers: str) -> list[str]:
     return tickers.split(',')
 
 
+@pytest.fixture
+def cleared_cache() -> Generator[None, None, None]:
+    """Cleared response cache, so each chunk hits the mocked session."""
+    clear_cache()
+    yield
+    clear_cache()
+
+
 @pytest.fixture
 def chart_json_mocks(tickers_list: list[str]) -> list[dict[str, Any]]:
     """Chart response json mocks with data for 1y, 1d."""
@@ -550,6 +564,168 @@ class TestUnitSymbols:
         quotes_result_list = symbols.get_quote()
         _assert_quotes_result_list(quotes_result_list, symbols.tickers)
 
+    def test_get_quote_chunked(
+        self,
+        mocker: MockerFixture,
+        cleared_cache: None,
+        tickers_list: list[str],
+    ) -> None:
+        """Test get_quote requests chunks and merges them in order of tickers."""
+        quote_json_mocks = [
+            _get_json_fixture(file_name=f'{t.lower()}.json', folder_name='quote')
+            for t in tickers_list
+        ]
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=quote_json_mocks,
+        )
+
+        with Symbols(','.join(reversed(tickers_list)), chunk_size=1) as symbols:
+            quotes_result_list = symbols.get_quote()
+
+        assert [q['symbol'] for q in quotes_result_list] == tickers_list[::-1]
+
+    def test_get_quote_chunk_retried(
+        self,
+        mocker: MockerFixture,
+        cleared_cache: None,
+        tickers_list: list[str],
+    ) -> None:
+        """Test failed chunk is retried without refetching the other chunks."""
+        quote_json_mocks = [
+            _get_json_fixture(file_name=f'{t.lower()}.json', folder_name='quote')
+            for t in tickers_list
+        ]
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=quote_json_mocks,
+        )
+        requested_chunks: list[str] = []
+
+        def get(**kwargs: Any) -> Any:
+            chunk = kwargs.get('params', {}).get('symbols')
+
+            if chunk:
+                requested_chunks.append(chunk)
+
+                if len(requested_chunks) == 1:
+                    raise ConnectionError('Connection reset')
+
+            return get_mock.return_value
+
+        get_mock.side_effect = get
+        sleep_mock = mocker.patch('yafin.symbols.sleep')
+
+        with Symbols(','.join(tickers_list), chunk_size=1) as symbols:
+            quotes_result_list = symbols.get_quote()
+
+        assert requested_chunks == [tickers_list[0], *tickers_list]
+        assert [q['symbol'] for q in quotes_result_list] == tickers_list
+        sleep_mock.assert_called_once_with(1)
+
+    def test_get_quote_chunk_retries_exhausted(
+        self, mocker: MockerFixture, cleared_cache: None
+    ) -> None:
+        """Test failed chunk is retried by chunk retries only, not by the client."""
+        get_mock = _mock_response(mocker, patched_method='yafin.client.Session.get')
+        requested_chunks: list[str] = []
+
+        def get(**kwargs: Any) -> Any:
+            chunk = kwargs.get('params', {}).get('symbols')
+
+            if chunk:
+                requested_chunks.append(chunk)
+                raise ConnectionError('Connection reset')
+
+            return get_mock.return_value
+
+        get_mock.side_effect = get
+        sleep_mock = mocker.patch('yafin.symbols.sleep')
+        client_sleep_mock = mocker.patch('yafin.client.sleep')
+
+        with (
+            Symbols('META', chunk_retries=2) as symbols,
+            pytest.raises(RetriesExhaustedError),
+        ):
+            symbols.get_quote()
+
+        assert requested_chunks == ['META'] * 3
+        assert [c.args for c in sleep_mock.call_args_list] == [(1,), (2,)]
+        client_sleep_mock.assert_not_called()
+
+    def test_get_quote_chunk_not_retried(
+        self,
+        mocker: MockerFixture,
+        cleared_cache: None,
+        tickers_list: list[str],
+    ) -> None:
+        """Test chunk failed with non-transient error is not retried."""
+        get_mock = _mock_response(mocker, patched_method='yafin.client.Session.get')
+        requested_chunks: list[str] = []
+
+        def get(**kwargs: Any) -> Any:
+            chunk = kwargs.get('params', {}).get('symbols')
+
+            if chunk:
+                requested_chunks.append(chunk)
+                raise ValueError('chunk failed')
+
+            return get_mock.return_value
+
+        get_mock.side_effect = get
+
+        with (
+            Symbols(','.join(tickers_list), chunk_size=1) as symbols,
+            pytest.raises(ValueError),
+        ):
+            symbols.get_quote()
+
+        assert requested_chunks == [tickers_list[0]]
+
+    def test_index_results(
+        self,
+        symbols: Symbols,
+        mocker: MockerFixture,
+        quote_json_mock: dict[str, Any],
+        chart_json_mocks: list[dict[str, Any]],
+        tickers_list: list[str],
+    ) -> None:
+        """Test index_results keys quote and chart results by ticker."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=[quote_json_mock],
+        )
+        quotes = symbols.index_results('get_quote')
+
+        assert list(quotes) == tickers_list
+        assert quotes.missing == quotes.duplicates == []
+
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.Session.get',
+            response_jsons=chart_json_mocks,
+        )
+        charts = symbols.index_results('get_chart', interval='1d')
+
+        for ticker in tickers_list:
+            assert charts[ticker]['meta']['symbol'] == ticker
+
+    @pytest.mark.parametrize('method_name', ['close', 'get_search', 'get_xyz'])
+    def test_index_results_invalid_method(
+        self, symbols: Symbols, method_name: str
+    ) -> None:
+        """Test index_results raises on method without per ticker results."""
+        with pytest.raises(ValueError):
+            symbols.index_results(method_name)
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test non-positive chunk size raises."""
+        with pytest.raises(ValueError):
+            Symbols('META,AAPL', chunk_size=0)
+
     def test_get_quote_type(
         self,
         symbols: Symbols,
@@ -1271,6 +1447,162 @@ class TestUnitAsyncSymbols:
         quotes_result_list = await async_symbols.get_quote()
         _assert_quotes_result_list(quotes_result_list, async_symbols.tickers)
 
+    @pytest.mark.asyncio
+    async def test_index_results(
+        self,
+        async_symbols: AsyncSymbols,
+        mocker: MockerFixture,
+        quote_json_mock: dict[str, Any],
+        tickers_list: list[str],
+    ) -> None:
+        """Test index_results keys quote results by ticker."""
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=[quote_json_mock],
+            async_mock=True,
+        )
+        quotes = await async_symbols.index_results('get_quote')
+
+        assert list(quotes) == tickers_list
+        assert quotes.missing == quotes.duplicates == []
+
+        with pytest.raises(ValueError):
+            await async_symbols.index_results('get_search')
+
+    @pytest.mark.asyncio
+    async def test_fan_out(
+        self,
+        mocker: MockerFixture,
+        cleared_cache: None,
+        chart_json_mocks: list[dict[str, Any]],
+    ) -> None:
+        """Test fan_out keeps results of other tickers and retries transient errors."""
+        get_mock = _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=chart_json_mocks[:1],
+            async_mock=True,
+        )
+        not_found_response = mocker.Mock(spec=Response)
+        not_found_response.status_code = 404
+        not_found_response.raise_for_status.side_effect = HTTPError(
+            'HTTP Error 404', 0, not_found_response
+        )
+        requested_tickers: list[str] = []
+
+        def get(url: str, **kwargs: Any) -> Any:
+            ticker = url.rsplit('/', 1)[-1]
+            requested_tickers.append(ticker)
+
+            if ticker == 'BAD':
+                return not_found_response
+
+            if ticker == 'FLAKY' and requested_tickers.count(ticker) == 1:
+                raise ConnectionError('Connection reset')
+
+            return get_mock.return_value
+
+        get_mock.side_effect = get
+
+        async with AsyncSymbols('META,BAD,FLAKY,AAPL') as async_symbols:
+            results = await async_symbols.fan_out('get_chart', backoff=0, interval='1d')
+
+        assert list(results) == ['META', 'FLAKY', 'AAPL']
+        assert results.failed == results.missing == ['BAD']
+        assert isinstance(results.errors['BAD'], HTTPError)
+        assert results.attempts == {'META': 1, 'BAD': 1, 'FLAKY': 2, 'AAPL': 1}
+        assert sorted(requested_tickers) == ['AAPL', 'BAD', 'FLAKY', 'FLAKY', 'META']
+
+        with pytest.raises(ExceptionGroup):
+            results.raise_for_errors()
+
+    @pytest.mark.asyncio
+    async def test_fan_out_max_retries(
+        self, mocker: MockerFixture, cleared_cache: None
+    ) -> None:
+        """Test fan_out gives up on ticker after max retries."""
+        get_mock = mocker.patch(
+            'yafin.client.AsyncSession.get',
+            new=mocker.AsyncMock(side_effect=ConnectionError('Connection reset')),
+        )
+
+        async with AsyncSymbols('META') as async_symbols:
+            results = await async_symbols.fan_out(
+                'get_chart', max_retries=1, backoff=0, interval='1d'
+            )
+
+        assert results.failed == ['META']
+        assert results.attempts == {'META': 2}
+        assert get_mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fan_out_deadline(
+        self, mocker: MockerFixture, cleared_cache: None
+    ) -> None:
+        """Test fan_out does not retry once backoff would exceed the deadline."""
+        get_mock = mocker.patch(
+            'yafin.client.AsyncSession.get',
+            new=mocker.AsyncMock(side_effect=ConnectionError('Connection reset')),
+        )
+
+        async with AsyncSymbols('META') as async_symbols:
+            with deadline(1.0):
+                results = await async_symbols.fan_out(
+                    'get_chart', backoff=5.0, interval='1d'
+                )
+
+        assert results.failed == ['META']
+        assert results.attempts == {'META': 1}
+        assert get_mock.await_count == 1
+
+    @pytest.mark.parametrize(
+        ('exc', 'expected'),
+        [
+            (RetriesExhaustedError('All 1 requests failed.', attempts=1), True),
+            (RetriesExhaustedError('All 5 requests failed.', attempts=5), False),
+            (ConnectionError('Connection reset'), True),
+            (DeadlineExceededError('Deadline exceeded.'), False),
+            (ValueError('Invalid interval.'), False),
+        ],
+    )
+    def test_is_retryable(self, exc: Exception, expected: bool) -> None:
+        """Test errors retried by the client already are not retried again."""
+        assert _is_retryable(exc) is expected
+
+    @pytest.mark.asyncio
+    async def test_fan_out_invalid_method(self) -> None:
+        """Test fan_out raises on method, that is not AsyncSymbol get method."""
+        async with AsyncSymbols('META') as async_symbols:
+            with pytest.raises(ValueError):
+                await async_symbols.fan_out('close')
+
+    @pytest.mark.asyncio
+    async def test_get_quote_chunked(
+        self,
+        mocker: MockerFixture,
+        cleared_cache: None,
+        tickers_list: list[str],
+    ) -> None:
+        """Test get_quote requests chunks concurrently and merges them in order."""
+        quote_json_mocks = [
+            _get_json_fixture(file_name=f'{t.lower()}.json', folder_name='quote')
+            for t in tickers_list
+        ]
+        _mock_response(
+            mocker,
+            patched_method='yafin.client.AsyncSession.get',
+            response_jsons=quote_json_mocks,
+            async_mock=True,
+        )
+
+        async with AsyncSymbols(
+            ','.join(reversed(tickers_list)), chunk_size=1
+        ) as async_symbols:
+            quotes_result_list = await async_symbols.get_quote()
+
+        assert [q['symbol'] for q in quotes_result_list] == tickers_list[::-1]
+
     @pytest.mark.asyncio
     async def test_get_quote_type(
         self,
@@ -1,3 +1,4 @@
+import sys
 from typing import Any
 
 import pytest
@@ -22,6 +23,7 @@ from yafin.const import (
 )
 from yafin.exceptions import TrailingBalanceSheetError
 from yafin.utils import (
+    _canonical_args,
     _check_calendar_event_modules,
     _check_events,
     _check_frequency,
@@ -32,6 +34,12 @@ from yafin.utils import (
     _check_types,
     _encode_url,
     _error,
+    _import_numpy,
+    _join_csv,
+    _normalize_csv,
+    _normalize_ticker,
+    _normalize_tickers,
+    _parse_csv,
     get_types_with_frequency,
 )
 
@@ -49,6 +57,55 @@ class TestUnitUtils:
         compiled_url = _encode_url(url, params)
         assert compiled_url == r'https://query2.finance.yahoo.com?ticker=META&region=US'
 
+    @pytest.mark.parametrize('ticker', ['META', ' META ', 'meta', ' meta'])
+    def test_normalize_ticker(self, ticker: str) -> None:
+        """Test _normalize_ticker function."""
+        assert _normalize_ticker(ticker) == 'META'
+
+    @pytest.mark.parametrize(
+        'tickers', ['AAPL,META', 'META,AAPL', ' meta , aapl ', 'META,AAPL,meta,']
+    )
+    def test_normalize_tickers(self, tickers: str) -> None:
+        """Test _normalize_tickers function."""
+        assert _normalize_tickers(tickers) == 'AAPL,META'
+
+    def test_parse_csv(self) -> None:
+        """Test _parse_csv function."""
+        assert _parse_csv(' div , split,div') == {'div', 'split'}
+
+    def test_join_csv(self) -> None:
+        """Test _join_csv function."""
+        assert _join_csv({'split', 'earn', 'div'}) == 'div,earn,split'
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        [(None, None), ('', ''), (' split , div ', 'div,split')],
+    )
+    def test_normalize_csv(self, value: str | None, expected: str | None) -> None:
+        """Test _normalize_csv function."""
+        assert _normalize_csv(value) == expected
+
+    @pytest.mark.parametrize(
+        'args, kwargs',
+        [
+            (('meta', 'split,div', 1.5), {}),
+            (('META',), {'events': 'div, split', 'period1': 1}),
+            ((), {'ticker': ' META', 'events': 'div,split,div', 'period1': 1.9}),
+        ],
+    )
+    def test_canonical_args(
+        self, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        """Test _canonical_args decorator."""
+
+        @_canonical_args
+        def func(
+            ticker: str, events: str | None = None, period1: float | None = None
+        ) -> tuple[Any, ...]:
+            return ticker, events, period1
+
+        assert func(*args, **kwargs) == ('META', 'div,split', 1)
+
     @pytest.mark.parametrize(
         'kwargs, err_cls',
         [
@@ -66,6 +123,15 @@ class TestUnitUtils:
         with pytest.raises(err_cls):
             _error(**kwargs)
 
+    def test_import_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test optional numpy import raises with install hint if missing."""
+        assert _import_numpy().__name__ == 'numpy'
+
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+
+        with pytest.raises(ImportError, match=r'yafin\[numpy\]'):
+            _import_numpy()
+
     @pytest.mark.parametrize('interval', INTERVALS)
     def test_check_interval(self, interval: str) -> None:
         """Test _check_interval function with."""
@@ -1,8 +1,88 @@
-import importlib.metadata
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .client import AsyncClient, Client
-from .symbol import AsyncSymbol, Symbol
-from .symbols import AsyncSymbols, Symbols
+if TYPE_CHECKING:
+    from .client import AsyncClient, Client
+    from .streamer import AsyncStreamer
+    from .symbol import AsyncSymbol, Symbol
+    from .symbols import AsyncSymbols, Symbols
 
-__all__ = ['Client', 'AsyncClient', 'AsyncSymbol', 'Symbol', 'AsyncSymbols', 'Symbols']
-__version__ = importlib.metadata.version(__package__ or __name__)
+__all__ = [
+    'AsyncClient',
+    'AsyncStreamer',
+    'AsyncSymbol',
+    'AsyncSymbols',
+    'Client',
+    'Symbol',
+    'Symbols',
+]
+
+# public attribute -> submodule, which defines it
+# submodules (and their deps - curl_cffi, async_lru, const sets, ...) are imported
+# on first attribute access, so plain `import yafin` stays cheap
+_LAZY_ATTRS = {
+    'Client': 'client',
+    'AsyncClient': 'client',
+    'AsyncStreamer': 'streamer',
+    'Symbol': 'symbol',
+    'AsyncSymbol': 'symbol',
+    'Symbols': 'symbols',
+    'AsyncSymbols': 'symbols',
+}
+_LAZY_SUBMODULES = {
+    'adjust',
+    'analytics',
+    'cache',
+    'client',
+    'const',
+    'deadline',
+    'download',
+    'exceptions',
+    'executor',
+    'financials',
+    'fx',
+    'indicators',
+    'panel',
+    'poller',
+    'resample',
+    'results',
+    'scheduler',
+    'search',
+    'store',
+    'streamer',
+    'symbol',
+    'symbols',
+    'utils',
+}
+
+
+def _get_version() -> str:
+    # importlib.metadata scans installed distributions, so it is deferred as well
+    import importlib.metadata
+
+    return importlib.metadata.version(__package__ or __name__)
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import public classes, submodules and package version."""
+    if name == '__version__':
+        value: Any = _get_version()
+
+    elif name in _LAZY_ATTRS:
+        module = importlib.import_module(f'.{_LAZY_ATTRS[name]}', __name__)
+        value = getattr(module, name)
+
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f'.{name}', __name__)
+
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    # cache in module namespace, so __getattr__ is called only once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported ones."""
+    return sorted({*globals(), *_LAZY_ATTRS, *_LAZY_SUBMODULES, '__version__'})
@@ -0,0 +1,32 @@
+import sys
+
+_USAGE = 'usage: python -m yafin {download} ...'
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Dispatch yafin command line subcommands.
+
+    Args:
+        argv: Command line arguments. (optional, default: sys.argv[1:])
+
+    Returns: Exit code of the subcommand.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+
+    if not argv or argv[0] in {'-h', '--help'}:
+        print(_USAGE)
+        return 0 if argv else 2
+
+    command, *args = argv
+
+    if command == 'download':
+        from .download import main as download_main
+
+        return download_main(args)
+
+    print(f'{_USAGE}\nerror: invalid command {command!r}', file=sys.stderr)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
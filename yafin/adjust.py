@@ -0,0 +1,156 @@
+import copy
+import logging
+from typing import Any
+
+from .utils import _get_chart_array, _import_numpy
+
+logger = logging.getLogger(__name__)
+
+PRICE_FIELDS = ('open', 'high', 'low', 'close')
+
+
+def _get_event_arrays(
+    events: dict[str, Any], name: str, fields: tuple[str, ...]
+) -> list[Any]:
+    """Get date and fields of chart events as float arrays sorted by date."""
+    np = _import_numpy()
+    items = sorted(events.get(name, {}).values(), key=lambda e: e['date'])
+    return [
+        np.array([item[field] for item in items], dtype=np.float64)
+        for field in ('date', *fields)
+    ]
+
+
+def _get_cumulative_factors(timestamp: Any, dates: Any, factors: Any) -> Any:
+    """Get product of factors of all events after each bar."""
+    np = _import_numpy()
+    suffix_products = np.ones(len(factors) + 1)
+    suffix_products[:-1] = np.cumprod(factors[::-1])[::-1]
+    # bar at event date is already after the event
+    return suffix_products[np.searchsorted(dates, timestamp, side='right')]
+
+
+def _get_split_factors(timestamp: Any, events: dict[str, Any]) -> Any:
+    dates, numerators, denominators = _get_event_arrays(
+        events, 'splits', ('numerator', 'denominator')
+    )
+    return _get_cumulative_factors(timestamp, dates, denominators / numerators)
+
+
+def _get_dividend_factors(timestamp: Any, close: Any, events: dict[str, Any]) -> Any:
+    np = _import_numpy()
+    dates, amounts = _get_event_arrays(events, 'dividends', ('amount',))
+
+    # close of the last bar with data before ex-dividend date
+    has_close = ~np.isnan(close)
+    close_timestamp, close = timestamp[has_close], close[has_close]
+    prev_index = np.searchsorted(close_timestamp, dates, side='left') - 1
+    prev_close = np.full(len(dates), np.nan)
+    has_prev = prev_index >= 0
+    prev_close[has_prev] = close[prev_index[has_prev]]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factors = 1 - amounts / prev_close
+
+    # dividends before the first bar do not adjust any bar
+    return _get_cumulative_factors(
+        timestamp, dates, np.where(np.isnan(factors), 1.0, factors)
+    )
+
+
+def get_adjustment_factors(
+    chart: dict[str, Any],
+    splits: bool = False,
+    dividends: bool = True,
+    events: dict[str, Any] | None = None,
+) -> Any:
+    """Get cumulative price adjustment factor of each bar of the chart.
+
+    Dividend factor of each ex-dividend date is 1 - amount / previous close, split
+    factor is denominator / numerator. Factor of bar is product of factors of all
+    events after it, so adjusted price is price * factor. Requires numpy.
+
+    Args:
+        chart: Chart result, e.g. from Symbol.get_chart.
+        splits:
+            Whether to adjust for splits. Yahoo chart prices are already split
+            adjusted, so enable it only for unadjusted prices.
+            (optional, default: False)
+        dividends: Whether to adjust for dividends. (optional, default: True)
+        events:
+            Splits and dividends events, e.g. from daily chart of the same period
+            for intraday chart requested without events.
+            (optional, default: events of the chart)
+
+    Returns: Float numpy array of factors of bars.
+    """
+    np = _import_numpy()
+    events = chart.get('events', {}) if events is None else events
+    timestamp = _get_chart_array(chart, 'timestamp')
+    factors = np.ones(len(timestamp))
+
+    if splits:
+        factors *= _get_split_factors(timestamp, events)
+
+    if dividends:
+        close = _get_chart_array(chart, 'close')
+        factors *= _get_dividend_factors(timestamp, close, events)
+
+    return factors
+
+
+def adjust_chart(
+    chart: dict[str, Any],
+    splits: bool = False,
+    dividends: bool = True,
+    events: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Back-adjust chart OHLCV for splits and dividends for any interval.
+
+    Prices are multiplied by adjustment factors (see get_adjustment_factors) and
+    volume is divided by split factors. For daily and longer intervals, adjusted
+    close matches Yahoo adjclose. Requires numpy.
+
+    Args:
+        chart: Chart result, e.g. from Symbol.get_chart.
+        splits:
+            Whether to adjust for splits. Yahoo chart prices are already split
+            adjusted, so enable it only for unadjusted prices.
+            (optional, default: False)
+        dividends: Whether to adjust for dividends. (optional, default: True)
+        events:
+            Splits and dividends events, e.g. from daily chart of the same period
+            for intraday chart requested without events.
+            (optional, default: events of the chart)
+
+    Returns:
+        Copy of chart result with adjusted quote and adjclose set to adjusted close,
+            bars without data stay None.
+    """
+    np = _import_numpy()
+    events = chart.get('events', {}) if events is None else events
+    factors = get_adjustment_factors(chart, splits, dividends, events)
+    timestamp = _get_chart_array(chart, 'timestamp')
+    split_factors = (
+        _get_split_factors(timestamp, events) if splits else np.ones(len(timestamp))
+    )
+
+    adjusted_chart = copy.copy(chart)
+    indicators = adjusted_chart['indicators'] = copy.copy(chart.get('indicators', {}))
+    quote = dict((indicators.get('quote') or [{}])[0])
+    indicators['quote'] = [quote]
+
+    def to_list(values: Any) -> list[float | None]:
+        return np.where(np.isnan(values), None, values).tolist()
+
+    for field in PRICE_FIELDS:
+        if field in quote:
+            quote[field] = to_list(_get_chart_array(chart, field) * factors)
+
+    if 'volume' in quote:
+        quote['volume'] = to_list(_get_chart_array(chart, 'volume') / split_factors)
+
+    if 'close' in quote:
+        indicators['adjclose'] = [{'adjclose': quote['close']}]
+
+    return adjusted_chart
@@ -0,0 +1,216 @@
+import logging
+from typing import Any
+
+from .panel import Panel
+from .utils import _error, _import_numpy
+
+logger = logging.getLogger(__name__)
+
+
+def get_returns(
+    panel: Panel, field: str = 'close', log: bool = True, dtype: str = 'float64'
+) -> Any:
+    """Returns of all tickers of the panel.
+
+    Args:
+        panel: Aligned panel, see yafin.panel.build_panel.
+        field: Price field, e.g. close or adjclose.
+        log: Whether to compute log returns, simple returns otherwise.
+        dtype: Float dtype, float32 halves memory of large universes.
+
+    Returns:
+        Float numpy array of shape (tickers, timestamps), first timestamp and
+            returns from or to missing bar are NaN.
+    """
+    np = _import_numpy()
+    prices = panel.get_field(field).astype(dtype)
+    values = np.full(prices.shape, np.nan, dtype=dtype)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratios = prices[:, 1:] / prices[:, :-1]
+        values[:, 1:] = np.log(ratios) if log else ratios - 1
+
+    return values
+
+
+def rolling_volatility(
+    returns: Any, window: int = 21, periods_per_year: float | None = None
+) -> Any:
+    """Rolling standard deviation (ddof=1) of returns.
+
+    Args:
+        returns: Returns of shape (tickers, timestamps), see get_returns.
+        window: Number of returns.
+        periods_per_year:
+            Number of return periods per year, e.g. 252 for daily returns, to
+            annualize volatility. (optional, default: not annualized)
+
+    Returns:
+        Float numpy array of shape (tickers, timestamps), NaN until window is full
+            or if window contains missing return.
+    """
+    np = _import_numpy()
+
+    if window < 2:
+        _error(msg=f'Invalid {window=}. Must be at least 2.', err_cls=ValueError)
+
+    values = np.full(returns.shape, np.nan, dtype=returns.dtype)
+
+    if returns.shape[-1] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(returns, window, axis=-1)
+        values[..., window - 1 :] = windows.std(axis=-1, ddof=1)
+
+    if periods_per_year is not None:
+        values *= np.sqrt(periods_per_year)
+
+    return values
+
+
+def _pairwise_moments(
+    x_rows: Any, m_rows: Any, x_cols: Any, m_cols: Any, min_periods: int
+) -> tuple[Any, Any, Any]:
+    """Covariance and variances of rows and cols over pairwise complete periods.
+
+    Missing returns are zeros in x and masked out by m, so all moments are matrix
+    products (BLAS).
+    """
+    np = _import_numpy()
+    counts = m_rows @ m_cols.T
+    sum_rows = x_rows @ m_cols.T
+    sum_cols = m_rows @ x_cols.T
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ddof_counts = np.where(counts >= max(min_periods, 2), counts - 1, np.nan)
+        cov = (x_rows @ x_cols.T - sum_rows * sum_cols / counts) / ddof_counts
+        var_rows = ((x_rows * x_rows) @ m_cols.T - sum_rows**2 / counts) / ddof_counts
+        var_cols = (m_rows @ (x_cols * x_cols).T - sum_cols**2 / counts) / ddof_counts
+
+    return cov, var_rows, var_cols
+
+
+def _prepare(returns: Any) -> tuple[Any, Any, bool]:
+    """Drop periods without any return, zero missing returns and get their mask."""
+    np = _import_numpy()
+    mask = ~np.isnan(returns)
+    has_any = mask.any(axis=0)
+    mask = mask[:, has_any]
+    values = np.where(mask, returns[:, has_any], 0)
+    return values, mask.astype(returns.dtype), bool(mask.size and mask.all())
+
+
+def _pairwise(
+    returns: Any,
+    correlation: bool,
+    min_periods: int,
+    chunk_size: int | None,
+    out: Any,
+) -> Any:
+    np = _import_numpy()
+    x, m, complete = _prepare(returns)
+    size = len(returns)
+    out = np.empty((size, size), dtype=returns.dtype) if out is None else out
+    chunk_size = chunk_size or size or 1
+
+    if complete:
+        # fast path - single centered matrix product per chunk
+        periods = x.shape[-1]
+        ddof_periods = periods - 1 if periods >= max(min_periods, 2) else np.nan
+        x = x - x.mean(axis=-1, keepdims=True)
+        std = np.sqrt((x * x).sum(axis=-1) / ddof_periods)
+
+    for start in range(0, size, chunk_size):
+        rows = slice(start, start + chunk_size)
+
+        if complete:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cov = x[rows] @ x.T / ddof_periods
+                out[rows] = (
+                    np.clip(cov / np.outer(std[rows], std), -1, 1)
+                    if correlation
+                    else cov
+                )
+
+            continue
+
+        cov, var_rows, var_cols = _pairwise_moments(x[rows], m[rows], x, m, min_periods)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[rows] = (
+                np.clip(cov / np.sqrt(var_rows * var_cols), -1, 1)
+                if correlation
+                else cov
+            )
+
+    return out
+
+
+def covariance(
+    returns: Any,
+    min_periods: int = 2,
+    chunk_size: int | None = None,
+    out: Any = None,
+) -> Any:
+    """Covariance matrix of returns over pairwise complete periods.
+
+    Computed by matrix products (BLAS) in chunks of rows, so memory of
+    intermediates is bounded by chunk_size x tickers.
+
+    Args:
+        returns: Returns of shape (tickers, timestamps), see get_returns.
+        min_periods:
+            Min number of common periods of ticker pair, NaN otherwise.
+        chunk_size: Number of rows computed at once. (optional, default: all)
+        out:
+            Output array of shape (tickers, tickers), e.g. numpy memmap for
+            universes, that do not fit in memory. (optional, default: new array)
+
+    Returns: Float numpy array of shape (tickers, tickers) in dtype of returns.
+    """
+    return _pairwise(returns, False, min_periods, chunk_size, out)
+
+
+def correlation(
+    returns: Any,
+    min_periods: int = 2,
+    chunk_size: int | None = None,
+    out: Any = None,
+) -> Any:
+    """Correlation matrix of returns over pairwise complete periods.
+
+    Computed by matrix products (BLAS) in chunks of rows, so memory of
+    intermediates is bounded by chunk_size x tickers.
+
+    Args:
+        returns: Returns of shape (tickers, timestamps), see get_returns.
+        min_periods:
+            Min number of common periods of ticker pair, NaN otherwise.
+        chunk_size: Number of rows computed at once. (optional, default: all)
+        out:
+            Output array of shape (tickers, tickers), e.g. numpy memmap for
+            universes, that do not fit in memory. (optional, default: new array)
+
+    Returns: Float numpy array of shape (tickers, tickers) in dtype of returns.
+    """
+    return _pairwise(returns, True, min_periods, chunk_size, out)
+
+
+def beta(returns: Any, benchmark_returns: Any, min_periods: int = 2) -> Any:
+    """Beta of each ticker vs benchmark over pairwise complete periods.
+
+    Args:
+        returns: Returns of shape (tickers, timestamps), see get_returns.
+        benchmark_returns:
+            Returns of benchmark (e.g. ^GSPC from the same panel) of shape
+            (timestamps,).
+        min_periods:
+            Min number of common periods with benchmark, NaN otherwise.
+
+    Returns: Float numpy array of shape (tickers,).
+    """
+    np = _import_numpy()
+    stacked = np.vstack([benchmark_returns[None, :].astype(returns.dtype), returns])
+    x, m, _ = _prepare(stacked)
+    cov, _, var_benchmark = _pairwise_moments(x[1:], m[1:], x[:1], m[:1], min_periods)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (cov / var_benchmark)[:, 0]
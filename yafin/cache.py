@@ -0,0 +1,305 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024**2  # 256 MiB
+
+_MISSING = object()
+
+# payload size (in bytes) of the last decoded response in current context,
+# set by client at decode time and read by caching decorators
+_payload_size: ContextVar[int] = ContextVar('_payload_size', default=0)
+# set by no_cache, calls in current context bypass the cache
+_cache_disabled: ContextVar[bool] = ContextVar('_cache_disabled', default=False)
+
+
+class CacheInfo(NamedTuple):
+    """Cache usage report.
+
+    Attributes:
+        hits: number of cache hits.
+        misses: number of cache misses.
+        entries: number of cached responses.
+        current_bytes: approximate payload bytes of cached responses.
+        max_bytes: memory budget (in bytes) of the cache.
+    """
+
+    hits: int
+    misses: int
+    entries: int
+    current_bytes: int
+    max_bytes: int
+
+
+class _Entry:
+    __slots__ = ('cost', 'hits', 'priority', 'seq', 'size', 'value')
+
+    def __init__(self, value: Any, size: int, cost: float) -> None:
+        self.value = value
+        self.size = size
+        self.cost = cost
+        self.hits = 1
+        self.priority = 0.0
+        self.seq = 0
+
+
+class _SizedCache:
+    """Byte-budgeted cache with Greedy-Dual-Size-Frequency (GDSF) eviction.
+
+    Entry priority is `inflation + hits * cost / size`, so small, often hit and
+    expensive to fetch entries are kept, while large rarely hit ones are evicted
+    first. Inflation is raised to the priority of each evicted entry, which ages out
+    entries, that are not hit anymore.
+
+    Attributes:
+        max_bytes: memory budget (in bytes) of the cache.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: dict[Hashable, _Entry] = {}
+        # min heap of (priority, seq, key), stale items are skipped on pop
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+        self._inflation = 0.0
+        self._current_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Get cached value or _MISSING sentinel."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return _MISSING
+
+            self._hits += 1
+            entry.hits += 1
+            self._push(key, entry)
+            return entry.value
+
+    def set(self, key: Hashable, value: Any, size: int, cost: float = 1.0) -> None:
+        """Cache value and evict lowest priority entries over the budget."""
+        size = max(size, 1)
+
+        with self._lock:
+            if size > self.max_bytes:
+                logger.debug(f'Not caching {size=} bytes over {self.max_bytes=}.')
+                return
+
+            old_entry = self._entries.pop(key, None)
+
+            if old_entry is not None:
+                self._current_bytes -= old_entry.size
+
+            entry = _Entry(value, size, cost)
+            self._entries[key] = entry
+            self._current_bytes += size
+            self._push(key, entry)
+            self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """Change memory budget and evict entries over it."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._heap.clear()
+            self._inflation = 0.0
+            self._current_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """Report cache usage."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                len(self._entries),
+                self._current_bytes,
+                self.max_bytes,
+            )
+
+    def _push(self, key: Hashable, entry: _Entry) -> None:
+        entry.priority = self._inflation + entry.hits * entry.cost / entry.size
+        entry.seq = next(self._seq)
+        heapq.heappush(self._heap, (entry.priority, entry.seq, key))
+
+        # hits leave stale heap items behind, rebuild heap if they prevail
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(e.priority, e.seq, k) for k, e in self._entries.items()]
+            heapq.heapify(self._heap)
+
+    def _evict(self) -> None:
+        while self._current_bytes > self.max_bytes and self._heap:
+            priority, seq, key = heapq.heappop(self._heap)
+            entry = self._entries.get(key)
+
+            if entry is None or entry.seq != seq:
+                continue
+
+            del self._entries[key]
+            self._current_bytes -= entry.size
+            self._inflation = priority
+
+
+_cache = _SizedCache()
+
+
+def _record_payload_size(size: int) -> None:
+    """Record payload size of decoded response for caching decorators."""
+    _payload_size.set(size)
+
+
+def _make_key(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Hashable:
+    return (func.__module__, func.__qualname__, args, tuple(sorted(kwargs.items())))
+
+
+def _sized_cache(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator for caching function results in the global byte-budgeted cache.
+
+    Note:
+        Entry size is the payload size recorded at decode time and entry cost is the
+        time it took to fetch it.
+    """
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _cache_disabled.get():
+            return func(*args, **kwargs)
+
+        key = _make_key(func, args, kwargs)
+        value = _cache.get(key)
+
+        if value is not _MISSING:
+            return value
+
+        token = _payload_size.set(0)
+        start = perf_counter()
+
+        try:
+            value = func(*args, **kwargs)
+            size = _payload_size.get()
+
+        finally:
+            _payload_size.reset(token)
+
+        _cache.set(key, value, size, perf_counter() - start)
+        return value
+
+    return wrapper
+
+
+def _async_sized_cache(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator for caching coroutine results in the global byte-budgeted cache.
+
+    Concurrent calls with the same arguments share a single in-flight request.
+
+    Note:
+        Entry size is the payload size recorded at decode time and entry cost is the
+        time it took to fetch it.
+    """
+    pending: dict[Hashable, asyncio.Future[Any]] = {}
+
+    @wraps(func)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _cache_disabled.get():
+            return await func(*args, **kwargs)
+
+        key = _make_key(func, args, kwargs)
+        value = _cache.get(key)
+
+        if value is not _MISSING:
+            return value
+
+        if key in pending:
+            return await asyncio.shield(pending[key])
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        pending[key] = future
+        token = _payload_size.set(0)
+        start = perf_counter()
+
+        try:
+            value = await func(*args, **kwargs)
+            size = _payload_size.get()
+
+        except Exception as exc:
+            future.set_exception(exc)
+            # mark retrieved, so asyncio does not log it if nobody else awaits
+            future.exception()
+            raise
+
+        except BaseException:
+            future.cancel()
+            raise
+
+        finally:
+            _payload_size.reset(token)
+            pending.pop(key, None)
+
+        _cache.set(key, value, size, perf_counter() - start)
+        future.set_result(value)
+        return value
+
+    return async_wrapper
+
+
+@contextmanager
+def no_cache() -> Iterator[None]:
+    """Bypass the response cache in current context, e.g. for polling fresh quotes.
+
+    Responses of requests in the context are neither served from nor stored in the
+    cache.
+    """
+    token = _cache_disabled.set(True)
+
+    try:
+        yield
+
+    finally:
+        _cache_disabled.reset(token)
+
+
+def get_cache_info() -> CacheInfo:
+    """Get usage of the response cache shared by all clients.
+
+    Returns: Cache hits, misses, number of entries, current and max bytes.
+    """
+    return _cache.info()
+
+
+def set_cache_max_bytes(max_bytes: int) -> None:
+    """Set memory budget of the response cache shared by all clients.
+
+    Entries over the new budget are evicted immediately.
+
+    Args:
+        max_bytes: memory budget in bytes (of response payloads).
+    """
+    _cache.resize(max_bytes)
+
+
+def clear_cache() -> None:
+    """Clear the response cache shared by all clients."""
+    _cache.clear()
@@ -1,18 +1,32 @@
 import asyncio
 import logging
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import lru_cache
-from time import sleep
+from time import monotonic, perf_counter, sleep
 from types import TracebackType
-from typing import Any, Self
+from typing import Any, Literal, Self
 
 from async_lru import alru_cache
 from curl_cffi import AsyncSession, Response, Session
-from curl_cffi.requests.exceptions import HTTPError, Timeout
+from curl_cffi.requests.exceptions import RequestException
 
+from .cache import _async_sized_cache, _record_payload_size, _sized_cache
 from .const import EVENTS
+from .deadline import (
+    _adeadline_func,
+    _check_remaining,
+    _deadline_func,
+    _get_remaining,
+)
+from .exceptions import CircuitOpenError, DeadlineExceededError, RetriesExhaustedError
 from .utils import (
     _alog_func,
+    _canonical_args,
+    _canonical_search_args,
     _check_calendar_event_modules,
     _check_events,
     _check_interval,
@@ -20,11 +34,143 @@ from .utils import (
     _check_quote_summary_modules,
     _check_types,
     _encode_url,
+    _error,
+    _join_csv,
     _log_func,
+    _parse_csv,
 )
 
 _logger = logging.getLogger(__name__)
 
+# max number of attempts of requests in current context, set by callers with own
+# retries (e.g. Symbols fan-outs), so client retries are not stacked on top of them
+_max_attempts: ContextVar[int | None] = ContextVar('_max_attempts', default=None)
+
+
+@contextmanager
+def _single_attempt() -> Iterator[None]:
+    """Make requests within the block fail after first attempt, without backoff."""
+    token = _max_attempts.set(1)
+
+    try:
+        yield
+
+    finally:
+        _max_attempts.reset(token)
+
+
+class _LatencyTracker:
+    """Tracks recent latencies per endpoint for adaptive hedging threshold.
+
+    Attributes:
+        quantile: Latency quantile used as threshold, e.g. 0.95 for p95.
+        min_samples: Min number of latencies of endpoint before threshold is given.
+    """
+
+    def __init__(
+        self, quantile: float = 0.95, window: int = 256, min_samples: int = 20
+    ) -> None:
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self._window = window
+        self._latencies: dict[str, deque[float]] = {}
+
+    def add(self, endpoint: str, latency: float) -> None:
+        """Record latency (in secs) of successful request to endpoint."""
+        if endpoint not in self._latencies:
+            self._latencies[endpoint] = deque(maxlen=self._window)
+
+        self._latencies[endpoint].append(latency)
+
+    def get_threshold(self, endpoint: str) -> float | None:
+        """Get latency quantile of endpoint, None until enough samples."""
+        latencies = self._latencies.get(endpoint)
+
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+
+        ordered = sorted(latencies)
+        return ordered[min(int(self.quantile * len(ordered)), len(ordered) - 1)]
+
+
+class _Circuit:
+    __slots__ = ('failures', 'opened_at', 'state')
+
+    def __init__(self) -> None:
+        self.state: Literal['closed', 'open', 'half-open'] = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+
+
+class _CircuitBreaker:
+    """Per endpoint circuit breaker, which sheds load on failing endpoints.
+
+    Circuit of endpoint opens after number of consecutive transient failures. While
+    open, requests fail fast. After recovery time, circuit is half-open and a single
+    probe request is let through - its success closes the circuit, its failure opens
+    it again. Next probe is let through only after another recovery time, so probes
+    run at low rate even if probe request never finishes.
+
+    Attributes:
+        failure_threshold: Number of consecutive failures, which opens the circuit.
+        recovery_time: Time (in secs) before probe request is let through.
+    """
+
+    def __init__(self, failure_threshold: int = 10, recovery_time: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self._circuits: dict[str, _Circuit] = {}
+
+    def get_state(self, endpoint: str) -> Literal['closed', 'open', 'half-open']:
+        """Get circuit state of endpoint."""
+        circuit = self._circuits.get(endpoint)
+        return 'closed' if circuit is None else circuit.state
+
+    def check(self, endpoint: str) -> None:
+        """Raise CircuitOpenError, if request to endpoint is not let through."""
+        circuit = self._circuits.get(endpoint)
+
+        if circuit is None or circuit.state == 'closed':
+            return
+
+        now = monotonic()
+        wait_time = circuit.opened_at + self.recovery_time - now
+
+        if wait_time > 0:
+            _error(
+                msg=f'Circuit of {endpoint} is open, retry in {wait_time:.1f}s.',
+                err_cls=CircuitOpenError,
+            )
+
+        _logger.info(f'Circuit of {endpoint} is half-open, probing.')
+        circuit.state = 'half-open'
+        circuit.opened_at = now
+
+    def record_success(self, endpoint: str) -> None:
+        """Record successful request to endpoint, which closes its circuit."""
+        circuit = self._circuits.get(endpoint)
+
+        if circuit is None:
+            return
+
+        if circuit.state != 'closed':
+            _logger.info(f'Circuit of {endpoint} is closed.')
+
+        circuit.state = 'closed'
+        circuit.failures = 0
+
+    def record_failure(self, endpoint: str) -> None:
+        """Record transient failure of request to endpoint, which may open circuit."""
+        circuit = self._circuits.setdefault(endpoint, _Circuit())
+        circuit.failures += 1
+
+        if circuit.state == 'half-open' or (
+            circuit.state == 'closed' and circuit.failures >= self.failure_threshold
+        ):
+            _logger.warning(f'Circuit of {endpoint} is open.')
+            circuit.state = 'open'
+            circuit.opened_at = monotonic()
+
 
 class ClientBase:
     """Base for synchronous and asynchronous Client classes for Yahoo Finance API.
@@ -36,6 +182,8 @@ class ClientBase:
     Attributes:
         timeout: timeout (in secs) for each http request.
         max_retries: number of retries in case of failed request.
+        deadline: time budget (in secs) for each request including retries.
+        _circuit_breaker: per endpoint circuit breaker, None if disabled.
         _session:
             session instance, that is used for all http requests.
                 (Is lazily initialized.)
@@ -99,10 +247,66 @@ class ClientBase:
         'economicEventsRegionFilter': '',
     }
 
-    def __init__(self, timeout: float = 5.0, max_retries: int = 5) -> None:
+    # url templates with path params, formatted urls are mapped back to them
+    _URL_TEMPLATES = (
+        _CHART_URL,
+        _QUOTE_SUMMARY_URL,
+        _TIMESERIES_URL,
+        _OPTIONS_URL,
+        _RECOMMENDATIONS_URL,
+        _RATINGS_URL,
+    )
+
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_retries: int = 5,
+        deadline: float | None = None,
+        circuit_failure_threshold: int | None = None,
+        circuit_recovery_time: float = 30.0,
+    ) -> None:
         self.timeout = timeout
         self.max_retries = max_retries
+        self.deadline = deadline
         self._crumb: str | None = None
+        self._circuit_breaker = (
+            None
+            if circuit_failure_threshold is None
+            else _CircuitBreaker(circuit_failure_threshold, circuit_recovery_time)
+        )
+
+    @classmethod
+    def _get_endpoint(cls, url: str) -> str:
+        """Get endpoint (url template) of formatted url, e.g. for per endpoint stats."""
+        for template in cls._URL_TEMPLATES:
+            if url.startswith(template.split('{', 1)[0]):
+                return template
+
+        return url
+
+    def _check_circuit(self, endpoint: str) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.check(endpoint)
+
+    def _record_outcome(self, endpoint: str, response: Response | None) -> None:
+        """Record request outcome for circuit breaker, client errors mean success."""
+        if self._circuit_breaker is None:
+            return
+
+        if response is not None and (
+            response.status_code < 400
+            or (400 <= response.status_code <= 499 and response.status_code != 429)
+        ):
+            self._circuit_breaker.record_success(endpoint)
+
+        else:
+            self._circuit_breaker.record_failure(endpoint)
+
+    @staticmethod
+    def _get_json(response: Response) -> dict[str, Any]:
+        # record payload size at decode time for byte-budgeted response cache
+        _record_payload_size(len(response.content))
+        return response.json()  # type: ignore[no-untyped-call]
 
 
 class Client(ClientBase):
@@ -115,6 +319,8 @@ class Client(ClientBase):
     Attributes:
         timeout: timeout (in secs) for each http request.
         max_retries: number of retries in case of failed request.
+        deadline: time budget (in secs) for each request including retries.
+        _circuit_breaker: per endpoint circuit breaker, None if disabled.
         _session:
             session instance, that is used for all http requests.
                 (Is lazily initialized.)
@@ -136,14 +342,36 @@ class Client(ClientBase):
         get_calendar_event: Get calendar events.
     """
 
-    def __init__(self, timeout: float = 5.0, max_retries: int = 5) -> None:
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_retries: int = 5,
+        deadline: float | None = None,
+        circuit_failure_threshold: int | None = None,
+        circuit_recovery_time: float = 30.0,
+    ) -> None:
         """Create new Client instance.
 
         Args:
             timeout: timeout (in secs) for each http request.
             max_retries: number of retries in case of failed request.
+            deadline:
+                time budget (in secs) for each request including all retries and
+                backoff sleeps. (optional, default: None)
+            circuit_failure_threshold:
+                number of consecutive transient failures of endpoint, after which
+                requests to it fail fast, None to disable. (optional, default: None)
+            circuit_recovery_time:
+                time (in secs) before probe request to failing endpoint is let
+                through. (optional, default: 30.0)
         """
-        super().__init__(timeout, max_retries)
+        super().__init__(
+            timeout,
+            max_retries,
+            deadline,
+            circuit_failure_threshold,
+            circuit_recovery_time,
+        )
         self._session: Session[Any] | None = None
 
     def _get_session(self) -> None:
@@ -176,6 +404,7 @@ class Client(ClientBase):
         self.close()
 
     @_log_func
+    @_deadline_func
     def _get_request(
         self,
         url: str,
@@ -192,17 +421,35 @@ class Client(ClientBase):
         if headers is not None:
             kwargs['headers'] = headers
 
-        for attempt in range(1, self.max_retries + 1):
+        endpoint = self._get_endpoint(url)
+        response: Response | None = None
+        last_exc: RequestException | None = None
+        max_retries = _max_attempts.get() or self.max_retries
+
+        for attempt in range(1, max_retries + 1):
+            # fail fast on endpoint with open circuit, incl. remaining retries
+            self._check_circuit(endpoint)
+
             try:
-                _logger.debug(f'Request no. {attempt}/{self.max_retries} - started.')
+                _logger.debug(f'Request no. {attempt}/{max_retries} - started.')
+                response = None
+                remaining = _check_remaining()
+
+                if remaining is not None:
+                    # later attempts get only what is left of the budget
+                    kwargs['timeout'] = min(self.timeout, remaining)
+
                 self._get_session()
                 response = self._session.get(**kwargs)
                 response.raise_for_status()
-                _logger.debug(f'Request no. {attempt}/{self.max_retries} - succeeded.')
+                self._record_outcome(endpoint, response)
+                _logger.debug(f'Request no. {attempt}/{max_retries} - succeeded.')
                 return response
 
-            except (HTTPError, Timeout):
-                _logger.warning(f'Request no. {attempt}/{self.max_retries} - failed.')
+            except RequestException as exc:
+                last_exc = exc
+                _logger.warning(f'Request no. {attempt}/{max_retries} - failed.')
+                self._record_outcome(endpoint, response)
 
                 if (
                     response is not None
@@ -211,14 +458,27 @@ class Client(ClientBase):
                 ):
                     raise
 
+                if attempt == max_retries:
+                    break
+
                 wait_time = min(2**attempt, 60)  # Exponential backoff with cap
+                remaining = _get_remaining()
+
+                if remaining is not None and wait_time >= remaining:
+                    _error(
+                        msg=f'Deadline exceeded before retry in {wait_time}s.',
+                        err_cls=DeadlineExceededError,
+                    )
+
                 sleep(wait_time)
 
         # # gives RET503 ruff err
-        # # _error(msg=f'All {self.max_retries} requests failed.', err_cls=HTTPError)
-        msg = f'All {self.max_retries} requests failed.'
+        # # _error(msg=f'All {max_retries} requests failed.', err_cls=HTTPError)
+        msg = f'All {max_retries} requests failed.'
         _logger.error(msg)
-        raise HTTPError(msg)
+        raise RetriesExhaustedError(
+            msg, attempts=max_retries, response=response
+        ) from last_exc
 
     @lru_cache(maxsize=128)
     @_log_func
@@ -227,7 +487,8 @@ class Client(ClientBase):
             response = self._get_request(self._CRUMB_URL)
             self._crumb = response.text
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_chart(
         self,
@@ -284,15 +545,16 @@ class Client(ClientBase):
             params['includePrePost'] = include_pre_post
 
         if events is not None:
-            parsed_events = {e.strip() for e in events.split(',')}
+            parsed_events = _parse_csv(events)
             _check_events(parsed_events)
             # join parsed events, bcs they can be stripped
-            params['events'] = ','.join(parsed_events)
+            params['events'] = _join_csv(parsed_events)
 
         response = self._get_request(self._CHART_URL.format(ticker=ticker), params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_quote(
         self, tickers: str, include_pre_post: bool | None = None
@@ -300,7 +562,10 @@ class Client(ClientBase):
         """Get quote for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
             include_pre_post: Whether to include pre and post market.
 
         Returns: Quote response json including result and error.
@@ -318,15 +583,19 @@ class Client(ClientBase):
             params['includePrePost'] = include_pre_post
 
         response = self._get_request(self._QUOTE_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_quote_type(self, tickers: str) -> dict[str, Any]:
         """Get quote type for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
 
         Returns: Quote type response json including result and error.
 
@@ -338,9 +607,10 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS | self._QUOTE_TYPE_PARAMS | {'symbol': tickers}
         response = self._get_request(self._QUOTE_TYPE_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_quote_summary(self, ticker: str, modules: str) -> dict[str, Any]:
         """Get quote summary for the ticker.
@@ -355,7 +625,7 @@ class Client(ClientBase):
         """
         _logger.debug(f'Getting finance/quoteSummary for {ticker=}.')
 
-        parsed_modules = {m.strip() for m in modules.split(',')}
+        parsed_modules = _parse_csv(modules)
         _check_quote_summary_modules(parsed_modules)
 
         self._get_crumb()
@@ -365,15 +635,16 @@ class Client(ClientBase):
             | {
                 'crumb': self._crumb,
                 # join parsed modules, bcs they can be stripped
-                'modules': ','.join(parsed_modules),
+                'modules': _join_csv(parsed_modules),
             }
         )
 
         response = self._get_request(
             self._QUOTE_SUMMARY_URL.format(ticker=ticker), params
         )
-        return response.json()
+        return self._get_json(response)
 
+    @_canonical_args
     @_log_func
     def get_timeseries(
         self,
@@ -400,7 +671,7 @@ class Client(ClientBase):
             f'{types=}, {period1=}, {period2=}.'
         )
 
-        parsed_types = {t.strip() for t in types.split(',')}
+        parsed_types = _parse_csv(types)
         _check_types(parsed_types)
 
         params = (
@@ -408,7 +679,7 @@ class Client(ClientBase):
             | self._TIMESERIES_PARAMS
             | {
                 # join parsed types, bcs they can be stripped
-                'type': ','.join(parsed_types)
+                'type': _join_csv(parsed_types)
             }
         )
 
@@ -423,9 +694,10 @@ class Client(ClientBase):
         params['period2'] = int(period2)
 
         response = self._get_request(self._TIMESERIES_URL.format(ticker=ticker), params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_options(self, ticker: str) -> dict[str, Any]:
         """Get options for the ticker.
@@ -440,9 +712,10 @@ class Client(ClientBase):
         self._get_crumb()
         params = self._DEFAULT_PARAMS | self._OPTIONS_PARAMS | {'crumb': self._crumb}
         response = self._get_request(self._OPTIONS_URL.format(ticker=ticker), params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_search_args
+    @_sized_cache
     @_log_func
     def get_search(self, tickers: str) -> dict[str, Any]:
         """Get search results for tickers.
@@ -456,15 +729,19 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS | {'q': tickers}
         response = self._get_request(self._SEARCH_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_recommendations(self, tickers: str) -> dict[str, Any]:
         """Get analyst recommendations for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
 
         Returns: Recommendations response json including result and error.
         """
@@ -474,15 +751,19 @@ class Client(ClientBase):
         response = self._get_request(
             self._RECOMMENDATIONS_URL.format(tickers=tickers), params
         )
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_insights(self, tickers: str) -> dict[str, Any]:
         """Get insights for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
 
         Returns: Insights response json including result and error.
 
@@ -494,9 +775,10 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS | self._INSIGHTS_PARAMS | {'symbols': tickers}
         response = self._get_request(self._INSIGHTS_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_ratings(self, ticker: str) -> dict[str, Any]:
         """Get ratings for the ticker.
@@ -510,9 +792,10 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS | self._RATINGS_PARAMS
         response = self._get_request(self._RATINGS_URL.format(ticker=ticker), params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_market_summaries(self) -> dict[str, Any]:
         """Get market summaries.
@@ -523,9 +806,10 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS
         response = self._get_request(self._MARKET_SUMMARIES_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_trending(self) -> dict[str, Any]:
         """Get trending tickers.
@@ -536,9 +820,10 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS
         response = self._get_request(self._TRENDING_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @lru_cache(maxsize=128)
+    @_canonical_args
+    @_sized_cache
     @_log_func
     def get_currencies(self) -> dict[str, Any]:
         """Get currency exchange rates.
@@ -549,8 +834,9 @@ class Client(ClientBase):
 
         params = self._DEFAULT_PARAMS
         response = self._get_request(self._CURRENCIES_URL, params)
-        return response.json()
+        return self._get_json(response)
 
+    @_canonical_args
     @_log_func
     def get_calendar_events(
         self,
@@ -576,10 +862,10 @@ class Client(ClientBase):
         params = self._DEFAULT_PARAMS | self._CALENDAR_EVENTS_PARAMS
 
         if modules:
-            parsed_modules = {m.strip() for m in modules.split(',')}
+            parsed_modules = _parse_csv(modules)
             _check_calendar_event_modules(parsed_modules)
             # join parsed modules, bcs they can be stripped
-            params['modules'] = ','.join(parsed_modules)
+            params['modules'] = _join_csv(parsed_modules)
 
         if end_date is None:
             end_date = datetime.now().astimezone().timestamp() * 1000
@@ -594,7 +880,7 @@ class Client(ClientBase):
         params['startDate'] = int(start_date)
 
         response = self._get_request(self._CALENDAR_EVENTS_URL, params)
-        return response.json()
+        return self._get_json(response)
 
 
 class AsyncClient(ClientBase):
@@ -607,6 +893,10 @@ class AsyncClient(ClientBase):
     Attributes:
         timeout: timeout (in secs) for each http request.
         max_retries: number of retries in case of failed request.
+        deadline: time budget (in secs) for each request including retries.
+        _circuit_breaker: per endpoint circuit breaker, None if disabled.
+        hedge: whether to hedge slow requests.
+        hedge_max_ratio: max ratio of hedged (extra) requests to all requests.
         _session:
             session instance, that is used for all http requests.
                 (Is lazily initialized.)
@@ -628,14 +918,52 @@ class AsyncClient(ClientBase):
         get_calendar_event: Get calendar events.
     """
 
-    def __init__(self, timeout: float = 5.0, max_retries: int = 5) -> None:
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        max_retries: int = 5,
+        deadline: float | None = None,
+        circuit_failure_threshold: int | None = None,
+        circuit_recovery_time: float = 30.0,
+        hedge: bool = False,
+        hedge_quantile: float = 0.95,
+        hedge_max_ratio: float = 0.05,
+    ) -> None:
         """Create new AsynClient instance.
 
         Args:
             timeout: timeout (in secs) for each http request.
             max_retries: number of retries in case of failed request.
+            deadline:
+                time budget (in secs) for each request including all retries and
+                backoff sleeps. (optional, default: None)
+            circuit_failure_threshold:
+                number of consecutive transient failures of endpoint, after which
+                requests to it fail fast, None to disable. (optional, default: None)
+            circuit_recovery_time:
+                time (in secs) before probe request to failing endpoint is let
+                through. (optional, default: 30.0)
+            hedge:
+                whether to hedge slow requests - if response has not arrived within
+                latency quantile of the endpoint, identical request is sent and the
+                first response is taken. (optional, default: False)
+            hedge_quantile: latency quantile of endpoint, after which is request
+                hedged. (optional, default: 0.95)
+            hedge_max_ratio: max ratio of hedged (extra) requests to all requests.
+                (optional, default: 0.05)
         """
-        super().__init__(timeout, max_retries)
+        super().__init__(
+            timeout,
+            max_retries,
+            deadline,
+            circuit_failure_threshold,
+            circuit_recovery_time,
+        )
+        self.hedge = hedge
+        self.hedge_max_ratio = hedge_max_ratio
+        self._latency_tracker = _LatencyTracker(quantile=hedge_quantile)
+        self._request_count = 0
+        self._hedged_count = 0
         self._session: AsyncSession[Any] | None = None
 
     def _get_session(self) -> None:
@@ -668,6 +996,7 @@ class AsyncClient(ClientBase):
         await self.close()
 
     @_alog_func
+    @_adeadline_func
     async def _get_request(
         self,
         url: str,
@@ -684,17 +1013,35 @@ class AsyncClient(ClientBase):
         if headers is not None:
             kwargs['headers'] = headers
 
-        for attempt in range(1, self.max_retries + 1):
+        endpoint = self._get_endpoint(url)
+        response: Response | None = None
+        last_exc: RequestException | None = None
+        max_retries = _max_attempts.get() or self.max_retries
+
+        for attempt in range(1, max_retries + 1):
+            # fail fast on endpoint with open circuit, incl. remaining retries
+            self._check_circuit(endpoint)
+
             try:
-                _logger.debug(f'Request no. {attempt}/{self.max_retries} - started.')
+                _logger.debug(f'Request no. {attempt}/{max_retries} - started.')
+                response = None
+                remaining = _check_remaining()
+
+                if remaining is not None:
+                    # later attempts get only what is left of the budget
+                    kwargs['timeout'] = min(self.timeout, remaining)
+
                 self._get_session()
-                response = await self._session.get(**kwargs)
-                response.raise_for_status()
-                _logger.debug(f'Request no. {attempt}/{self.max_retries} - succeeded.')
+                response = await self._send(kwargs)
+                response.raise_for_status()  # type: ignore[no-untyped-call]
+                self._record_outcome(endpoint, response)
+                _logger.debug(f'Request no. {attempt}/{max_retries} - succeeded.')
                 return response
 
-            except (HTTPError, Timeout):
-                _logger.warning(f'Request no. {attempt}/{self.max_retries} - failed.')
+            except RequestException as exc:
+                last_exc = exc
+                _logger.warning(f'Request no. {attempt}/{max_retries} - failed.')
+                self._record_outcome(endpoint, response)
 
                 if (
                     response is not None
@@ -703,14 +1050,66 @@ class AsyncClient(ClientBase):
                 ):
                     raise
 
+                if attempt == max_retries:
+                    break
+
                 wait_time = min(2**attempt, 60)  # Exponential backoff with cap
+                remaining = _get_remaining()
+
+                if remaining is not None and wait_time >= remaining:
+                    _error(
+                        msg=f'Deadline exceeded before retry in {wait_time}s.',
+                        err_cls=DeadlineExceededError,
+                    )
+
                 await asyncio.sleep(wait_time)
 
         # # gives RET503 ruff err
-        # # _error(msg=f'All {self.max_retries} requests failed.', err_cls=HTTPError)
-        msg = f'All {self.max_retries} requests failed.'
+        # # _error(msg=f'All {max_retries} requests failed.', err_cls=HTTPError)
+        msg = f'All {max_retries} requests failed.'
         _logger.error(msg)
-        raise HTTPError(msg)
+        raise RetriesExhaustedError(
+            msg, attempts=max_retries, response=response
+        ) from last_exc
+
+    async def _send(self, kwargs: dict[str, Any]) -> Response:
+        if not self.hedge:
+            return await self._session.get(**kwargs)
+
+        endpoint = self._get_endpoint(kwargs['url'])
+        threshold = self._latency_tracker.get_threshold(endpoint)
+        self._request_count += 1
+        start = perf_counter()
+        tasks = {asyncio.ensure_future(self._session.get(**kwargs))}
+
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=threshold)
+
+            if (
+                not done
+                and self._hedged_count + 1 <= self.hedge_max_ratio * self._request_count
+            ):
+                _logger.debug(f'Hedging request to {endpoint} after {threshold}s.')
+                self._hedged_count += 1
+                tasks.add(asyncio.ensure_future(self._session.get(**kwargs)))
+
+            # first successful response wins, error only if all requests failed
+            while True:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                for task in done:
+                    if task.exception() is None:
+                        self._latency_tracker.add(endpoint, perf_counter() - start)
+                        return task.result()
+
+                if not tasks:
+                    return done.pop().result()
+
+        finally:
+            for task in tasks:
+                task.cancel()
 
     @alru_cache(maxsize=128)
     @_alog_func
@@ -719,7 +1118,8 @@ class AsyncClient(ClientBase):
             response = await self._get_request(self._CRUMB_URL)
             self._crumb = response.text
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_chart(
         self,
@@ -776,17 +1176,18 @@ class AsyncClient(ClientBase):
             params['includePrePost'] = include_pre_post
 
         if events is not None:
-            parsed_events = {e.strip() for e in events.split(',')}
+            parsed_events = _parse_csv(events)
             _check_events(parsed_events)
             # join parsed events, bcs they can be stripped
-            params['events'] = ','.join(parsed_events)
+            params['events'] = _join_csv(parsed_events)
 
         response = await self._get_request(
             self._CHART_URL.format(ticker=ticker), params
         )
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_quote(
         self, tickers: str, include_pre_post: bool | None = None
@@ -794,7 +1195,10 @@ class AsyncClient(ClientBase):
         """Get quote for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
             include_pre_post: Whether to include pre and post market.
 
         Returns: Quote response json including result and error.
@@ -812,15 +1216,19 @@ class AsyncClient(ClientBase):
             params['includePrePost'] = include_pre_post
 
         response = await self._get_request(self._QUOTE_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_quote_type(self, tickers: str) -> dict[str, Any]:
         """Get quote type for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
 
         Returns: Quote type response json including result and error.
 
@@ -832,9 +1240,10 @@ class AsyncClient(ClientBase):
 
         params = self._DEFAULT_PARAMS | self._QUOTE_TYPE_PARAMS | {'symbol': tickers}
         response = await self._get_request(self._QUOTE_TYPE_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_quote_summary(self, ticker: str, modules: str) -> dict[str, Any]:
         """Get quote summary for the ticker.
@@ -849,7 +1258,7 @@ class AsyncClient(ClientBase):
         """
         _logger.debug(f'Getting finance/quoteSummary for {ticker=}.')
 
-        parsed_modules = {m.strip() for m in modules.split(',')}
+        parsed_modules = _parse_csv(modules)
         _check_quote_summary_modules(parsed_modules)
 
         await self._get_crumb()
@@ -859,15 +1268,16 @@ class AsyncClient(ClientBase):
             | {
                 'crumb': self._crumb,
                 # join parsed modules, bcs they can be stripped
-                'modules': ','.join(parsed_modules),
+                'modules': _join_csv(parsed_modules),
             }
         )
 
         response = await self._get_request(
             self._QUOTE_SUMMARY_URL.format(ticker=ticker), params
         )
-        return response.json()
+        return self._get_json(response)
 
+    @_canonical_args
     @_alog_func
     async def get_timeseries(
         self,
@@ -894,7 +1304,7 @@ class AsyncClient(ClientBase):
             f'{types=}, {period1=}, {period2=}.'
         )
 
-        parsed_types = {t.strip() for t in types.split(',')}
+        parsed_types = _parse_csv(types)
         _check_types(parsed_types)
 
         params = (
@@ -902,7 +1312,7 @@ class AsyncClient(ClientBase):
             | self._TIMESERIES_PARAMS
             | {
                 # join parsed types, bcs they can be stripped
-                'type': ','.join(parsed_types)
+                'type': _join_csv(parsed_types)
             }
         )
 
@@ -919,9 +1329,10 @@ class AsyncClient(ClientBase):
         response = await self._get_request(
             self._TIMESERIES_URL.format(ticker=ticker), params
         )
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_options(self, ticker: str) -> dict[str, Any]:
         """Get options for the ticker.
@@ -938,9 +1349,10 @@ class AsyncClient(ClientBase):
         response = await self._get_request(
             self._OPTIONS_URL.format(ticker=ticker), params
         )
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_search_args
+    @_async_sized_cache
     @_alog_func
     async def get_search(self, tickers: str) -> dict[str, Any]:
         """Get search results for tickers.
@@ -954,15 +1366,19 @@ class AsyncClient(ClientBase):
 
         params = self._DEFAULT_PARAMS | {'q': tickers}
         response = await self._get_request(self._SEARCH_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_recommendations(self, tickers: str) -> dict[str, Any]:
         """Get analyst recommendations for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
 
         Returns: Recommendations response json including result and error.
         """
@@ -972,15 +1388,19 @@ class AsyncClient(ClientBase):
         response = await self._get_request(
             self._RECOMMENDATIONS_URL.format(tickers=tickers), params
         )
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_insights(self, tickers: str) -> dict[str, Any]:
         """Get insights for tickers.
 
         Args:
-            tickers: Comma-separated ticker symbols.
+            tickers:
+                Comma-separated ticker symbols, deduplicated and sorted into
+                canonical form shared by the response cache, so results do not
+                follow their input order.
 
         Returns: Insights response json including result and error.
 
@@ -992,9 +1412,10 @@ class AsyncClient(ClientBase):
 
         params = self._DEFAULT_PARAMS | self._INSIGHTS_PARAMS | {'symbols': tickers}
         response = await self._get_request(self._INSIGHTS_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_ratings(self, ticker: str) -> dict[str, Any]:
         """Get ratings for the ticker.
@@ -1010,9 +1431,10 @@ class AsyncClient(ClientBase):
         response = await self._get_request(
             self._RATINGS_URL.format(ticker=ticker), params
         )
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_market_summaries(self) -> dict[str, Any]:
         """Get market summaries.
@@ -1023,9 +1445,10 @@ class AsyncClient(ClientBase):
 
         params = self._DEFAULT_PARAMS
         response = await self._get_request(self._MARKET_SUMMARIES_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_trending(self) -> dict[str, Any]:
         """Get trending tickers.
@@ -1036,9 +1459,10 @@ class AsyncClient(ClientBase):
 
         params = self._DEFAULT_PARAMS
         response = await self._get_request(self._TRENDING_URL, params)
-        return response.json()
+        return self._get_json(response)
 
-    @alru_cache(maxsize=128)
+    @_canonical_args
+    @_async_sized_cache
     @_alog_func
     async def get_currencies(self) -> dict[str, Any]:
         """Get currency exchange rates.
@@ -1049,8 +1473,9 @@ class AsyncClient(ClientBase):
 
         params = self._DEFAULT_PARAMS
         response = await self._get_request(self._CURRENCIES_URL, params)
-        return response.json()
+        return self._get_json(response)
 
+    @_canonical_args
     @_alog_func
     async def get_calendar_events(
         self,
@@ -1076,10 +1501,10 @@ class AsyncClient(ClientBase):
         params = self._DEFAULT_PARAMS | self._CALENDAR_EVENTS_PARAMS
 
         if modules:
-            parsed_modules = {m.strip() for m in modules.split(',')}
+            parsed_modules = _parse_csv(modules)
             _check_calendar_event_modules(parsed_modules)
             # join parsed modules, bcs they can be stripped
-            params['modules'] = ','.join(parsed_modules)
+            params['modules'] = _join_csv(parsed_modules)
 
         if end_date is None:
             end_date = datetime.now().astimezone().timestamp() * 1000
@@ -1094,7 +1519,7 @@ class AsyncClient(ClientBase):
         params['startDate'] = int(start_date)
 
         response = await self._get_request(self._CALENDAR_EVENTS_URL, params)
-        return response.json()
+        return self._get_json(response)
 
 
 class _SingletonClientManager:
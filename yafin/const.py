@@ -19,7 +19,9 @@ PERIOD_RANGES = {'1d', '5d', '1mo', '3mo', '6mo', '1y', '2y', '5y', '10y', 'ytd'
 
 EVENTS_SET = {'div', 'split', 'earn', 'capitalGain'}
 
-EVENTS = ','.join(EVENTS_SET)
+# csv constants are joined from sorted sets, so they (and request urls built from
+# them) are the same across processes regardless of str hash randomization
+EVENTS = ','.join(sorted(EVENTS_SET))
 
 QUOTE_SUMMARY_MODULES_SET = {
     'quoteType',
@@ -61,11 +63,11 @@ QUOTE_SUMMARY_MODULES_SET = {
     # 'fundPerformance'
 }
 
-QUOTE_SUMMARY_MODULES = ','.join(QUOTE_SUMMARY_MODULES_SET)
+QUOTE_SUMMARY_MODULES = ','.join(sorted(QUOTE_SUMMARY_MODULES_SET))
 
 CALENDAR_EVENT_MODULES_SET = {'ipoEvents', 'secReports', 'earnings', 'economicEvents'}
 
-CALENDAR_EVENT_MODULES = ','.join(CALENDAR_EVENT_MODULES_SET)
+CALENDAR_EVENT_MODULES = ','.join(sorted(CALENDAR_EVENT_MODULES_SET))
 
 FREQUENCIES = {'annual', 'quarterly', 'trailing'}
 
@@ -479,39 +481,41 @@ _TYPES = {
     'other': OTHER_TYPES_SET,
 }
 
-OTHER_TYPES = ','.join(OTHER_TYPES_SET)
+OTHER_TYPES = ','.join(sorted(OTHER_TYPES_SET))
 
 ANNUAL_INCOME_STATEMENT_TYPES_SET = {
     f'annual{typ}' for typ in INCOME_STATEMENT_TYPES_SET
 }
-ANNUAL_INCOME_STATEMENT_TYPES = ','.join(ANNUAL_INCOME_STATEMENT_TYPES_SET)
+ANNUAL_INCOME_STATEMENT_TYPES = ','.join(sorted(ANNUAL_INCOME_STATEMENT_TYPES_SET))
 
 QUARTERLY_INCOME_STATEMENT_TYPES_SET = {
     f'quarterly{typ}' for typ in INCOME_STATEMENT_TYPES_SET
 }
-QUARTERLY_INCOME_STATEMENT_TYPES = ','.join(QUARTERLY_INCOME_STATEMENT_TYPES_SET)
+QUARTERLY_INCOME_STATEMENT_TYPES = ','.join(
+    sorted(QUARTERLY_INCOME_STATEMENT_TYPES_SET)
+)
 
 TRAILING_INCOME_STATEMENT_TYPES_SET = {
     f'trailing{typ}' for typ in INCOME_STATEMENT_TYPES_SET
 }
-TRAILING_INCOME_STATEMENT_TYPES = ','.join(TRAILING_INCOME_STATEMENT_TYPES_SET)
+TRAILING_INCOME_STATEMENT_TYPES = ','.join(sorted(TRAILING_INCOME_STATEMENT_TYPES_SET))
 
 ANNUAL_BALANCE_SHEET_TYPES_SET = {f'annual{typ}' for typ in BALANCE_SHEET_TYPES_SET}
-ANNUAL_BALANCE_SHEET_TYPES = ','.join(ANNUAL_BALANCE_SHEET_TYPES_SET)
+ANNUAL_BALANCE_SHEET_TYPES = ','.join(sorted(ANNUAL_BALANCE_SHEET_TYPES_SET))
 
 QUARTERLY_BALANCE_SHEET_TYPES_SET = {
     f'quarterly{typ}' for typ in BALANCE_SHEET_TYPES_SET
 }
-QUARTERLY_BALANCE_SHEET_TYPES = ','.join(QUARTERLY_BALANCE_SHEET_TYPES_SET)
+QUARTERLY_BALANCE_SHEET_TYPES = ','.join(sorted(QUARTERLY_BALANCE_SHEET_TYPES_SET))
 
 ANNUAL_CASH_FLOW_TYPES_SET = {f'annual{typ}' for typ in CASH_FLOW_TYPES_SET}
-ANNUAL_CASH_FLOW_TYPES = ','.join(ANNUAL_CASH_FLOW_TYPES_SET)
+ANNUAL_CASH_FLOW_TYPES = ','.join(sorted(ANNUAL_CASH_FLOW_TYPES_SET))
 
 QUARTERLY_CASH_FLOW_TYPES_SET = {f'quarterly{typ}' for typ in CASH_FLOW_TYPES_SET}
-QUARTERLY_CASH_FLOW_TYPES = ','.join(QUARTERLY_CASH_FLOW_TYPES_SET)
+QUARTERLY_CASH_FLOW_TYPES = ','.join(sorted(QUARTERLY_CASH_FLOW_TYPES_SET))
 
 TRAILING_CASH_FLOW_TYPES_SET = {f'trailing{typ}' for typ in CASH_FLOW_TYPES_SET}
-TRAILING_CASH_FLOW_TYPES = ','.join(TRAILING_CASH_FLOW_TYPES_SET)
+TRAILING_CASH_FLOW_TYPES = ','.join(sorted(TRAILING_CASH_FLOW_TYPES_SET))
 
 
 _ALL_TYPES_SET = (
@@ -0,0 +1,80 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from time import monotonic
+from typing import Any
+
+from .exceptions import DeadlineExceededError
+from .utils import _error
+
+# absolute monotonic time, by which all requests in current context must finish,
+# copied into tasks created in the context, so it propagates through fan-outs
+_deadline: ContextVar[float | None] = ContextVar('_deadline', default=None)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bound all requests made within the block by one time budget.
+
+    The budget covers every attempt and backoff sleep of every request, including
+    Symbols fan-outs and tasks created within the block. Nested deadlines can only
+    shorten the budget.
+
+    Args:
+        seconds: Time budget in seconds, None for no (additional) budget.
+
+    Raises:
+        DeadlineExceededError: From requests, that would not finish in the budget.
+    """
+    if seconds is None:
+        yield
+        return
+
+    current = _deadline.get()
+    new = monotonic() + seconds
+    token = _deadline.set(new if current is None else min(current, new))
+
+    try:
+        yield
+
+    finally:
+        _deadline.reset(token)
+
+
+def _get_remaining() -> float | None:
+    """Get remaining budget (in secs) of current deadline, None if there is none."""
+    current = _deadline.get()
+    return None if current is None else current - monotonic()
+
+
+def _check_remaining() -> float | None:
+    """Get remaining budget, raise if already exceeded."""
+    remaining = _get_remaining()
+
+    if remaining is not None and remaining <= 0:
+        _error(msg='Deadline exceeded.', err_cls=DeadlineExceededError)
+
+    return remaining
+
+
+def _deadline_func(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator for client methods, bounding each call by client deadline attr."""
+
+    @wraps(func)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with deadline(self.deadline):
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _adeadline_func(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator for async client methods, bounding each call by client deadline."""
+
+    @wraps(func)
+    async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with deadline(self.deadline):
+            return await func(self, *args, **kwargs)
+
+    return async_wrapper
@@ -0,0 +1,410 @@
+import asyncio
+import json
+import logging
+import os
+import pathlib
+import sys
+from time import monotonic
+from typing import Any, NamedTuple, TextIO
+
+from .client import _SingletonAsyncClientManager
+from .exceptions import _REQUEST_ERRORS, TrailingBalanceSheetError
+from .symbol import AsyncSymbol
+from .utils import (
+    _check_frequency,
+    _check_interval,
+    _check_period_range,
+    _error,
+    _normalize_ticker,
+)
+
+logger = logging.getLogger(__name__)
+
+FINANCIALS_ENDPOINTS = ('income_statement', 'balance_sheet', 'cash_flow')
+ENDPOINTS = ('chart', *FINANCIALS_ENDPOINTS)
+MANIFEST_FILE_NAME = 'manifest.jsonl'
+
+
+class DownloadJob(NamedTuple):
+    """Single download job - one request for one ticker.
+
+    Attributes:
+        ticker: Ticker symbol.
+        endpoint: chart, income_statement, balance_sheet or cash_flow.
+        partition: Partition path (relative to output dir), e.g. chart/1d/1y.
+        kwargs: Keyword arguments for AsyncSymbol method.
+    """
+
+    ticker: str
+    endpoint: str
+    partition: str
+    kwargs: dict[str, Any]
+
+    @property
+    def key(self) -> str:
+        """Unique job key, used in manifest."""
+        return f'{self.partition}/{self.ticker}'
+
+
+class DownloadStats(NamedTuple):
+    """Download run statistics.
+
+    Attributes:
+        total: number of all jobs.
+        skipped: number of jobs completed in previous runs.
+        succeeded: number of jobs completed in this run.
+        failed: number of failed jobs, which will be retried in next run.
+        elapsed: run duration in seconds.
+    """
+
+    total: int
+    skipped: int
+    succeeded: int
+    failed: int
+    elapsed: float
+
+
+class _RateLimiter:
+    """Limits rate of job starts to given number per second."""
+
+    def __init__(self, rate: float | None = None) -> None:
+        self._interval = 1 / rate if rate else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+
+        async with self._lock:
+            wait_time = self._next_start - monotonic()
+
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+            self._next_start = max(monotonic(), self._next_start) + self._interval
+
+
+class _Manifest:
+    """Append-only manifest of completed job keys in output dir."""
+
+    def __init__(self, output_dir: pathlib.Path) -> None:
+        self._path = output_dir.joinpath(MANIFEST_FILE_NAME)
+        self.completed: set[str] = set()
+
+        if not self._path.exists():
+            return
+
+        lines = [line for line in self._path.read_text().splitlines() if line.strip()]
+        valid_lines = []
+
+        for line in lines:
+            try:
+                self.completed.add(json.loads(line)['key'])
+                valid_lines.append(line)
+
+            except (ValueError, KeyError, TypeError):
+                # e.g. half-written last line of interrupted run
+                logger.warning(f'Dropping malformed manifest line {line!r}.')
+
+        if len(valid_lines) < len(lines):
+            # rewritten, so next added key does not continue the malformed line
+            tmp_path = self._path.with_suffix('.tmp')
+            tmp_path.write_text(''.join(f'{line}\n' for line in valid_lines))
+            os.replace(tmp_path, self._path)
+
+    def add(self, job: DownloadJob) -> None:
+        with self._path.open('a') as f:
+            f.write(json.dumps({'key': job.key}) + '\n')
+
+        self.completed.add(job.key)
+
+
+class _Progress:
+    """Prints live throughput of download run."""
+
+    def __init__(self, total: int, stream: TextIO | None, interval: float = 0.5):
+        self.total = total
+        self.succeeded = 0
+        self.failed = 0
+        self._stream = stream
+        self._interval = interval
+        self._start = monotonic()
+        self._last_print = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return monotonic() - self._start
+
+    def update(self, succeeded: bool) -> None:
+        if succeeded:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+        if monotonic() - self._last_print >= self._interval:
+            self.print()
+
+    def print(self, end: str = '') -> None:
+        if self._stream is None:
+            return
+
+        done = self.succeeded + self.failed
+        rate = done / self.elapsed if self.elapsed else 0.0
+        self._stream.write(
+            f'\r{done}/{self.total} jobs, {self.failed} failed, {rate:.1f} jobs/s{end}'
+        )
+        self._stream.flush()
+        self._last_print = monotonic()
+
+
+def read_tickers(path: str | os.PathLike[str]) -> list[str]:
+    """Read tickers file.
+
+    Args:
+        path:
+            Path to file with tickers - one or more comma-separated per line, lines
+            starting with # are ignored.
+
+    Returns: Normalized and deduplicated tickers in file order.
+    """
+    tickers: dict[str, None] = {}
+
+    for line in pathlib.Path(path).read_text().splitlines():
+        if line.strip().startswith('#'):
+            continue
+
+        for ticker in line.split(','):
+            if ticker.strip():
+                tickers[_normalize_ticker(ticker)] = None
+
+    return list(tickers)
+
+
+def build_jobs(
+    tickers: list[str],
+    endpoints: tuple[str, ...] = ENDPOINTS,
+    intervals: tuple[str, ...] = ('1d',),
+    period_ranges: tuple[str, ...] = ('1y',),
+    frequency: str = 'annual',
+) -> list[DownloadJob]:
+    """Build download jobs for each ticker and spec combination.
+
+    Args:
+        tickers: Ticker symbols.
+        endpoints: chart, income_statement, balance_sheet and/or cash_flow.
+        intervals: Chart data intervals.
+        period_ranges: Chart ranges of the period.
+        frequency: Financials frequency - annual, quarterly or trailing.
+
+    Returns: List of download jobs.
+
+    Raises:
+        ValueError: If any of the spec values are not in list of valid values.
+        TrailingBalanceSheetError: If trailing frequency is used for balance sheet.
+    """
+    for endpoint in endpoints:
+        if endpoint not in ENDPOINTS:
+            _error(
+                msg=f'Invalid {endpoint=}. Valid values: {ENDPOINTS}',
+                err_cls=ValueError,
+            )
+
+        if endpoint in FINANCIALS_ENDPOINTS:
+            _check_frequency(endpoint, frequency)
+
+    for interval in intervals:
+        _check_interval(interval)
+
+    for period_range in period_ranges:
+        _check_period_range(period_range)
+
+    jobs: list[DownloadJob] = []
+
+    for ticker in tickers:
+        for endpoint in endpoints:
+            if endpoint == 'chart':
+                jobs.extend(
+                    DownloadJob(
+                        ticker,
+                        endpoint,
+                        f'{endpoint}/{interval}/{period_range}',
+                        {'interval': interval, 'period_range': period_range},
+                    )
+                    for interval in intervals
+                    for period_range in period_ranges
+                )
+
+            else:
+                jobs.append(
+                    DownloadJob(
+                        ticker,
+                        endpoint,
+                        f'{endpoint}/{frequency}',
+                        {'frequency': frequency},
+                    )
+                )
+
+    return jobs
+
+
+def _write_json(path: pathlib.Path, data: Any) -> None:
+    """Write json atomically - partial files are never left behind."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f'{path.name}.tmp')
+    tmp_path.write_text(json.dumps(data))
+    os.replace(tmp_path, path)
+
+
+async def _run_job(job: DownloadJob, output_dir: pathlib.Path) -> None:
+    symbol = AsyncSymbol(job.ticker)
+
+    try:
+        method = getattr(symbol, f'get_{job.endpoint}')
+        result = await method(**job.kwargs)
+
+    finally:
+        await symbol.close()
+
+    _write_json(output_dir.joinpath(job.partition, f'{job.ticker}.json'), result)
+
+
+async def download(
+    jobs: list[DownloadJob],
+    output_dir: str | os.PathLike[str],
+    concurrency: int = 8,
+    rate: float | None = None,
+    progress_stream: TextIO | None = None,
+) -> DownloadStats:
+    """Download jobs into partitioned json files, resuming previous runs.
+
+    Each completed job is written to output_dir/<partition>/<ticker>.json and its
+    key is appended to the manifest, so jobs completed in previous runs are skipped.
+
+    Args:
+        jobs: Download jobs, see build_jobs.
+        output_dir: Output directory for partitioned files and manifest.
+        concurrency: Max number of concurrently running jobs.
+        rate: Max number of started jobs per second. (optional, default: no limit)
+        progress_stream: Stream for live throughput. (optional, default: None)
+
+    Returns: Download run statistics.
+    """
+    output_path = pathlib.Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    manifest = _Manifest(output_path)
+    pending_jobs = [j for j in jobs if j.key not in manifest.completed]
+    skipped = len(jobs) - len(pending_jobs)
+    logger.info(f'Downloading {len(pending_jobs)} jobs, skipping {skipped} done.')
+
+    semaphore = asyncio.Semaphore(concurrency)
+    rate_limiter = _RateLimiter(rate)
+    progress = _Progress(len(pending_jobs), progress_stream)
+
+    async def run(job: DownloadJob) -> None:
+        async with semaphore:
+            await rate_limiter.acquire()
+
+            try:
+                await _run_job(job, output_path)
+
+            except _REQUEST_ERRORS as exc:
+                # failed job is not checkpointed, so it is retried in next run
+                logger.warning(f'Job {job.key} failed: {exc!r}')
+                progress.update(succeeded=False)
+                return
+
+            manifest.add(job)
+            progress.update(succeeded=True)
+
+    # hold the client singleton for the whole run, so it is not closed and
+    # recreated (incl. crumb) whenever no job is running
+    _SingletonAsyncClientManager._get_client()
+
+    try:
+        await asyncio.gather(*(run(job) for job in pending_jobs))
+
+    finally:
+        await _SingletonAsyncClientManager._release_client()
+        progress.print(end='\n')
+
+    return DownloadStats(
+        len(jobs), skipped, progress.succeeded, progress.failed, progress.elapsed
+    )
+
+
+def _split_csv_arg(value: str) -> tuple[str, ...]:
+    return tuple(v.strip() for v in value.split(',') if v.strip())
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run download command line interface.
+
+    Args:
+        argv: Command line arguments. (optional, default: sys.argv[1:])
+
+    Returns: Exit code - 0 if all jobs succeeded, 1 otherwise.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog='python -m yafin download',
+        description='Download charts and financials for tickers from file.',
+    )
+    parser.add_argument('tickers_file', help='file with tickers, one or more per line')
+    parser.add_argument('output_dir', help='output dir for files and manifest')
+    parser.add_argument(
+        '--endpoints',
+        type=_split_csv_arg,
+        default=ENDPOINTS,
+        help=f'comma-separated endpoints (default: {",".join(ENDPOINTS)})',
+    )
+    parser.add_argument(
+        '--intervals',
+        type=_split_csv_arg,
+        default=('1d',),
+        help='comma-separated chart intervals (default: 1d)',
+    )
+    parser.add_argument(
+        '--ranges',
+        type=_split_csv_arg,
+        default=('1y',),
+        help='comma-separated chart ranges (default: 1y)',
+    )
+    parser.add_argument(
+        '--frequency', default='annual', help='financials frequency (default: annual)'
+    )
+    parser.add_argument(
+        '--concurrency', type=int, default=8, help='max concurrent jobs (default: 8)'
+    )
+    parser.add_argument(
+        '--rate', type=float, default=None, help='max started jobs per second'
+    )
+    args = parser.parse_args(argv)
+
+    tickers = read_tickers(args.tickers_file)
+
+    try:
+        jobs = build_jobs(
+            tickers, args.endpoints, args.intervals, args.ranges, args.frequency
+        )
+
+    except (ValueError, TrailingBalanceSheetError) as exc:
+        parser.error(str(exc))
+
+    stats = asyncio.run(
+        download(
+            jobs,
+            args.output_dir,
+            concurrency=args.concurrency,
+            rate=args.rate,
+            progress_stream=sys.stderr,
+        )
+    )
+    print(
+        f'{stats.succeeded} succeeded, {stats.failed} failed, {stats.skipped} skipped '
+        f'of {stats.total} jobs in {stats.elapsed:.1f}s.',
+        file=sys.stderr,
+    )
+    return 1 if stats.failed else 0
@@ -1,4 +1,45 @@
+from typing import Any
+
+from curl_cffi.requests.exceptions import HTTPError
+
+
 class TrailingBalanceSheetError(Exception):
     """Exception for using trailing frequency for balance sheet types."""
 
     pass
+
+
+class DeadlineExceededError(TimeoutError):
+    """Exception for exceeding deadline (time budget) of the call."""
+
+
+class CircuitOpenError(Exception):
+    """Exception for failing fast on endpoint, which circuit breaker is open."""
+
+
+class RetriesExhaustedError(HTTPError):
+    """Exception for failing all attempts of the request, with transient errors.
+
+    Attributes:
+        attempts: Number of attempts made by the client.
+    """
+
+    def __init__(self, msg: str, attempts: int, response: Any = None) -> None:
+        """Create new RetriesExhaustedError.
+
+        Args:
+            msg: Error message.
+            attempts: Number of attempts made by the client.
+            response: Response of the last attempt, None if it got no response.
+        """
+        super().__init__(msg, response=response)
+        self.attempts = attempts
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle without the response, e.g. for errors of executor workers."""
+        return type(self), (self.args[0], self.attempts)
+
+
+# errors of failed request (incl. deadline) or of parsing its unexpected response,
+# which are recorded per ticker or job instead of stopping the whole run
+_REQUEST_ERRORS = (OSError, CircuitOpenError, KeyError, TypeError, ValueError)
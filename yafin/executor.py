@@ -0,0 +1,325 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+from collections.abc import Callable, Iterator
+from time import monotonic, sleep
+from typing import Any, NamedTuple
+
+from .client import _SingletonAsyncClientManager
+from .exceptions import _REQUEST_ERRORS
+from .symbol import AsyncSymbol
+from .utils import _error, _get_chart_array, _import_numpy, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+
+class ShardResult(NamedTuple):
+    """Result of a single ticker, streamed back from a worker process.
+
+    Attributes:
+        ticker: Ticker symbol.
+        result: Result of the AsyncSymbol method (reduced, if reducer is given), None
+            if it failed.
+        error: Error message if the AsyncSymbol method failed, None otherwise.
+    """
+
+    ticker: str
+    result: Any
+    error: str | None
+
+
+class ChartColumns(NamedTuple):
+    """Chart result reduced into numpy columns, compact result of a worker process.
+
+    Attributes:
+        meta: Chart meta.
+        timestamp: Int numpy array of bar timestamps in seconds.
+        open: Float numpy array of open prices, NaN for bars without data.
+        high: Float numpy array of high prices.
+        low: Float numpy array of low prices.
+        close: Float numpy array of close prices.
+        volume: Float numpy array of volumes.
+    """
+
+    meta: dict[str, Any]
+    timestamp: Any
+    open: Any
+    high: Any
+    low: Any
+    close: Any
+    volume: Any
+
+
+def chart_columns(chart: dict[str, Any]) -> ChartColumns:
+    """Reduce chart result into numpy columns, reducer of ShardedExecutor.map.
+
+    Numpy arrays are pickled as raw buffers, so the result is sent from worker
+    process at about memcpy cost instead of pickling each value of the chart
+    lists. Events and adjusted close are not kept. Requires numpy.
+
+    Args:
+        chart: Chart result, e.g. from AsyncSymbol.get_chart.
+
+    Returns: Chart meta and OHLCV columns.
+    """
+    np = _import_numpy()
+    return ChartColumns(
+        chart.get('meta', {}),
+        _get_chart_array(chart, 'timestamp').astype(np.int64),
+        *(
+            _get_chart_array(chart, field)
+            for field in ('open', 'high', 'low', 'close', 'volume')
+        ),
+    )
+
+
+class _SharedRateLimiter:
+    """Limits rate of requests to given number per second across processes.
+
+    Next allowed start time is kept in shared memory, so all worker processes draw
+    from one global budget.
+    """
+
+    def __init__(self, next_start: Any, rate: float | None = None) -> None:
+        self._next_start = next_start
+        self._interval = 1 / rate if rate else 0.0
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+
+        with self._next_start.get_lock():
+            now = monotonic()
+            start = max(now, self._next_start.value)
+            self._next_start.value = start + self._interval
+
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+async def _run_shard(
+    tickers: list[str],
+    method_name: str,
+    kwargs: dict[str, Any],
+    reducer: Callable[[Any], Any] | None,
+    concurrency: int,
+    rate_limiter: _SharedRateLimiter,
+    result_queue: Any,
+) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(ticker: str) -> None:
+        async with semaphore:
+            await rate_limiter.acquire()
+            symbol = AsyncSymbol(ticker)
+
+            try:
+                result = await getattr(symbol, method_name)(**kwargs)
+
+                if reducer is not None:
+                    result = reducer(result)
+
+            except _REQUEST_ERRORS as exc:
+                # exceptions are not guaranteed to be picklable, send message only
+                result_queue.put(ShardResult(ticker, None, repr(exc)))
+
+            else:
+                result_queue.put(ShardResult(ticker, result, None))
+
+            finally:
+                await symbol.close()
+
+    # each worker process owns its AsyncClient singleton, held for the whole shard
+    _SingletonAsyncClientManager._get_client()
+
+    try:
+        await asyncio.gather(*(run(ticker) for ticker in tickers))
+
+    finally:
+        await _SingletonAsyncClientManager._release_client()
+
+
+def _worker(
+    tickers: list[str],
+    method_name: str,
+    kwargs: dict[str, Any],
+    reducer: Callable[[Any], Any] | None,
+    concurrency: int,
+    next_start: Any,
+    rate: float | None,
+    result_queue: Any,
+) -> None:
+    """Worker process entry point, None is put to queue as end of shard marker."""
+    try:
+        rate_limiter = _SharedRateLimiter(next_start, rate)
+        asyncio.run(
+            _run_shard(
+                tickers,
+                method_name,
+                kwargs,
+                reducer,
+                concurrency,
+                rate_limiter,
+                result_queue,
+            )
+        )
+
+    finally:
+        result_queue.put(None)
+
+
+class ShardedExecutor:
+    """Executes AsyncSymbol methods for large ticker universes in worker processes.
+
+    Tickers are sharded across worker processes, each running its own event loop
+    and AsyncClient, so JSON decoding and result unwrapping scale with cores.
+    Results are streamed back as they complete and all workers share one global
+    rate limit.
+
+    Attributes:
+        processes: Number of worker processes.
+        concurrency: Max number of concurrent requests per worker process.
+        rate: Max number of requests per second across all worker processes.
+    """
+
+    def __init__(
+        self,
+        processes: int | None = None,
+        concurrency: int = 8,
+        rate: float | None = None,
+        mp_context: str = 'spawn',
+    ) -> None:
+        """Create new ShardedExecutor instance.
+
+        Args:
+            processes: Number of worker processes. (optional, default: cpu count)
+            concurrency: Max number of concurrent requests per worker process.
+            rate: Max number of requests per second across all worker processes.
+                (optional, default: no limit)
+            mp_context: Multiprocessing start method. (optional, default: spawn)
+        """
+        self.processes = processes or os.cpu_count() or 1
+        self.concurrency = concurrency
+        self.rate = rate
+        # BaseContext stubs lack Process, which all concrete contexts provide
+        self._ctx: Any = multiprocessing.get_context(mp_context)
+
+    def map(
+        self,
+        method_name: str,
+        tickers: str | list[str],
+        reducer: Callable[[Any], Any] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[ShardResult]:
+        """Call AsyncSymbol method for each ticker and stream results back.
+
+        Results are pickled to the main process, which costs about as much as
+        decoding their json, so pass reducer to send back only what is needed,
+        e.g. chart_columns for get_chart.
+
+        Args:
+            method_name: AsyncSymbol method name, e.g. get_chart.
+            tickers: Comma-separated string or list of ticker symbols.
+            reducer:
+                Picklable (module level) function applied to each result in worker
+                process, e.g. chart_columns. (optional, default: None)
+            **kwargs: Keyword arguments passed to the AsyncSymbol method.
+
+        Returns: Iterator of ShardResult for each ticker in order of completion.
+
+        Raises:
+            ValueError: If method_name is not AsyncSymbol get method.
+            RuntimeError:
+                If worker process dies before finishing its shard, raised while
+                iterating.
+        """
+        if not method_name.startswith('get_') or not hasattr(AsyncSymbol, method_name):
+            _error(msg=f'Invalid {method_name=}.', err_cls=ValueError)
+
+        if isinstance(tickers, str):
+            tickers = tickers.split(',')
+
+        ticker_list = list(
+            dict.fromkeys(_normalize_ticker(t) for t in tickers if t.strip())
+        )
+        # round-robin sharding, so alphabetically sorted universes spread evenly
+        shards = [
+            shard
+            for i in range(self.processes)
+            if (shard := ticker_list[i :: self.processes])
+        ]
+        return self._map(method_name, shards, kwargs, reducer)
+
+    def _map(
+        self,
+        method_name: str,
+        shards: list[list[str]],
+        kwargs: dict[str, Any],
+        reducer: Callable[[Any], Any] | None,
+    ) -> Iterator[ShardResult]:
+        result_queue = self._ctx.Queue()
+        next_start = self._ctx.Value('d', 0.0)
+        workers = [
+            self._ctx.Process(
+                target=_worker,
+                args=(
+                    shard,
+                    method_name,
+                    kwargs,
+                    reducer,
+                    self.concurrency,
+                    next_start,
+                    self.rate,
+                    result_queue,
+                ),
+                daemon=True,
+            )
+            for shard in shards
+        ]
+
+        for worker in workers:
+            worker.start()
+
+        ticker_count = sum(len(shard) for shard in shards)
+        logger.debug(f'Started {len(workers)} workers for {ticker_count} tickers.')
+
+        try:
+            yield from self._iter_results(workers, result_queue)
+
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+
+                worker.join()
+
+    @staticmethod
+    def _iter_results(
+        workers: list[Any], result_queue: Any, poll_interval: float = 1.0
+    ) -> Iterator[ShardResult]:
+        running = len(workers)
+
+        while running:
+            try:
+                item = result_queue.get(timeout=poll_interval)
+
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    # give the queue feeder thread a moment before giving up
+                    sleep(poll_interval)
+
+                    if result_queue.empty():
+                        _error(
+                            msg='Worker process died before finishing its shard.',
+                            err_cls=RuntimeError,
+                        )
+
+                continue
+
+            if item is None:
+                running -= 1
+
+            else:
+                yield item
@@ -0,0 +1,154 @@
+import logging
+from collections.abc import Iterable, Mapping
+from typing import Any, NamedTuple
+
+from .const import _TYPES, FREQUENCIES
+from .utils import _error
+
+logger = logging.getLogger(__name__)
+
+# frequency prefixed type (e.g. quarterlyNetIncome) -> (frequency, type), built once,
+# so pivot does a single dict lookup per series instead of prefix stripping
+_TYPE_INDEX = {
+    f'{frequency}{typ}': (frequency, typ)
+    for statement in ('income_statement', 'balance_sheet', 'cash_flow')
+    for typ in _TYPES[statement]
+    for frequency in FREQUENCIES
+}
+
+
+class FinancialsWide(NamedTuple):
+    """Wide view of single financial statement type.
+
+    Attributes:
+        tickers: Ticker symbols (rows).
+        as_of_dates: Sorted as of dates, e.g. 2024-12-31 (columns).
+        values: Rows of values, None where ticker has no value for date.
+    """
+
+    tickers: list[str]
+    as_of_dates: list[str]
+    values: list[list[float | None]]
+
+
+class Financials(NamedTuple):
+    """Tidy columnar table of financial statements, one row per reported value.
+
+    Attributes:
+        ticker: Ticker symbol of each row.
+        type: Type without frequency prefix, e.g. NetIncome.
+        frequency: annual, quarterly or trailing.
+        as_of_date: As of date, e.g. 2024-12-31.
+        currency: Currency code, e.g. USD.
+        value: Raw reported value.
+    """
+
+    ticker: list[str]
+    type: list[str]
+    frequency: list[str]
+    as_of_date: list[str]
+    currency: list[str | None]
+    value: list[float | None]
+
+    def to_wide(
+        self, typ: str, frequency: str | None = None, periods: int | None = None
+    ) -> FinancialsWide:
+        """Pivot single type into (tickers x as of dates) table.
+
+        Args:
+            typ: Type without frequency prefix, e.g. NetIncome.
+            frequency:
+                annual, quarterly or trailing.
+                (optional, default: the only frequency of type in table)
+            periods: Number of last as of dates to keep. (optional, default: all)
+
+        Returns: Wide view of type.
+
+        Raises:
+            ValueError: If frequency is not given and table has more of them.
+        """
+        rows = [
+            i
+            for i, (row_type, row_frequency) in enumerate(
+                zip(self.type, self.frequency, strict=True)
+            )
+            if row_type == typ and frequency in (None, row_frequency)
+        ]
+        frequencies = {self.frequency[i] for i in rows}
+
+        if len(frequencies) > 1:
+            _error(
+                msg=f'Multiple frequencies {sorted(frequencies)} of {typ=}. '
+                'Specify frequency.',
+                err_cls=ValueError,
+            )
+
+        tickers = list(dict.fromkeys(self.ticker[i] for i in rows))
+        as_of_dates = sorted({self.as_of_date[i] for i in rows})
+
+        if periods is not None:
+            as_of_dates = as_of_dates[-periods:] if periods > 0 else []
+
+        ticker_index = {ticker: j for j, ticker in enumerate(tickers)}
+        date_index = {as_of_date: j for j, as_of_date in enumerate(as_of_dates)}
+        values: list[list[float | None]] = [[None] * len(as_of_dates) for _ in tickers]
+
+        for i in rows:
+            j = date_index.get(self.as_of_date[i])
+
+            if j is not None:
+                values[ticker_index[self.ticker[i]]][j] = self.value[i]
+
+        return FinancialsWide(tickers, as_of_dates, values)
+
+
+def pivot_financials(
+    results: Iterable[list[dict[str, Any]]] | Mapping[str, list[dict[str, Any]]],
+) -> Financials:
+    """Pivot financial statements of multiple tickers into tidy columnar table.
+
+    Built in a single pass over the results, type and frequency of each series are
+    looked up in index of all types from yafin.const.
+
+    Args:
+        results:
+            Results of Symbols.get_income_statement, get_balance_sheet or
+            get_cash_flow (tickers from meta.symbol) or ticker keyed results from
+            Symbols.index_results. Per ticker lists of more statements can be
+            concatenated.
+
+    Returns: Tidy columnar table.
+    """
+    table = Financials([], [], [], [], [], [])
+
+    if isinstance(results, Mapping):
+        items: Iterable[tuple[str | None, list[dict[str, Any]]]] = results.items()
+
+    else:
+        items = ((None, result) for result in results)
+
+    for ticker, result in items:
+        for series in result:
+            meta = series.get('meta', {})
+            full_type = meta.get('type', [''])[0]
+            frequency_type = _TYPE_INDEX.get(full_type)
+
+            if frequency_type is None:
+                logger.debug(f'Skipping series of unknown type {full_type}.')
+                continue
+
+            frequency, typ = frequency_type
+            series_ticker = ticker or meta.get('symbol', [''])[0]
+
+            for entry in series.get(full_type) or []:
+                if entry is None:
+                    continue
+
+                table.ticker.append(series_ticker)
+                table.type.append(typ)
+                table.frequency.append(frequency)
+                table.as_of_date.append(entry.get('asOfDate'))
+                table.currency.append(entry.get('currencyCode'))
+                table.value.append(entry.get('reportedValue', {}).get('raw'))
+
+    return table
@@ -0,0 +1,430 @@
+import asyncio
+import logging
+from collections.abc import Iterable, Sequence
+from time import time
+from types import TracebackType
+from typing import Any, Self
+
+from .cache import no_cache
+from .client import (
+    AsyncClient,
+    Client,
+    _SingletonAsyncClientManager,
+    _SingletonClientManager,
+)
+from .symbols import DEFAULT_CHUNK_SIZE, AsyncSymbols, Symbols
+from .utils import _error, _import_numpy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FX_TTL = 300.0
+PIVOT_CURRENCY = 'USD'
+
+# minor currency units quoted by Yahoo (e.g. LSE in pence) -> (currency, divisor)
+MINOR_UNITS = {
+    'GBp': ('GBP', 100.0),
+    'GBX': ('GBP', 100.0),
+    'ZAc': ('ZAR', 100.0),
+    'ILA': ('ILS', 100.0),
+}
+
+
+def _get_fx_ticker(currency: str) -> str:
+    """Get FX ticker quoting units of currency per USD, e.g. EUR=X."""
+    return f'{currency}=X'
+
+
+class FxRates:
+    """Dense matrix of exchange rates with cross rates derived from USD rates.
+
+    Rate of every currency pair is the ratio of their USD rates, so N currencies
+    need only N - 1 FX quotes. Requires numpy.
+
+    Attributes:
+        currencies: Currency codes (rows and columns of rates).
+        rates: (currencies x currencies) matrix, units of column currency per unit
+            of row currency, nan for currencies without USD rate.
+        timestamp: Timestamp in seconds of the USD rates.
+    """
+
+    def __init__(self, usd_rates: dict[str, float | None], timestamp: float) -> None:
+        """Create new FxRates instance.
+
+        Args:
+            usd_rates: Units of currency per USD, e.g. {'EUR': 0.92, 'JPY': 151.2}.
+            timestamp: Timestamp in seconds of the USD rates.
+        """
+        np = _import_numpy()
+        usd_rates = {PIVOT_CURRENCY: 1.0, **usd_rates}
+        self.currencies = list(usd_rates)
+        self.timestamp = timestamp
+        self._index = {currency: i for i, currency in enumerate(self.currencies)}
+        per_usd = np.array(
+            [np.nan if rate is None else rate for rate in usd_rates.values()],
+            dtype=np.float64,
+        )
+        per_usd[per_usd <= 0] = np.nan
+        self.rates: Any = np.outer(1 / per_usd, per_usd)
+
+    def __contains__(self, currency: object) -> bool:
+        """Whether currency is in the rates matrix."""
+        return currency in self._index
+
+    def get_rate(self, from_currency: str, to_currency: str = PIVOT_CURRENCY) -> float:
+        """Get exchange rate of currency pair, minor units included.
+
+        Args:
+            from_currency: Currency code, e.g. EUR or GBp.
+            to_currency: Currency code. (optional, default: USD)
+
+        Returns: Units of to_currency per unit of from_currency, nan if unknown.
+        """
+        return float(self.convert([1.0], [from_currency], to_currency)[0])
+
+    def _get_indices(self, currencies: Iterable[str | None]) -> tuple[Any, Any]:
+        """Get matrix indices (-1 for unknown) and minor unit divisors."""
+        np = _import_numpy()
+        indices = []
+        divisors = []
+
+        for currency in currencies:
+            currency, divisor = MINOR_UNITS.get(currency or '', (currency, 1.0))
+            indices.append(self._index.get(currency or '', -1))
+            divisors.append(divisor)
+
+        return np.array(indices, dtype=np.intp), np.array(divisors, dtype=np.float64)
+
+    def convert(
+        self,
+        values: Any,
+        currencies: Sequence[str | None],
+        to_currency: str = PIVOT_CURRENCY,
+    ) -> Any:
+        """Convert values in different currencies into single currency at once.
+
+        Args:
+            values: Array-like of values, e.g. prices or market caps of quotes.
+            currencies: Currency code of each value, e.g. currency of quotes.
+            to_currency: Currency code of result. (optional, default: USD)
+
+        Returns: Numpy array of converted values, nan for unknown currencies.
+
+        Raises:
+            ValueError: If lengths of values and currencies differ.
+        """
+        np = _import_numpy()
+        values = np.asarray(values, dtype=np.float64)
+
+        if len(values) != len(currencies):
+            _error(
+                msg=f'Length of values {len(values)} and currencies '
+                f'{len(currencies)} differ.',
+                err_cls=ValueError,
+            )
+
+        to_currency, to_divisor = MINOR_UNITS.get(to_currency, (to_currency, 1.0))
+        to_index = self._index.get(to_currency)
+
+        if to_index is None:
+            return np.full(values.shape, np.nan)
+
+        indices, divisors = self._get_indices(currencies)
+        factors = self.rates[indices, to_index] * to_divisor / divisors
+        factors[indices < 0] = np.nan
+        return values * factors.reshape(-1, *(1,) * (values.ndim - 1))
+
+
+class FxServiceBase:
+    """Base for synchronous and asynchronous FX services.
+
+    Attributes:
+        currencies:
+            Currency codes to keep rates of or None for all currencies from
+            get_currencies.
+        ttl: Seconds after which the rates are refreshed.
+        batch_size: Max number of FX tickers in a single quote request.
+    """
+
+    def __init__(
+        self,
+        currencies: str | None = None,
+        ttl: float = DEFAULT_FX_TTL,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Create new FX service instance.
+
+        Args:
+            currencies:
+                Comma-separated currency codes, e.g. EUR,GBP,JPY.
+                (optional, default: all currencies from get_currencies)
+            ttl: Seconds after which the rates are refreshed.
+            batch_size: Max number of FX tickers in a single quote request.
+        """
+        if ttl < 0:
+            _error(msg=f'Invalid {ttl=}. Must not be negative.', err_cls=ValueError)
+
+        self.currencies = (
+            None
+            if currencies is None
+            else list(
+                dict.fromkeys(
+                    MINOR_UNITS.get(c, (c, 1.0))[0]
+                    for c in (c.strip() for c in currencies.split(','))
+                    if c
+                )
+            )
+        )
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self._rates: FxRates | None = None
+
+    def _is_fresh(self, now: float) -> bool:
+        return self._rates is not None and 0 <= now - self._rates.timestamp < self.ttl
+
+    @staticmethod
+    def _parse_currencies(currencies_json: dict[str, Any]) -> list[str]:
+        results = (currencies_json.get('currencies') or {}).get('result') or []
+        return [r['symbol'] for r in results if r.get('symbol')]
+
+    def _get_fx_tickers(self, currencies: list[str]) -> str:
+        return ','.join(
+            _get_fx_ticker(c) for c in dict.fromkeys(currencies) if c != PIVOT_CURRENCY
+        )
+
+    def _build_rates(
+        self, currencies: list[str], quotes: list[dict[str, Any]], now: float
+    ) -> FxRates:
+        prices = {q.get('symbol'): q.get('regularMarketPrice') for q in quotes}
+        usd_rates = {
+            c: prices.get(_get_fx_ticker(c)) for c in currencies if c != PIVOT_CURRENCY
+        }
+
+        if missing := [c for c, rate in usd_rates.items() if rate is None]:
+            logger.debug(f'Missing USD rates of {missing}.')
+
+        self._rates = FxRates(usd_rates, now)
+        return self._rates
+
+
+class FxService(FxServiceBase):
+    """Currency conversion table of USD rates from batched FX quotes.
+
+    Currencies come from get_currencies (unless given), their USD rates from
+    multi-ticker quote request of FX tickers (e.g. EUR=X) bypassing the response
+    cache and cross rates are derived locally. Rates are shared until ttl expires.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+    """
+
+    def __init__(
+        self,
+        currencies: str | None = None,
+        ttl: float = DEFAULT_FX_TTL,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Create new FxService instance.
+
+        Args:
+            currencies:
+                Comma-separated currency codes, e.g. EUR,GBP,JPY.
+                (optional, default: all currencies from get_currencies)
+            ttl: Seconds after which the rates are refreshed.
+            batch_size: Max number of FX tickers in a single quote request.
+        """
+        super().__init__(currencies, ttl, batch_size)
+        self._client: Client | None = None
+
+    def close(self) -> None:
+        """Release the client if open."""
+        if self._client is not None:
+            _SingletonClientManager._release_client()
+            self._client = None
+
+    def __enter__(self) -> Self:
+        """When entering context manager, return the service."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing context manager, release the client."""
+        self.close()
+
+    def refresh(self, now: float | None = None) -> FxRates:
+        """Refresh USD rates of currencies.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Refreshed rates.
+        """
+        now = time() if now is None else now
+        currencies = self.currencies
+
+        with no_cache():
+            if currencies is None:
+                if self._client is None:
+                    self._client = _SingletonClientManager._get_client()
+
+                currencies = self._parse_currencies(self._client.get_currencies())
+
+            quotes: list[dict[str, Any]] = []
+
+            if fx_tickers := self._get_fx_tickers(currencies):
+                with Symbols(fx_tickers, self.batch_size) as symbols:
+                    quotes = symbols.get_quote()
+
+        return self._build_rates(currencies, quotes, now)
+
+    def get_rates(self, now: float | None = None) -> FxRates:
+        """Get rates, refreshed if older than ttl.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Rates.
+        """
+        now = time() if now is None else now
+
+        if self._rates is not None and self._is_fresh(now):
+            return self._rates
+
+        return self.refresh(now)
+
+    def convert(
+        self,
+        values: Any,
+        currencies: Sequence[str | None],
+        to_currency: str = PIVOT_CURRENCY,
+    ) -> Any:
+        """Convert values in different currencies into single currency at once.
+
+        Args:
+            values: Array-like of values, e.g. prices or market caps of quotes.
+            currencies: Currency code of each value, e.g. currency of quotes.
+            to_currency: Currency code of result. (optional, default: USD)
+
+        Returns: Numpy array of converted values, nan for unknown currencies.
+        """
+        return self.get_rates().convert(values, currencies, to_currency)
+
+
+class AsyncFxService(FxServiceBase):
+    """Asynchronous currency conversion table of USD rates from batched FX quotes.
+
+    Currencies come from get_currencies (unless given), their USD rates from
+    multi-ticker quote request of FX tickers (e.g. EUR=X) bypassing the response
+    cache and cross rates are derived locally. Rates are shared until ttl expires.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+    """
+
+    def __init__(
+        self,
+        currencies: str | None = None,
+        ttl: float = DEFAULT_FX_TTL,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Create new AsyncFxService instance.
+
+        Args:
+            currencies:
+                Comma-separated currency codes, e.g. EUR,GBP,JPY.
+                (optional, default: all currencies from get_currencies)
+            ttl: Seconds after which the rates are refreshed.
+            batch_size: Max number of FX tickers in a single quote request.
+        """
+        super().__init__(currencies, ttl, batch_size)
+        self._client: AsyncClient | None = None
+        # single-flight refresh, concurrent callers of get_rates share it
+        self._refresh_lock = asyncio.Lock()
+
+    async def close(self) -> None:
+        """Release the client if open."""
+        if self._client is not None:
+            await _SingletonAsyncClientManager._release_client()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        """When entering async context manager, return the service."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing async context manager, release the client."""
+        await self.close()
+
+    async def refresh(self, now: float | None = None) -> FxRates:
+        """Refresh USD rates of currencies.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Refreshed rates.
+        """
+        now = time() if now is None else now
+        currencies = self.currencies
+
+        with no_cache():
+            if currencies is None:
+                if self._client is None:
+                    self._client = _SingletonAsyncClientManager._get_client()
+
+                currencies = self._parse_currencies(await self._client.get_currencies())
+
+            quotes: list[dict[str, Any]] = []
+
+            if fx_tickers := self._get_fx_tickers(currencies):
+                async with AsyncSymbols(fx_tickers, self.batch_size) as symbols:
+                    quotes = await symbols.get_quote()
+
+        return self._build_rates(currencies, quotes, now)
+
+    async def get_rates(self, now: float | None = None) -> FxRates:
+        """Get rates, refreshed if older than ttl.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Rates.
+        """
+        now = time() if now is None else now
+        rates = self._rates
+
+        if rates is not None and self._is_fresh(now):
+            return rates
+
+        async with self._refresh_lock:
+            # refreshed by another caller while waiting
+            if self._rates is not None and self._rates is not rates:
+                return self._rates
+
+            return await self.refresh(now)
+
+    async def convert(
+        self,
+        values: Any,
+        currencies: Sequence[str | None],
+        to_currency: str = PIVOT_CURRENCY,
+    ) -> Any:
+        """Convert values in different currencies into single currency at once.
+
+        Args:
+            values: Array-like of values, e.g. prices or market caps of quotes.
+            currencies: Currency code of each value, e.g. currency of quotes.
+            to_currency: Currency code of result. (optional, default: USD)
+
+        Returns: Numpy array of converted values, nan for unknown currencies.
+        """
+        return (await self.get_rates()).convert(values, currencies, to_currency)
@@ -0,0 +1,332 @@
+import logging
+from collections.abc import Iterable
+from typing import Any, NamedTuple
+
+from .utils import _error, _get_chart_array, _import_numpy
+
+logger = logging.getLogger(__name__)
+
+# max scale (1 - alpha)^-k within one block of closed form ewm, keeps the block
+# cumsum within float64 precision
+_EWM_MAX_SCALE = 1e6
+
+# chart result or list of chart results
+_Charts = dict[str, Any] | Iterable[dict[str, Any]]
+
+
+class BollingerBands(NamedTuple):
+    """Bollinger bands.
+
+    Attributes:
+        middle: Simple moving average.
+        upper: Middle band plus number of standard deviations.
+        lower: Middle band minus number of standard deviations.
+    """
+
+    middle: Any
+    upper: Any
+    lower: Any
+
+
+def _get_chart_list(charts: _Charts) -> tuple[list[dict[str, Any]], bool]:
+    """Get list of chart results and whether single chart result was given."""
+    if isinstance(charts, dict):
+        return [charts], True
+
+    return list(charts), False
+
+
+def _stack_fields(charts: _Charts, fields: tuple[str, ...]) -> tuple[list[Any], bool]:
+    """Stack chart fields of all charts into 2D (charts x bars) arrays.
+
+    Shorter charts are padded with NaN at the end, so bar index is kept.
+    """
+    np = _import_numpy()
+    chart_list, single = _get_chart_list(charts)
+    length = max(
+        (len(_get_chart_array(chart, 'timestamp')) for chart in chart_list), default=0
+    )
+    stacked = []
+
+    for field in fields:
+        array = np.full((len(chart_list), length), np.nan)
+
+        for i, chart in enumerate(chart_list):
+            values = _get_chart_array(chart, field)
+            array[i, : len(values)] = values
+
+        stacked.append(array)
+
+    return stacked, single
+
+
+def _compact(*arrays: Any) -> tuple[Any, Any, list[Any]]:
+    """Move bars with NaN in any of arrays to the end of each row.
+
+    Indicators are then computed over the bars with data only, i.e. a gap does not
+    reset a moving window, and results are scattered back by _expand.
+    """
+    np = _import_numpy()
+    gaps = np.zeros(arrays[0].shape, dtype=bool)
+
+    for array in arrays:
+        gaps |= np.isnan(array)
+
+    order = np.argsort(gaps, axis=-1, kind='stable')
+    return order, gaps, [np.take_along_axis(a, order, axis=-1) for a in arrays]
+
+
+def _expand(values: Any, order: Any, gaps: Any, single: bool) -> Any:
+    """Scatter compacted values back to original bars, gaps are NaN."""
+    np = _import_numpy()
+    expanded = np.empty_like(values)
+    np.put_along_axis(expanded, order, values, axis=-1)
+    expanded[gaps] = np.nan
+    return expanded[0] if single else expanded
+
+
+def _rolling(x: Any, window: int, func: str) -> Any:
+    """Rolling mean or std (ddof=0) along the last axis, NaN until window is full."""
+    np = _import_numpy()
+    out = np.full(x.shape, np.nan)
+
+    if x.shape[-1] >= window:
+        windows = np.lib.stride_tricks.sliding_window_view(x, window, axis=-1)
+        out[..., window - 1 :] = getattr(windows, func)(axis=-1)
+
+    return out
+
+
+def _ewm(x: Any, alpha: float, start: int = 0) -> Any:
+    """Exponentially weighted mean along the last axis, seeded by value at start.
+
+    Recursion e[t] = (1 - alpha) * e[t-1] + alpha * x[t] is evaluated in closed form
+    by blocks, so the loop runs over blocks, not bars.
+    """
+    np = _import_numpy()
+    out = np.full(x.shape, np.nan)
+    length = x.shape[-1]
+
+    if start >= length:
+        return out
+
+    out[..., start] = x[..., start]
+    beta = 1 - alpha
+
+    if beta <= 0:
+        out[..., start:] = x[..., start:]
+        return out
+
+    block_size = max(int(np.log(_EWM_MAX_SCALE) / -np.log(beta)), 1)
+
+    for block_start in range(start + 1, length, block_size):
+        block = x[..., block_start : block_start + block_size]
+        exponents = np.arange(block.shape[-1])
+        # e[t] = beta^(t+1) * e0 + alpha * beta^t * sum_k(beta^-k * x[k])
+        prev = out[..., block_start - 1 : block_start]
+        out[..., block_start : block_start + block.shape[-1]] = beta ** (
+            exponents + 1
+        ) * prev + alpha * beta**exponents * np.cumsum(
+            block * beta**-exponents, axis=-1
+        )
+
+    return out
+
+
+def _wilder(x: Any, window: int, start: int) -> Any:
+    """Wilder's smoothing seeded by mean of window values ending at start."""
+    seeded = x.copy()
+    seeded[..., start] = x[..., start - window + 1 : start + 1].mean(axis=-1)
+    return _ewm(seeded, 1 / window, start)
+
+
+def _check_window(window: int) -> None:
+    if window < 1:
+        _error(msg=f'Invalid {window=}. Must be positive.', err_cls=ValueError)
+
+
+def sma(charts: _Charts, window: int = 20, field: str = 'close') -> Any:
+    """Simple moving average.
+
+    Args:
+        charts: Chart result or list of chart results, e.g. from Symbols.get_chart.
+        window: Number of bars.
+        field: open, high, low, close, volume or adjclose.
+
+    Returns:
+        Float numpy array of bars for chart result, 2D array of charts x bars for
+            list of chart results, gaps and bars before full window are NaN.
+    """
+    _check_window(window)
+    (x,), single = _stack_fields(charts, (field,))
+    order, gaps, (x,) = _compact(x)
+    return _expand(_rolling(x, window, 'mean'), order, gaps, single)
+
+
+def ema(charts: _Charts, window: int = 20, field: str = 'close') -> Any:
+    """Exponential moving average with alpha 2 / (window + 1), seeded by first bar.
+
+    Args:
+        charts: Chart result or list of chart results, e.g. from Symbols.get_chart.
+        window: Number of bars (span).
+        field: open, high, low, close, volume or adjclose.
+
+    Returns:
+        Float numpy array of bars for chart result, 2D array of charts x bars for
+            list of chart results, gaps are NaN.
+    """
+    _check_window(window)
+    (x,), single = _stack_fields(charts, (field,))
+    order, gaps, (x,) = _compact(x)
+    return _expand(_ewm(x, 2 / (window + 1)), order, gaps, single)
+
+
+def rsi(charts: _Charts, window: int = 14, field: str = 'close') -> Any:
+    """Relative strength index with Wilder's smoothing.
+
+    Args:
+        charts: Chart result or list of chart results, e.g. from Symbols.get_chart.
+        window: Number of bars.
+        field: open, high, low, close or adjclose.
+
+    Returns:
+        Float numpy array (0 - 100) of bars for chart result, 2D array of charts x
+            bars for list of chart results, gaps and first window bars are NaN.
+    """
+    np = _import_numpy()
+    _check_window(window)
+    (x,), single = _stack_fields(charts, (field,))
+    order, gaps, (x,) = _compact(x)
+
+    delta = np.full(x.shape, np.nan)
+    delta[..., 1:] = np.diff(x, axis=-1)
+    avg_gain = np.full(x.shape, np.nan)
+    avg_loss = np.full(x.shape, np.nan)
+
+    if x.shape[-1] > window:
+        avg_gain = _wilder(np.clip(delta, 0, None), window, window)
+        avg_loss = _wilder(np.clip(-delta, 0, None), window, window)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = 100 * avg_gain / (avg_gain + avg_loss)
+
+    # flat prices have neither gains nor losses
+    values[(avg_gain == 0) & (avg_loss == 0)] = 50.0
+    return _expand(values, order, gaps, single)
+
+
+def atr(charts: _Charts, window: int = 14) -> Any:
+    """Average true range with Wilder's smoothing.
+
+    Args:
+        charts: Chart result or list of chart results, e.g. from Symbols.get_chart.
+        window: Number of bars.
+
+    Returns:
+        Float numpy array of bars for chart result, 2D array of charts x bars for
+            list of chart results, gaps and bars before full window are NaN.
+    """
+    np = _import_numpy()
+    _check_window(window)
+    (high, low, close), single = _stack_fields(charts, ('high', 'low', 'close'))
+    order, gaps, (high, low, close) = _compact(high, low, close)
+
+    true_range = high - low
+    prev_close = close[..., :-1]
+    true_range[..., 1:] = np.maximum.reduce(
+        [
+            true_range[..., 1:],
+            np.abs(high[..., 1:] - prev_close),
+            np.abs(low[..., 1:] - prev_close),
+        ]
+    )
+    values = np.full(true_range.shape, np.nan)
+
+    if true_range.shape[-1] >= window:
+        values = _wilder(true_range, window, window - 1)
+
+    return _expand(values, order, gaps, single)
+
+
+def bollinger_bands(
+    charts: _Charts, window: int = 20, num_std: float = 2.0, field: str = 'close'
+) -> BollingerBands:
+    """Bollinger bands - moving average -/+ number of (population) std deviations.
+
+    Args:
+        charts: Chart result or list of chart results, e.g. from Symbols.get_chart.
+        window: Number of bars.
+        num_std: Number of standard deviations.
+        field: open, high, low, close or adjclose.
+
+    Returns:
+        Middle, upper and lower band, each as float numpy array of bars for chart
+            result, 2D array of charts x bars for list of chart results, gaps and
+            bars before full window are NaN.
+    """
+    _check_window(window)
+    (x,), single = _stack_fields(charts, (field,))
+    order, gaps, (x,) = _compact(x)
+    middle = _rolling(x, window, 'mean')
+    width = num_std * _rolling(x, window, 'std')
+    return BollingerBands(
+        _expand(middle, order, gaps, single),
+        _expand(middle + width, order, gaps, single),
+        _expand(middle - width, order, gaps, single),
+    )
+
+
+def _is_intraday(chart: dict[str, Any]) -> bool:
+    granularity = chart.get('meta', {}).get('dataGranularity', '1d')
+    return granularity[-1] in ('m', 'h')
+
+
+def vwap(charts: _Charts, reset_daily: bool | None = None) -> Any:
+    """Volume weighted average price of typical price (high + low + close) / 3.
+
+    Args:
+        charts: Chart result or list of chart results, e.g. from Symbols.get_chart.
+        reset_daily:
+            Whether to restart accumulation at each exchange day (by meta.gmtoffset).
+            (optional, default: True for intraday, False for other intervals)
+
+    Returns:
+        Float numpy array of bars for chart result, 2D array of charts x bars for
+            list of chart results, gaps are NaN.
+    """
+    np = _import_numpy()
+    chart_list, single = _get_chart_list(charts)
+    (timestamp, high, low, close, volume), _ = _stack_fields(
+        chart_list, ('timestamp', 'high', 'low', 'close', 'volume')
+    )
+    order, gaps, (timestamp, high, low, close, volume) = _compact(
+        timestamp, high, low, close, volume
+    )
+
+    price_volume = (high + low + close) / 3 * volume
+    cum_price_volume = np.cumsum(price_volume, axis=-1)
+    cum_volume = np.cumsum(volume, axis=-1)
+
+    resets = np.array(
+        [_is_intraday(c) if reset_daily is None else reset_daily for c in chart_list],
+        dtype=bool,
+    )
+
+    if resets.any():
+        offsets = np.array([c.get('meta', {}).get('gmtoffset', 0) for c in chart_list])
+        days = (timestamp + offsets[:, None]) // 86400
+        bars = np.arange(days.shape[-1])
+        is_start = np.ones(days.shape, dtype=bool)
+        is_start[..., 1:] = days[..., 1:] != days[..., :-1]
+        is_start &= resets[:, None]
+        # index of the first bar of the day of each bar
+        start_index = np.maximum.accumulate(np.where(is_start, bars, 0), axis=-1)
+        cum_price_volume -= np.take_along_axis(
+            cum_price_volume - price_volume, start_index, axis=-1
+        )
+        cum_volume -= np.take_along_axis(cum_volume - volume, start_index, axis=-1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = cum_price_volume / cum_volume
+
+    return _expand(values, order, gaps, single)
@@ -0,0 +1,223 @@
+import logging
+from collections.abc import Iterable, Mapping
+from typing import Any, Literal
+
+from .utils import _error, _get_chart_array, _import_numpy, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+_DAY = 86400
+_INTRADAY_UNITS = ('m', 'h')
+
+
+class Panel:
+    """Price panel of charts aligned on common timestamps.
+
+    Attributes:
+        tickers: Ticker symbols (1st axis of values).
+        timestamps: Aligned timestamps, int numpy array (2nd axis of values).
+        fields: Chart fields (3rd axis of values).
+        values: Float numpy array of shape (tickers, timestamps, fields), NaN where
+            ticker has no bar or bar has no data.
+        mask: Bool numpy array of shape (tickers, timestamps), True where ticker has
+            bar with data in all fields.
+    """
+
+    def __init__(
+        self,
+        tickers: list[str],
+        timestamps: Any,
+        fields: tuple[str, ...],
+        values: Any,
+        mask: Any,
+    ) -> None:
+        self.tickers = tickers
+        self.timestamps = timestamps
+        self.fields = fields
+        self.values = values
+        self.mask = mask
+        self._ticker_index = {ticker: i for i, ticker in enumerate(tickers)}
+
+    def __repr__(self) -> str:
+        """Show panel shape."""
+        return (
+            f'{self.__class__.__name__}(tickers={len(self.tickers)}, '
+            f'timestamps={len(self.timestamps)}, fields={self.fields!r})'
+        )
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Shape of values - (tickers, timestamps, fields)."""
+        return self.values.shape
+
+    def get_field(self, field: str) -> Any:
+        """Get field of all tickers.
+
+        Args:
+            field: Chart field, e.g. close.
+
+        Returns: Float numpy array (view) of shape (tickers, timestamps).
+
+        Raises:
+            KeyError: If field is not in panel.
+        """
+        if field not in self.fields:
+            _error(
+                msg=f'Invalid {field=}. Valid values: {self.fields}', err_cls=KeyError
+            )
+
+        return self.values[:, :, self.fields.index(field)]
+
+    def select(
+        self,
+        tickers: str | list[str] | None = None,
+        start: int | float | None = None,
+        end: int | float | None = None,
+    ) -> 'Panel':
+        """Select tickers and time range.
+
+        Time range selection is a view of values (no copy).
+
+        Args:
+            tickers:
+                Comma-separated string or list of ticker symbols.
+                (optional, default: all tickers)
+            start: Start timestamp in seconds (incl.). (optional, default: None)
+            end: End timestamp in seconds (excl.). (optional, default: None)
+
+        Returns: Panel with selected tickers and timestamps.
+
+        Raises:
+            KeyError: If ticker is not in panel.
+        """
+        np = _import_numpy()
+        time_slice = slice(
+            None if start is None else np.searchsorted(self.timestamps, start),
+            None if end is None else np.searchsorted(self.timestamps, end),
+        )
+
+        if tickers is None:
+            return Panel(
+                self.tickers,
+                self.timestamps[time_slice],
+                self.fields,
+                self.values[:, time_slice],
+                self.mask[:, time_slice],
+            )
+
+        if isinstance(tickers, str):
+            tickers = tickers.split(',')
+
+        ticker_list = [_normalize_ticker(ticker) for ticker in tickers]
+
+        for ticker in ticker_list:
+            if ticker not in self._ticker_index:
+                _error(msg=f'Ticker {ticker} is not in panel.', err_cls=KeyError)
+
+        indices = [self._ticker_index[ticker] for ticker in ticker_list]
+        return Panel(
+            ticker_list,
+            self.timestamps[time_slice],
+            self.fields,
+            self.values[indices, time_slice],
+            self.mask[indices, time_slice],
+        )
+
+
+def _get_day_timestamps(chart: dict[str, Any]) -> Any:
+    """Get timestamps floored to exchange local day (as UTC midnight)."""
+    timestamp = _get_chart_array(chart, 'timestamp')
+    offset = chart.get('meta', {}).get('gmtoffset', 0)
+    return (timestamp + offset) // _DAY * _DAY
+
+
+def build_panel(
+    charts: Iterable[dict[str, Any]] | Mapping[str, dict[str, Any]],
+    fields: tuple[str, ...] = FIELDS,
+    how: Literal['union', 'intersection'] = 'union',
+    align_days: bool | None = None,
+) -> Panel:
+    """Build price panel from charts of multiple tickers.
+
+    Timestamps of all charts are merged into sorted union or intersection and
+    chart fields are placed into (tickers x timestamps x fields) array by
+    vectorized index lookup. Requires numpy.
+
+    Args:
+        charts:
+            Chart results, e.g. from Symbols.get_chart (tickers from meta.symbol)
+            or ticker keyed results from Symbols.index_results.
+        fields: Chart fields, e.g. close or adjclose. (optional, default: OHLCV)
+        how:
+            union - all timestamps, missing bars are NaN, or intersection -
+            timestamps, where all tickers have a bar. (optional, default: union)
+        align_days:
+            Whether to align bars by exchange local day, so daily bars of exchanges
+            in different timezones fall on the same date. Timestamps are then UTC
+            midnights of the days. (optional, default: True for daily and longer
+            intervals, False for intraday)
+
+    Returns: Aligned panel.
+
+    Raises:
+        ValueError: If how is invalid or chart lacks a field.
+    """
+    np = _import_numpy()
+
+    if how not in ('union', 'intersection'):
+        _error(
+            msg=f'Invalid {how=}. Valid values: union, intersection', err_cls=ValueError
+        )
+
+    if isinstance(charts, Mapping):
+        tickers = list(charts)
+        chart_list = [charts[ticker] for ticker in tickers]
+
+    else:
+        chart_list = list(charts)
+        tickers = [chart.get('meta', {}).get('symbol', '') for chart in chart_list]
+
+    if align_days is None:
+        align_days = all(
+            chart.get('meta', {}).get('dataGranularity', '1d')[-1]
+            not in _INTRADAY_UNITS
+            for chart in chart_list
+        )
+
+    chart_timestamps = [
+        _get_day_timestamps(chart)
+        if align_days
+        else _get_chart_array(chart, 'timestamp')
+        for chart in chart_list
+    ]
+
+    if not chart_timestamps:
+        timestamps = np.empty(0)
+
+    elif how == 'union':
+        timestamps = np.unique(np.concatenate(chart_timestamps))
+
+    else:
+        timestamps = chart_timestamps[0]
+
+        for chart_timestamp in chart_timestamps[1:]:
+            timestamps = np.intersect1d(timestamps, chart_timestamp)
+
+        timestamps = np.unique(timestamps)
+
+    values = np.full((len(chart_list), len(timestamps), len(fields)), np.nan)
+
+    for i, (chart, chart_timestamp) in enumerate(
+        zip(chart_list, chart_timestamps, strict=True)
+    ):
+        # bars outside of intersection are dropped
+        in_panel = np.isin(chart_timestamp, timestamps)
+        index = np.searchsorted(timestamps, chart_timestamp[in_panel])
+
+        for j, field in enumerate(fields):
+            values[i, index, j] = _get_chart_array(chart, field)[in_panel]
+
+    mask = ~np.isnan(values).any(axis=-1)
+    return Panel(tickers, timestamps.astype(np.int64), fields, values, mask)
@@ -0,0 +1,334 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterable, Iterator
+from numbers import Real
+from time import monotonic, sleep
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from .cache import no_cache
+from .symbols import AsyncSymbols, Symbols
+from .utils import _error, _import_numpy, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 5.0
+
+
+class QuoteDelta(NamedTuple):
+    """Changed fields of ticker quote since previous snapshot.
+
+    Attributes:
+        ticker: Ticker symbol.
+        changes: Changed fields and their new values, all fields of first snapshot,
+            None for fields missing in the new quote.
+    """
+
+    ticker: str
+    changes: dict[str, Any]
+
+
+class QuoteSnapshots:
+    """Previous quote snapshot per ticker in columnar form with vectorized diffs.
+
+    Numeric fields are kept in (tickers x fields) float array and compared in one
+    vectorized operation per batch, other fields (strings, lists) in object array
+    compared elementwise by numpy. Columns are added, when new fields appear.
+    Requires numpy.
+
+    Attributes:
+        fields: Tracked fields or None for all fields.
+    """
+
+    def __init__(self, fields: Iterable[str] | None = None) -> None:
+        """Create new QuoteSnapshots instance.
+
+        Args:
+            fields:
+                Fields to track, e.g. regularMarketPrice, regularMarketVolume.
+                (optional, default: all quote fields)
+        """
+        np = _import_numpy()
+        self.fields = None if fields is None else tuple(fields)
+        self._ticker_index: dict[str, int] = {}
+        self._numeric_fields: list[str] = []
+        self._object_fields: list[str] = []
+        self._numeric_values = np.empty((0, 0), dtype=np.float64)
+        self._object_values = np.empty((0, 0), dtype=object)
+
+    def __len__(self) -> int:
+        """Number of tickers with snapshot."""
+        return len(self._ticker_index)
+
+    def _add_fields(self, quotes: list[dict[str, Any]]) -> None:
+        np = _import_numpy()
+        known_fields = {*self._numeric_fields, *self._object_fields}
+        numeric_fields: list[str] = []
+        object_fields: list[str] = []
+
+        for quote in quotes:
+            for field, value in quote.items():
+                if field in known_fields or (
+                    self.fields is not None and field not in self.fields
+                ):
+                    continue
+
+                known_fields.add(field)
+                is_numeric = isinstance(value, Real) and not isinstance(value, bool)
+                (numeric_fields if is_numeric else object_fields).append(field)
+
+        if numeric_fields:
+            self._numeric_fields += numeric_fields
+            self._numeric_values = np.hstack(
+                [
+                    self._numeric_values,
+                    np.full((len(self), len(numeric_fields)), np.nan),
+                ]
+            )
+
+        if object_fields:
+            self._object_fields += object_fields
+            self._object_values = np.hstack(
+                [
+                    self._object_values,
+                    np.full((len(self), len(object_fields)), None, dtype=object),
+                ]
+            )
+
+    def _add_tickers(self, tickers: list[str]) -> None:
+        np = _import_numpy()
+        new_tickers = [t for t in dict.fromkeys(tickers) if t not in self._ticker_index]
+
+        if not new_tickers:
+            return
+
+        for ticker in new_tickers:
+            self._ticker_index[ticker] = len(self._ticker_index)
+
+        self._numeric_values = np.vstack(
+            [
+                self._numeric_values,
+                np.full((len(new_tickers), len(self._numeric_fields)), np.nan),
+            ]
+        )
+        self._object_values = np.vstack(
+            [
+                self._object_values,
+                np.full(
+                    (len(new_tickers), len(self._object_fields)), None, dtype=object
+                ),
+            ]
+        )
+
+    def update(self, quotes: list[dict[str, Any]]) -> list[QuoteDelta]:
+        """Diff quotes against previous snapshots and store them as new snapshots.
+
+        Args:
+            quotes: Quote results, e.g. from Symbols.get_quote.
+
+        Returns: Deltas of tickers with changed fields in order of quotes.
+        """
+        np = _import_numpy()
+        # last quote of duplicated ticker wins
+        quote_map = {_normalize_ticker(quote['symbol']): quote for quote in quotes}
+        tickers = list(quote_map)
+        batch = list(quote_map.values())
+        self._add_fields(batch)
+        self._add_tickers(tickers)
+        rows = np.array([self._ticker_index[t] for t in tickers], dtype=np.intp)
+
+        numeric_values = np.array(
+            [
+                [
+                    value
+                    if isinstance(value := quote.get(field), Real)
+                    and not isinstance(value, bool)
+                    else np.nan
+                    for field in self._numeric_fields
+                ]
+                for quote in batch
+            ],
+            dtype=np.float64,
+        ).reshape(len(batch), len(self._numeric_fields))
+        object_values = np.empty((len(batch), len(self._object_fields)), dtype=object)
+        object_values[...] = [
+            [quote.get(field) for field in self._object_fields] for quote in batch
+        ]
+
+        previous_numeric_values = self._numeric_values[rows]
+        numeric_changed = (numeric_values != previous_numeric_values) & ~(
+            np.isnan(numeric_values) & np.isnan(previous_numeric_values)
+        )
+        object_changed = (object_values != self._object_values[rows]).astype(bool)
+
+        self._numeric_values[rows] = numeric_values
+        self._object_values[rows] = object_values
+
+        changes: dict[int, dict[str, Any]] = {}
+
+        for changed, fields in (
+            (numeric_changed, self._numeric_fields),
+            (object_changed, self._object_fields),
+        ):
+            for i, j in zip(*np.nonzero(changed), strict=True):
+                changes.setdefault(int(i), {})[fields[j]] = batch[i].get(fields[j])
+
+        return [QuoteDelta(tickers[i], changes[i]) for i in sorted(changes)]
+
+
+class QuotePoller:
+    """Polls quotes of tickers and yields only changed fields.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+
+    Attributes:
+        interval: Poll interval in seconds.
+        snapshots: Previous quote snapshots.
+    """
+
+    def __init__(
+        self,
+        tickers: str,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        fields: Iterable[str] | None = None,
+        include_pre_post: bool | None = None,
+    ) -> None:
+        """Create new QuotePoller instance.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            interval: Poll interval in seconds.
+            fields:
+                Fields to track, e.g. regularMarketPrice, regularMarketVolume.
+                (optional, default: all quote fields)
+            include_pre_post: Whether to include pre and post market.
+        """
+        if interval <= 0:
+            _error(msg=f'Invalid {interval=}. Must be positive.', err_cls=ValueError)
+
+        self.interval = interval
+        self.snapshots = QuoteSnapshots(fields)
+        self._include_pre_post = include_pre_post
+        self._symbols = Symbols(tickers)
+
+    def close(self) -> None:
+        """Release the client of the polled symbols."""
+        self._symbols.close()
+
+    def __enter__(self) -> Self:
+        """When entering context manager, return the poller."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing context manager, release the client."""
+        self.close()
+
+    def poll(self) -> list[QuoteDelta]:
+        """Poll quotes once.
+
+        Returns: Deltas of tickers with changed fields.
+        """
+        # fresh quotes, not responses cached by previous polls
+        with no_cache():
+            quotes = self._symbols.get_quote(include_pre_post=self._include_pre_post)
+
+        return self.snapshots.update(quotes)
+
+    def __iter__(self) -> Iterator[list[QuoteDelta]]:
+        """Poll quotes every interval and yield non-empty deltas."""
+        while True:
+            start = monotonic()
+            deltas = self.poll()
+
+            if deltas:
+                yield deltas
+
+            sleep(max(self.interval - (monotonic() - start), 0))
+
+
+class AsyncQuotePoller:
+    """Asynchronously polls quotes of tickers and yields only changed fields.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+
+    Attributes:
+        interval: Poll interval in seconds.
+        snapshots: Previous quote snapshots.
+    """
+
+    def __init__(
+        self,
+        tickers: str,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        fields: Iterable[str] | None = None,
+        include_pre_post: bool | None = None,
+    ) -> None:
+        """Create new AsyncQuotePoller instance.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            interval: Poll interval in seconds.
+            fields:
+                Fields to track, e.g. regularMarketPrice, regularMarketVolume.
+                (optional, default: all quote fields)
+            include_pre_post: Whether to include pre and post market.
+        """
+        if interval <= 0:
+            _error(msg=f'Invalid {interval=}. Must be positive.', err_cls=ValueError)
+
+        self.interval = interval
+        self.snapshots = QuoteSnapshots(fields)
+        self._include_pre_post = include_pre_post
+        self._symbols = AsyncSymbols(tickers)
+
+    async def close(self) -> None:
+        """Release the client of the polled symbols."""
+        await self._symbols.close()
+
+    async def __aenter__(self) -> Self:
+        """When entering async context manager, return the poller."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing async context manager, release the client."""
+        await self.close()
+
+    async def poll(self) -> list[QuoteDelta]:
+        """Poll quotes once.
+
+        Returns: Deltas of tickers with changed fields.
+        """
+        # fresh quotes, not responses cached by previous polls
+        with no_cache():
+            quotes = await self._symbols.get_quote(
+                include_pre_post=self._include_pre_post
+            )
+
+        return self.snapshots.update(quotes)
+
+    async def __aiter__(self) -> AsyncIterator[list[QuoteDelta]]:
+        """Poll quotes every interval and yield non-empty deltas."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            start = loop.time()
+            deltas = await self.poll()
+
+            if deltas:
+                yield deltas
+
+            await asyncio.sleep(max(self.interval - (loop.time() - start), 0))
@@ -0,0 +1,133 @@
+import copy
+import logging
+import re
+from datetime import datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from .utils import _error, _get_chart_array, _import_numpy
+
+logger = logging.getLogger(__name__)
+
+_INTERVAL_RE = re.compile(r'^(\d+)(m|h|d)$')
+_UNIT_SECONDS = {'m': 60, 'h': 3600, 'd': 86400}
+_DAY = 86400
+
+
+def _get_interval_seconds(interval: str) -> int:
+    """Get bucket size in seconds of interval, e.g. 3m, 10m, 2h or 1d."""
+    match = _INTERVAL_RE.match(interval)
+
+    if match is None or int(match[1]) < 1 or (match[2] == 'd' and match[1] != '1'):
+        _error(
+            msg=f'Invalid {interval=}. Valid values: <n>m, <n>h or 1d.',
+            err_cls=ValueError,
+        )
+
+    return int(match[1]) * _UNIT_SECONDS[match[2]]
+
+
+def _get_local_timestamps(timestamp: Any, timezone: str | None) -> Any:
+    """Shift UTC timestamps to exchange local time, DST aware per day."""
+    np = _import_numpy()
+
+    if timezone is None or not len(timestamp):
+        return timestamp
+
+    tz_info = ZoneInfo(timezone)
+    days, inverse = np.unique(timestamp // _DAY, return_inverse=True)
+    # exchanges are closed during DST transitions, so one offset per day is enough
+    offsets = np.array(
+        [
+            datetime.fromtimestamp(day * _DAY + _DAY / 2, tz_info)
+            .utcoffset()
+            .total_seconds()
+            for day in days
+        ]
+    )
+    return timestamp + offsets[inverse]
+
+
+def resample_chart(chart: dict[str, Any], interval: str) -> dict[str, Any]:
+    """Aggregate chart bars into coarser (incl. non-standard) interval locally.
+
+    Bars are grouped into buckets in exchange timezone, anchored to regular market
+    open from meta.currentTradingPeriod, so buckets do not cross exchange days
+    and 1d buckets are exchange-session days. Open is the first, high the max, low
+    the min, close the last and volume the sum of bars in bucket. Bars without data
+    (None) are skipped. Requires numpy.
+
+    Args:
+        chart: Chart result, e.g. from Symbol.get_chart with 1m interval.
+        interval:
+            Bucket interval - <n>m, <n>h (e.g. 3m, 10m, 2h) or 1d, which must be
+            multiple of chart interval.
+
+    Returns:
+        Copy of chart result with bars aggregated into buckets, timestamp of bar
+            is start of its bucket. Adjclose is left out.
+
+    Raises:
+        ValueError: If interval is invalid or not multiple of chart interval.
+    """
+    np = _import_numpy()
+    bucket_size = _get_interval_seconds(interval)
+    meta = chart.get('meta', {})
+    granularity = meta.get('dataGranularity')
+
+    if granularity is not None:
+        match = _INTERVAL_RE.match(granularity)
+
+        if match is None or bucket_size % _get_interval_seconds(granularity):
+            _error(
+                msg=f'Invalid {interval=} for chart with {granularity=}.',
+                err_cls=ValueError,
+            )
+
+    timestamp = _get_chart_array(chart, 'timestamp')
+    fields = {
+        field: _get_chart_array(chart, field)
+        for field in ('open', 'high', 'low', 'close', 'volume')
+    }
+    has_data = ~np.isnan(timestamp)
+
+    for values in fields.values():
+        has_data &= ~np.isnan(values)
+
+    timestamp = timestamp[has_data]
+    fields = {field: values[has_data] for field, values in fields.items()}
+
+    local_timestamp = _get_local_timestamps(timestamp, meta.get('exchangeTimezoneName'))
+    offset = local_timestamp - timestamp
+    regular = meta.get('currentTradingPeriod', {}).get('regular', {})
+    # buckets start at regular market open (exchange local time of day)
+    anchor = (regular.get('start', 0) + regular.get('gmtoffset', 0)) % _DAY
+    day_start = local_timestamp // _DAY * _DAY + anchor
+    bucket_start = (
+        day_start + (local_timestamp - day_start) // bucket_size * bucket_size
+        if bucket_size < _DAY
+        else day_start
+    )
+
+    starts = np.flatnonzero(np.diff(bucket_start, prepend=np.nan) != 0)
+    ends = np.append(starts[1:], len(bucket_start)) - 1
+
+    if len(starts):
+        quote = {
+            'open': fields['open'][starts].tolist(),
+            'high': np.maximum.reduceat(fields['high'], starts).tolist(),
+            'low': np.minimum.reduceat(fields['low'], starts).tolist(),
+            'close': fields['close'][ends].tolist(),
+            'volume': np.add.reduceat(fields['volume'], starts).tolist(),
+        }
+
+    else:
+        quote = {field: [] for field in fields}
+
+    resampled_chart = copy.copy(chart)
+    resampled_chart['meta'] = {**meta, 'dataGranularity': interval}
+    resampled_chart['timestamp'] = (
+        (bucket_start[starts] - offset[starts]).astype(np.int64).tolist()
+    )
+    resampled_chart['indicators'] = {'quote': [quote]}
+    return resampled_chart
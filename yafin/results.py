@@ -0,0 +1,661 @@
+import json
+from collections.abc import Iterator, Mapping
+from typing import Any, ClassVar, Self
+
+from .utils import _import_numpy, _normalize_ticker
+
+JsonInput = bytes | str | dict[str, Any]
+
+
+class _Result:
+    """Base for typed slotted results decoded from response json.
+
+    Subclasses declare attribute annotations, _FIELDS mapping of attribute name to
+    json key and __slots__ derived from it. Keys missing in json are decoded as None.
+    Sub-objects listed in _LAZY_FIELDS are kept raw and decoded on first access.
+    """
+
+    __slots__ = ()
+
+    # attribute name -> json key
+    _FIELDS: ClassVar[dict[str, str]] = {}
+    # attribute name -> json key, raw value is stored in slot named _<attribute>
+    _LAZY_FIELDS: ClassVar[dict[str, str]] = {}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> Self:
+        """Create new instance from response json (sub)object.
+
+        Args:
+            data: decoded json object, e.g. single quote result.
+
+        Returns: Typed result.
+        """
+        obj = cls.__new__(cls)
+
+        for attr, key in cls._FIELDS.items():
+            setattr(obj, attr, data.get(key))
+
+        for attr, key in cls._LAZY_FIELDS.items():
+            setattr(obj, f'_{attr}', data.get(key))
+
+        return obj
+
+    def _get_lazy(self, attr: str, result_cls: type['_Result']) -> Any:
+        value = getattr(self, f'_{attr}')
+
+        if isinstance(value, dict):
+            value = result_cls.from_json(value)
+            setattr(self, f'_{attr}', value)
+
+        return value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert back to json-like dict with original json keys.
+
+        Returns: Dict with original json keys (lazy sub-objects included raw).
+        """
+        result = {key: getattr(self, attr) for attr, key in self._FIELDS.items()}
+
+        for attr, key in self._LAZY_FIELDS.items():
+            value = getattr(self, f'_{attr}')
+            result[key] = value.to_dict() if isinstance(value, _Result) else value
+
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        """Compare by type and decoded values."""
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        """Show class name with non-lazy attributes."""
+        attrs = ', '.join(f'{a}={getattr(self, a)!r}' for a in self._FIELDS)
+        return f'{self.__class__.__name__}({attrs})'
+
+
+class Quote(_Result):
+    """Typed quote result of the most commonly used fields.
+
+    Attributes are snake_case versions of quote response json keys.
+    """
+
+    _FIELDS: ClassVar[dict[str, str]] = {
+        'symbol': 'symbol',
+        'quote_type': 'quoteType',
+        'short_name': 'shortName',
+        'long_name': 'longName',
+        'currency': 'currency',
+        'exchange': 'exchange',
+        'exchange_timezone_name': 'exchangeTimezoneName',
+        'market_state': 'marketState',
+        'regular_market_time': 'regularMarketTime',
+        'regular_market_price': 'regularMarketPrice',
+        'regular_market_change': 'regularMarketChange',
+        'regular_market_change_percent': 'regularMarketChangePercent',
+        'regular_market_open': 'regularMarketOpen',
+        'regular_market_day_high': 'regularMarketDayHigh',
+        'regular_market_day_low': 'regularMarketDayLow',
+        'regular_market_previous_close': 'regularMarketPreviousClose',
+        'regular_market_volume': 'regularMarketVolume',
+        'pre_market_price': 'preMarketPrice',
+        'post_market_price': 'postMarketPrice',
+        'bid': 'bid',
+        'ask': 'ask',
+        'bid_size': 'bidSize',
+        'ask_size': 'askSize',
+        'fifty_two_week_high': 'fiftyTwoWeekHigh',
+        'fifty_two_week_low': 'fiftyTwoWeekLow',
+        'market_cap': 'marketCap',
+        'shares_outstanding': 'sharesOutstanding',
+        'trailing_pe': 'trailingPE',
+        'forward_pe': 'forwardPE',
+        'dividend_yield': 'dividendYield',
+    }
+    __slots__ = tuple(_FIELDS)
+
+    symbol: str
+    quote_type: str | None
+    short_name: str | None
+    long_name: str | None
+    currency: str | None
+    exchange: str | None
+    exchange_timezone_name: str | None
+    market_state: str | None
+    regular_market_time: int | None
+    regular_market_price: float | None
+    regular_market_change: float | None
+    regular_market_change_percent: float | None
+    regular_market_open: float | None
+    regular_market_day_high: float | None
+    regular_market_day_low: float | None
+    regular_market_previous_close: float | None
+    regular_market_volume: int | None
+    pre_market_price: float | None
+    post_market_price: float | None
+    bid: float | None
+    ask: float | None
+    bid_size: int | None
+    ask_size: int | None
+    fifty_two_week_high: float | None
+    fifty_two_week_low: float | None
+    market_cap: int | None
+    shares_outstanding: int | None
+    trailing_pe: float | None
+    forward_pe: float | None
+    dividend_yield: float | None
+
+
+class TradingPeriod(_Result):
+    """Typed trading period of chart meta."""
+
+    _FIELDS: ClassVar[dict[str, str]] = {
+        'timezone': 'timezone',
+        'start': 'start',
+        'end': 'end',
+        'gmtoffset': 'gmtoffset',
+    }
+    __slots__ = tuple(_FIELDS)
+
+    timezone: str
+    start: int
+    end: int
+    gmtoffset: int
+
+
+class CurrentTradingPeriod(_Result):
+    """Typed pre, regular and post market trading periods of chart meta."""
+
+    _LAZY_FIELDS: ClassVar[dict[str, str]] = {
+        'pre': 'pre',
+        'regular': 'regular',
+        'post': 'post',
+    }
+    __slots__ = tuple(f'_{attr}' for attr in _LAZY_FIELDS)
+
+    @property
+    def pre(self) -> TradingPeriod | None:
+        """Pre market trading period."""
+        return self._get_lazy('pre', TradingPeriod)
+
+    @property
+    def regular(self) -> TradingPeriod | None:
+        """Regular market trading period."""
+        return self._get_lazy('regular', TradingPeriod)
+
+    @property
+    def post(self) -> TradingPeriod | None:
+        """Post market trading period."""
+        return self._get_lazy('post', TradingPeriod)
+
+
+class ChartMeta(_Result):
+    """Typed chart result meta.
+
+    Attributes are snake_case versions of chart meta json keys. Rarely used
+    current_trading_period is decoded on first access.
+    """
+
+    _FIELDS: ClassVar[dict[str, str]] = {
+        'symbol': 'symbol',
+        'currency': 'currency',
+        'exchange_name': 'exchangeName',
+        'full_exchange_name': 'fullExchangeName',
+        'instrument_type': 'instrumentType',
+        'first_trade_date': 'firstTradeDate',
+        'regular_market_time': 'regularMarketTime',
+        'has_pre_post_market_data': 'hasPrePostMarketData',
+        'gmtoffset': 'gmtoffset',
+        'timezone': 'timezone',
+        'exchange_timezone_name': 'exchangeTimezoneName',
+        'regular_market_price': 'regularMarketPrice',
+        'regular_market_day_high': 'regularMarketDayHigh',
+        'regular_market_day_low': 'regularMarketDayLow',
+        'regular_market_volume': 'regularMarketVolume',
+        'fifty_two_week_high': 'fiftyTwoWeekHigh',
+        'fifty_two_week_low': 'fiftyTwoWeekLow',
+        'long_name': 'longName',
+        'short_name': 'shortName',
+        'chart_previous_close': 'chartPreviousClose',
+        'price_hint': 'priceHint',
+        'data_granularity': 'dataGranularity',
+        'range': 'range',
+        'valid_ranges': 'validRanges',
+    }
+    _LAZY_FIELDS: ClassVar[dict[str, str]] = {
+        'current_trading_period': 'currentTradingPeriod'
+    }
+    __slots__ = (*_FIELDS, *(f'_{attr}' for attr in _LAZY_FIELDS))
+
+    symbol: str
+    currency: str | None
+    exchange_name: str | None
+    full_exchange_name: str | None
+    instrument_type: str | None
+    first_trade_date: int | None
+    regular_market_time: int | None
+    has_pre_post_market_data: bool | None
+    gmtoffset: int | None
+    timezone: str | None
+    exchange_timezone_name: str | None
+    regular_market_price: float | None
+    regular_market_day_high: float | None
+    regular_market_day_low: float | None
+    regular_market_volume: int | None
+    fifty_two_week_high: float | None
+    fifty_two_week_low: float | None
+    long_name: str | None
+    short_name: str | None
+    chart_previous_close: float | None
+    price_hint: int | None
+    data_granularity: str | None
+    range: str | None
+    valid_ranges: list[str] | None
+
+    @property
+    def current_trading_period(self) -> CurrentTradingPeriod | None:
+        """Current pre, regular and post market trading periods."""
+        return self._get_lazy('current_trading_period', CurrentTradingPeriod)
+
+
+class OptionContract(_Result):
+    """Typed option contract (call or put) of options result.
+
+    Attributes are snake_case versions of option contract json keys, plus
+    option_type (call or put).
+    """
+
+    _FIELDS: ClassVar[dict[str, str]] = {
+        'contract_symbol': 'contractSymbol',
+        'strike': 'strike',
+        'currency': 'currency',
+        'last_price': 'lastPrice',
+        'change': 'change',
+        'percent_change': 'percentChange',
+        'volume': 'volume',
+        'open_interest': 'openInterest',
+        'bid': 'bid',
+        'ask': 'ask',
+        'contract_size': 'contractSize',
+        'expiration': 'expiration',
+        'last_trade_date': 'lastTradeDate',
+        'implied_volatility': 'impliedVolatility',
+        'in_the_money': 'inTheMoney',
+    }
+    __slots__ = (*_FIELDS, 'option_type')
+
+    contract_symbol: str
+    strike: float
+    currency: str | None
+    last_price: float | None
+    change: float | None
+    percent_change: float | None
+    volume: int | None
+    open_interest: int | None
+    bid: float | None
+    ask: float | None
+    contract_size: str | None
+    expiration: int
+    last_trade_date: int | None
+    implied_volatility: float | None
+    in_the_money: bool | None
+    option_type: str | None
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any], option_type: str | None = None) -> Self:
+        """Create new instance from option contract json.
+
+        Args:
+            data: decoded option contract json object.
+            option_type: call or put.
+
+        Returns: Typed option contract.
+        """
+        obj = super().from_json(data)
+        obj.option_type = option_type
+        return obj
+
+
+class TimeseriesPoint(_Result):
+    """Typed single reported value of timeseries result.
+
+    Attributes:
+        ticker: Ticker symbol.
+        typ: Type incl. frequency, e.g. annualNetIncome.
+        as_of_date: Date of the reported value, e.g. 2024-12-31.
+        period_type: Reported period, e.g. 12M, 3M or TTM.
+        currency_code: Currency of the reported value.
+        value: Raw reported value.
+    """
+
+    __slots__ = (
+        'as_of_date',
+        'currency_code',
+        'period_type',
+        'ticker',
+        'typ',
+        'value',
+    )
+
+    ticker: str
+    typ: str
+    as_of_date: str
+    period_type: str | None
+    currency_code: str | None
+    value: float | None
+
+    def __init__(
+        self,
+        ticker: str,
+        typ: str,
+        as_of_date: str,
+        period_type: str | None,
+        currency_code: str | None,
+        value: float | None,
+    ) -> None:
+        self.ticker = ticker
+        self.typ = typ
+        self.as_of_date = as_of_date
+        self.period_type = period_type
+        self.currency_code = currency_code
+        self.value = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dict.
+
+        Returns: Dict with attribute names as keys.
+        """
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def __repr__(self) -> str:
+        """Show class name with attributes."""
+        attrs = ', '.join(f'{a}={getattr(self, a)!r}' for a in self.__slots__)
+        return f'{self.__class__.__name__}({attrs})'
+
+
+class TickerResults(Mapping[str, Any]):
+    """Results of multi-ticker calls keyed by normalized ticker.
+
+    Lookup by ticker is O(1) and iteration follows the order of requested tickers.
+    Tickers without result and tickers with more than one result are recorded
+    explicitly, for duplicates the first result is kept.
+
+    Attributes:
+        tickers: Requested tickers (normalized and deduplicated).
+        missing: Requested tickers without result.
+        duplicates: Tickers with more than one result.
+        unexpected: Tickers with result, that were not requested.
+    """
+
+    def __init__(self, tickers: list[str], results: list[tuple[str, Any]]) -> None:
+        """Create new TickerResults instance.
+
+        Args:
+            tickers: Requested tickers.
+            results: Pairs of (ticker, result).
+        """
+        self.tickers = list(dict.fromkeys(_normalize_ticker(t) for t in tickers))
+        self._results: dict[str, Any] = {}
+        self.duplicates: list[str] = []
+
+        for ticker, result in results:
+            ticker = _normalize_ticker(ticker)
+
+            if ticker in self._results:
+                self.duplicates.append(ticker)
+                continue
+
+            self._results[ticker] = result
+
+        requested = set(self.tickers)
+        self.missing = [t for t in self.tickers if t not in self._results]
+        self.unexpected = [t for t in self._results if t not in requested]
+
+    @classmethod
+    def from_symbol_results(
+        cls, tickers: list[str], results: list[dict[str, Any]], key: str = 'symbol'
+    ) -> Self:
+        """Index results, which carry their ticker, e.g. quote or quote type results.
+
+        Args:
+            tickers: Requested tickers.
+            results: List of result jsons, possibly in any order or incomplete.
+            key: Result json key with the ticker. (optional, default: symbol)
+
+        Returns: Ticker keyed results.
+        """
+        return cls(tickers, [(r.get(key) or '', r) for r in results])
+
+    @classmethod
+    def from_ordered_results(cls, tickers: list[str], results: list[Any]) -> Self:
+        """Index results in order of tickers, e.g. chart or quote summary results.
+
+        Args:
+            tickers: Requested tickers.
+            results: List of results, one for each ticker in the same order.
+
+        Returns: Ticker keyed results.
+        """
+        return cls(tickers, list(zip(tickers, results, strict=True)))
+
+    def __getitem__(self, ticker: str) -> Any:
+        """Get result for ticker (normalized before lookup)."""
+        return self._results[_normalize_ticker(ticker)]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over tickers with result in order of requested tickers."""
+        yield from (t for t in self.tickers if t in self._results)
+        yield from self.unexpected
+
+    def __len__(self) -> int:
+        """Number of tickers with result."""
+        return len(self._results)
+
+    def __repr__(self) -> str:
+        """Show tickers with result, missing and duplicate tickers."""
+        return (
+            f'{self.__class__.__name__}(tickers={list(self)!r}, '
+            f'missing={self.missing!r}, duplicates={self.duplicates!r})'
+        )
+
+    def values_of(self, field: str, default: Any = None) -> list[Any]:
+        """Extract field from result of each requested ticker.
+
+        Args:
+            field:
+                Result json key, nested keys are separated by dot,
+                e.g. regularMarketPrice or meta.regularMarketPrice.
+            default: Value for missing tickers and fields. (optional, default: None)
+
+        Returns: Field values in order of requested tickers.
+        """
+        keys = field.split('.')
+        values = []
+
+        for ticker in self.tickers:
+            value = self._results.get(ticker, default)
+
+            for key in keys:
+                if not isinstance(value, dict):
+                    value = default
+                    break
+
+                value = value.get(key, default)
+
+            values.append(value)
+
+        return values
+
+    def to_array(self, field: str) -> Any:
+        """Extract numeric field from result of each requested ticker as array.
+
+        Quote summary like {raw, fmt} values are unwrapped to raw. Requires numpy.
+
+        Args:
+            field:
+                Result json key, nested keys are separated by dot,
+                e.g. regularMarketPrice or meta.regularMarketPrice.
+
+        Returns:
+            Float numpy array in order of requested tickers, missing tickers and
+                fields are NaN.
+        """
+        np = _import_numpy()
+        # single conversion, None is NaN in float array
+        return np.array(
+            [
+                value.get('raw') if isinstance(value, dict) else value
+                for value in self.values_of(field)
+            ],
+            dtype=np.float64,
+        )
+
+
+class PartialResults(TickerResults):
+    """Ticker keyed results of fan-out, which tolerates failures of some tickers.
+
+    Attributes:
+        tickers: Requested tickers (normalized and deduplicated).
+        missing: Requested tickers without result (i.e. failed).
+        duplicates: Tickers with more than one result.
+        unexpected: Tickers with result, that were not requested.
+        errors: Last error of each failed ticker.
+        attempts: Number of attempts made for each ticker.
+    """
+
+    def __init__(
+        self,
+        tickers: list[str],
+        results: list[tuple[str, Any]],
+        errors: dict[str, Exception],
+        attempts: dict[str, int],
+    ) -> None:
+        """Create new PartialResults instance.
+
+        Args:
+            tickers: Requested tickers.
+            results: Pairs of (ticker, result) of succeeded tickers.
+            errors: Last error of each failed ticker.
+            attempts: Number of attempts made for each ticker.
+        """
+        super().__init__(tickers, results)
+        self.errors = errors
+        self.attempts = attempts
+
+    @property
+    def failed(self) -> list[str]:
+        """Failed tickers in order of requested tickers."""
+        return [t for t in self.tickers if t in self.errors]
+
+    def __repr__(self) -> str:
+        """Show succeeded and failed tickers."""
+        return (
+            f'{self.__class__.__name__}(tickers={list(self)!r}, failed={self.failed!r})'
+        )
+
+    def raise_for_errors(self) -> None:
+        """Raise errors of failed tickers, if any.
+
+        Raises:
+            ExceptionGroup: With errors of all failed tickers.
+        """
+        if self.errors:
+            raise ExceptionGroup(
+                f'{len(self.errors)} of {len(self.tickers)} tickers failed: '
+                f'{self.failed}',
+                [self.errors[t] for t in self.failed],
+            )
+
+
+def _load_json(data: JsonInput) -> Any:
+    return data if isinstance(data, dict) else json.loads(data)
+
+
+def decode_quotes(data: JsonInput) -> list[Quote]:
+    """Decode quote response into typed quotes.
+
+    Args:
+        data: Quote response content (bytes or str) or already decoded json.
+
+    Returns: List of typed quotes.
+    """
+    response_json = _load_json(data)
+    return [Quote.from_json(q) for q in response_json['quoteResponse']['result']]
+
+
+def decode_chart_meta(data: JsonInput) -> list[ChartMeta]:
+    """Decode chart response into typed chart metas.
+
+    Args:
+        data: Chart response content (bytes or str) or already decoded json.
+
+    Returns: List of typed chart metas.
+    """
+    response_json = _load_json(data)
+    return [ChartMeta.from_json(r['meta']) for r in response_json['chart']['result']]
+
+
+def decode_option_contracts(data: JsonInput) -> list[OptionContract]:
+    """Decode options response or options result into typed option contracts.
+
+    Args:
+        data:
+            Options response content (bytes or str), already decoded response json
+            or options result json, e.g. from Symbol.get_options.
+
+    Returns: List of typed calls and puts for all expiration dates.
+    """
+    decoded = _load_json(data)
+    results = (
+        decoded['optionChain']['result'] if 'optionChain' in decoded else [decoded]
+    )
+
+    return [
+        OptionContract.from_json(contract, option_type)
+        for result in results
+        for option in result['options']
+        for option_type, contracts_key in (('call', 'calls'), ('put', 'puts'))
+        for contract in option[contracts_key]
+    ]
+
+
+def decode_timeseries_points(
+    data: JsonInput | list[dict[str, Any]],
+) -> list[TimeseriesPoint]:
+    """Decode timeseries response or results into typed timeseries points.
+
+    Args:
+        data:
+            Timeseries response content (bytes or str), already decoded response
+            json or timeseries results, e.g. from Symbol.get_income_statement.
+
+    Returns: List of typed timeseries points, padded (None) values are skipped.
+    """
+    decoded = data if isinstance(data, list) else _load_json(data)
+    results = decoded if isinstance(decoded, list) else decoded['timeseries']['result']
+
+    points = []
+
+    for result in results:
+        meta = result['meta']
+        ticker = meta['symbol'][0]
+        typ = meta['type'][0]
+
+        for item in result.get(typ) or []:
+            if item is None:
+                continue
+
+            points.append(
+                TimeseriesPoint(
+                    ticker,
+                    typ,
+                    item['asOfDate'],
+                    item.get('periodType'),
+                    item.get('currencyCode'),
+                    item.get('reportedValue', {}).get('raw'),
+                )
+            )
+
+    return points
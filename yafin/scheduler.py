@@ -0,0 +1,527 @@
+import asyncio
+import heapq
+import logging
+from collections.abc import AsyncIterator, Iterable, Iterator
+from datetime import datetime, timedelta, timezone, tzinfo
+from time import sleep, time
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from .cache import no_cache
+from .exceptions import _REQUEST_ERRORS
+from .symbol import Symbol
+from .symbols import DEFAULT_CHUNK_SIZE, AsyncSymbols, Symbols
+from .utils import _error, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REGULAR_INTERVAL = 5.0
+DEFAULT_EXTENDED_INTERVAL = 30.0
+DEFAULT_CLOSED_INTERVAL = 900.0
+DEFAULT_TRADING_PERIODS_TTL = 86400.0
+
+# PREPRE and POSTPOST (overnight) are closed market, refreshed at the next session
+_EXTENDED_MARKET_STATES = {'PRE', 'POST'}
+# smallest chart request, only its meta with trading periods is used
+_TRADING_PERIODS_CHART_KWARGS: dict[str, Any] = {
+    'interval': '1d',
+    'period_range': '1d',
+    'include_div': False,
+    'include_split': False,
+    'include_earn': False,
+    'include_capital_gain': False,
+}
+
+
+def _get_timezone(name: str | None, gmtoffset: int | None) -> tzinfo | None:
+    """Get exchange timezone by name, fixed gmt offset if name is not known."""
+    if name:
+        try:
+            return ZoneInfo(name)
+
+        except (ZoneInfoNotFoundError, ValueError):
+            pass
+
+    return None if gmtoffset is None else timezone(timedelta(seconds=gmtoffset))
+
+
+def _project_start(start: float, tz: tzinfo, now: float) -> float:
+    """Project session start to the first weekday after now at the same local time.
+
+    Exchange holidays are not known, so session start on a holiday is refreshed
+    and projected again.
+    """
+    local_time = datetime.fromtimestamp(start, tz).time()
+    day = datetime.fromtimestamp(now, tz).date()
+
+    while True:
+        projected = datetime.combine(day, local_time, tzinfo=tz)
+
+        if projected.weekday() < 5 and projected.timestamp() > now:
+            return projected.timestamp()
+
+        day += timedelta(days=1)
+
+
+class SchedulerBase:
+    """Base for synchronous and asynchronous refresh schedulers.
+
+    Keeps next refresh time per ticker in a priority queue (min heap). After each
+    refresh, ticker is rescheduled by market state of its quote - regular market
+    every regular_interval, pre and post market every extended_interval and closed
+    market every closed_interval, but not later than the next session start,
+    if trading periods are known from chart meta. Sessions, that already ended, are
+    projected to the next weekday in exchange timezone. Tickers of the same exchange
+    share trading periods, so they are refreshed from chart of one ticker only.
+
+    Attributes:
+        regular_interval: Refresh interval in seconds during regular market.
+        extended_interval:
+            Refresh interval in seconds during pre and post market, None to refresh
+            only after the market opens.
+        closed_interval: Refresh interval in seconds of closed market.
+        batch_size: Max number of tickers in a single quote request.
+        trading_periods_ttl:
+            Age in seconds, after which trading periods of closed market are
+            refreshed from chart meta, None to only use set_trading_periods.
+    """
+
+    def __init__(
+        self,
+        tickers: str,
+        regular_interval: float = DEFAULT_REGULAR_INTERVAL,
+        extended_interval: float | None = DEFAULT_EXTENDED_INTERVAL,
+        closed_interval: float = DEFAULT_CLOSED_INTERVAL,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+        trading_periods_ttl: float | None = DEFAULT_TRADING_PERIODS_TTL,
+    ) -> None:
+        """Create new scheduler instance, all tickers are due immediately.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            regular_interval: Refresh interval in seconds during regular market.
+            extended_interval:
+                Refresh interval in seconds during pre and post market, None to
+                treat them as closed market.
+            closed_interval: Refresh interval in seconds of closed market.
+            batch_size: Max number of tickers in a single quote request.
+            trading_periods_ttl:
+                Age in seconds, after which trading periods of closed market are
+                refreshed from chart meta, None to only use set_trading_periods.
+        """
+        for name, value in (
+            ('regular_interval', regular_interval),
+            ('extended_interval', extended_interval),
+            ('closed_interval', closed_interval),
+            ('batch_size', batch_size),
+            ('trading_periods_ttl', trading_periods_ttl),
+        ):
+            if value is not None and value <= 0:
+                _error(
+                    msg=f'Invalid {name}={value}. Must be positive.', err_cls=ValueError
+                )
+
+        self.regular_interval = regular_interval
+        self.extended_interval = extended_interval
+        self.closed_interval = closed_interval
+        self.batch_size = batch_size
+        self.trading_periods_ttl = trading_periods_ttl
+        self._due: dict[str, float] = {}
+        # (due time, ticker), stale items (due time changed) are skipped on pop
+        self._heap: list[tuple[float, str]] = []
+        self._trading_periods: dict[str, dict[str, Any]] = {}
+        self._timezones: dict[str, tzinfo | None] = {}
+        # last (attempted) trading periods refresh time per ticker
+        self._trading_periods_updated: dict[str, float] = {}
+        self.add_tickers(tickers)
+
+    def add_tickers(self, tickers: str, due: float = 0.0) -> None:
+        """Schedule tickers.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            due: Refresh timestamp in seconds. (optional, default: immediately)
+        """
+        for ticker in tickers.split(','):
+            if ticker.strip():
+                self._schedule(_normalize_ticker(ticker), due)
+
+    def remove_tickers(self, tickers: str) -> None:
+        """Unschedule tickers.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+        """
+        for ticker in tickers.split(','):
+            self._due.pop(_normalize_ticker(ticker), None)
+
+    def _schedule(self, ticker: str, due: float) -> None:
+        self._due[ticker] = due
+        heapq.heappush(self._heap, (due, ticker))
+
+        # rescheduling leaves stale heap items behind, rebuild heap if they prevail
+        if len(self._heap) > 2 * len(self._due) + 64:
+            self._heap = [(d, t) for t, d in self._due.items()]
+            heapq.heapify(self._heap)
+
+    def set_trading_periods(
+        self, charts: Iterable[dict[str, Any]], now: float | None = None
+    ) -> None:
+        """Set trading periods of tickers from chart meta.
+
+        Args:
+            charts: Chart results with meta.currentTradingPeriod.
+            now: Current timestamp in seconds. (optional, default: now)
+        """
+        now = time() if now is None else now
+
+        for chart in charts:
+            meta = chart.get('meta', {})
+            trading_period = meta.get('currentTradingPeriod')
+
+            if meta.get('symbol') and trading_period:
+                ticker = _normalize_ticker(meta['symbol'])
+                self._trading_periods[ticker] = trading_period
+                self._timezones[ticker] = _get_timezone(
+                    meta.get('exchangeTimezoneName'),
+                    trading_period.get('regular', {}).get('gmtoffset'),
+                )
+                self._trading_periods_updated[ticker] = now
+
+    def _pop_stale_trading_periods(
+        self, tickers: list[str], quotes: list[dict[str, Any]], now: float | None
+    ) -> list[str]:
+        """Pop refreshed tickers of closed market with stale trading periods.
+
+        Popped tickers are marked as updated, so failed refresh of trading periods
+        is not retried before trading_periods_ttl.
+        """
+        if self.trading_periods_ttl is None:
+            return []
+
+        now = time() if now is None else now
+        quote_map = {_normalize_ticker(q.get('symbol') or ''): q for q in quotes}
+        stale_tickers = []
+
+        for ticker in tickers:
+            quote = quote_map.get(ticker)
+            updated = self._trading_periods_updated.get(ticker)
+
+            if (
+                quote is not None
+                and self._is_closed(ticker, quote, now)
+                and (updated is None or now - updated >= self.trading_periods_ttl)
+            ):
+                self._trading_periods_updated[ticker] = now
+                stale_tickers.append(ticker)
+
+        return stale_tickers
+
+    def _get_exchange_groups(
+        self, tickers: list[str], quotes: list[dict[str, Any]]
+    ) -> list[list[str]]:
+        """Group tickers by exchange of their quotes, ticker without it is alone."""
+        quote_map = {_normalize_ticker(q.get('symbol') or ''): q for q in quotes}
+        groups: dict[str, list[str]] = {}
+        single_groups = []
+
+        for ticker in tickers:
+            exchange = quote_map.get(ticker, {}).get('exchange')
+
+            if exchange:
+                groups.setdefault(exchange, []).append(ticker)
+
+            else:
+                single_groups.append([ticker])
+
+        return [*groups.values(), *single_groups]
+
+    def _set_exchange_trading_periods(
+        self, groups: list[list[str]], charts: Iterable[dict[str, Any]], now: float
+    ) -> None:
+        """Set trading periods from charts of first tickers to their exchange groups."""
+        self.set_trading_periods(charts, now)
+
+        for first, *others in groups:
+            if first not in self._trading_periods:
+                continue
+
+            for ticker in others:
+                self._trading_periods[ticker] = self._trading_periods[first]
+                self._timezones[ticker] = self._timezones[first]
+                self._trading_periods_updated[ticker] = now
+
+    def get_next_due(self) -> float | None:
+        """Get the earliest refresh timestamp.
+
+        Returns: Timestamp in seconds or None if no ticker is scheduled.
+        """
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float | None = None) -> list[str]:
+        """Pop tickers due for refresh, they are rescheduled by update.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Due tickers, the most overdue first.
+        """
+        now = time() if now is None else now
+        due_tickers = []
+
+        while (next_due := self.get_next_due()) is not None and next_due <= now:
+            _, ticker = heapq.heappop(self._heap)
+            # popped tickers stay known, so they are not added twice
+            self._due[ticker] = float('inf')
+            due_tickers.append(ticker)
+
+        return due_tickers
+
+    def _get_market_state(self, ticker: str, quote: dict[str, Any], now: float) -> str:
+        market_state = quote.get('marketState')
+
+        if market_state is not None:
+            return market_state
+
+        trading_period = self._trading_periods.get(ticker, {})
+
+        for period, state in (('regular', 'REGULAR'), ('pre', 'PRE'), ('post', 'POST')):
+            bounds = trading_period.get(period, {})
+
+            if bounds.get('start', now + 1) <= now < bounds.get('end', now):
+                return state
+
+        # without market state and trading periods, assume open market
+        return 'REGULAR' if not trading_period else 'CLOSED'
+
+    def _is_closed(self, ticker: str, quote: dict[str, Any], now: float) -> bool:
+        """Check if ticker is refreshed by closed_interval or at next session."""
+        market_state = self._get_market_state(ticker, quote, now)
+
+        if market_state in _EXTENDED_MARKET_STATES:
+            return not self.extended_interval
+
+        return market_state != 'REGULAR'
+
+    def _get_next_open(self, ticker: str, now: float) -> float | None:
+        trading_period = self._trading_periods.get(ticker, {})
+        tz = self._timezones.get(ticker)
+        periods = ('regular',) if self.extended_interval is None else ('pre', 'regular')
+        starts = []
+
+        for period in periods:
+            start = trading_period.get(period, {}).get('start')
+
+            if start is None:
+                continue
+
+            if start <= now and tz is not None:
+                start = _project_start(start, tz, now)
+
+            if start > now:
+                starts.append(start)
+
+        return min(starts, default=None)
+
+    def get_interval(self, ticker: str, quote: dict[str, Any], now: float) -> float:
+        """Get seconds until next refresh of ticker by its market state.
+
+        Args:
+            ticker: Ticker symbol.
+            quote: Latest quote result of ticker.
+            now: Current timestamp in seconds.
+
+        Returns: Refresh interval in seconds.
+        """
+        market_state = self._get_market_state(ticker, quote, now)
+
+        if market_state == 'REGULAR':
+            return self.regular_interval
+
+        if market_state in _EXTENDED_MARKET_STATES and self.extended_interval:
+            return self.extended_interval
+
+        next_open = self._get_next_open(ticker, now)
+        interval = self.closed_interval
+
+        if next_open is not None:
+            interval = min(interval, next_open - now)
+
+        return interval
+
+    def _reschedule_failed(self, tickers: list[str], now: float | None) -> None:
+        """Retry tickers of failed refresh after regular interval, not lose them."""
+        now = time() if now is None else now
+
+        for ticker in tickers:
+            if ticker in self._due:
+                self._schedule(ticker, now + self.regular_interval)
+
+    def update(
+        self,
+        tickers: list[str],
+        quotes: list[dict[str, Any]],
+        now: float | None = None,
+    ) -> None:
+        """Reschedule refreshed tickers by market state of their quotes.
+
+        Args:
+            tickers: Refreshed tickers, e.g. from pop_due.
+            quotes: Quote results of refreshed tickers.
+            now: Current timestamp in seconds. (optional, default: now)
+        """
+        now = time() if now is None else now
+        quote_map = {_normalize_ticker(q.get('symbol') or ''): q for q in quotes}
+
+        for ticker in tickers:
+            if ticker not in self._due:
+                # removed during refresh
+                continue
+
+            quote = quote_map.get(ticker)
+            # ticker without quote (e.g. delisted) is retried as if closed
+            interval = (
+                self.closed_interval
+                if quote is None
+                else self.get_interval(ticker, quote, now)
+            )
+            self._schedule(ticker, now + interval)
+
+
+class RefreshScheduler(SchedulerBase):
+    """Market hours aware quote refresh scheduler for many tickers.
+
+    Due tickers are refreshed in multi-ticker quote requests (bypassing the
+    response cache) and rescheduled by their market state, so closed markets cost
+    (almost) no requests. Trading periods of closed markets are refreshed from chart
+    meta once older than trading_periods_ttl.
+    """
+
+    def refresh(self, now: float | None = None) -> list[dict[str, Any]]:
+        """Refresh quotes of due tickers.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Quote results of due tickers.
+        """
+        tickers = self.pop_due(now)
+
+        if not tickers:
+            return []
+
+        try:
+            with no_cache(), Symbols(','.join(tickers), self.batch_size) as symbols:
+                quotes = symbols.get_quote()
+
+        except Exception:
+            self._reschedule_failed(tickers, now)
+            raise
+
+        if stale_tickers := self._pop_stale_trading_periods(tickers, quotes, now):
+            self._refresh_trading_periods(stale_tickers, quotes, now)
+
+        self.update(tickers, quotes, now)
+        return quotes
+
+    def _refresh_trading_periods(
+        self, tickers: list[str], quotes: list[dict[str, Any]], now: float | None
+    ) -> None:
+        """Refresh trading periods from chart meta of a single ticker per exchange.
+
+        Failed exchanges are skipped.
+        """
+        now = time() if now is None else now
+        groups = self._get_exchange_groups(tickers, quotes)
+        charts = []
+
+        with no_cache():
+            for first, *_ in groups:
+                try:
+                    with Symbol(first) as symbol:
+                        charts.append(symbol.get_chart(**_TRADING_PERIODS_CHART_KWARGS))
+
+                except _REQUEST_ERRORS as exc:
+                    logger.warning(f'Trading periods of {first} not refreshed: {exc!r}')
+
+        self._set_exchange_trading_periods(groups, charts, now)
+
+    def __iter__(self) -> Iterator[list[dict[str, Any]]]:
+        """Wait for due tickers and yield their refreshed quotes."""
+        while (next_due := self.get_next_due()) is not None:
+            sleep(max(next_due - time(), 0))
+            quotes = self.refresh()
+
+            if quotes:
+                yield quotes
+
+
+class AsyncRefreshScheduler(SchedulerBase):
+    """Asynchronous market hours aware quote refresh scheduler for many tickers.
+
+    Due tickers are refreshed in multi-ticker quote requests (bypassing the
+    response cache) and rescheduled by their market state, so closed markets cost
+    (almost) no requests. Trading periods of closed markets are refreshed from chart
+    meta once older than trading_periods_ttl.
+    """
+
+    async def refresh(self, now: float | None = None) -> list[dict[str, Any]]:
+        """Refresh quotes of due tickers.
+
+        Args:
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Quote results of due tickers.
+        """
+        tickers = self.pop_due(now)
+
+        if not tickers:
+            return []
+
+        try:
+            with no_cache():
+                async with AsyncSymbols(','.join(tickers), self.batch_size) as symbols:
+                    quotes = await symbols.get_quote()
+
+        except Exception:
+            self._reschedule_failed(tickers, now)
+            raise
+
+        if stale_tickers := self._pop_stale_trading_periods(tickers, quotes, now):
+            await self._refresh_trading_periods(stale_tickers, quotes, now)
+
+        self.update(tickers, quotes, now)
+        return quotes
+
+    async def _refresh_trading_periods(
+        self, tickers: list[str], quotes: list[dict[str, Any]], now: float | None
+    ) -> None:
+        """Refresh trading periods from chart meta of a single ticker per exchange.
+
+        Failed exchanges are skipped.
+        """
+        now = time() if now is None else now
+        groups = self._get_exchange_groups(tickers, quotes)
+
+        with no_cache():
+            async with AsyncSymbols(','.join(g[0] for g in groups)) as symbols:
+                results = await symbols.fan_out(
+                    'get_chart', max_retries=0, **_TRADING_PERIODS_CHART_KWARGS
+                )
+
+        for ticker, exc in results.errors.items():
+            logger.warning(f'Trading periods of {ticker} not refreshed: {exc!r}')
+
+        self._set_exchange_trading_periods(groups, results.values(), now)
+
+    async def __aiter__(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Wait for due tickers and yield their refreshed quotes."""
+        while (next_due := self.get_next_due()) is not None:
+            await asyncio.sleep(max(next_due - time(), 0))
+            quotes = await self.refresh()
+
+            if quotes:
+                yield quotes
@@ -0,0 +1,497 @@
+import bisect
+import csv
+import logging
+import os
+import re
+from collections.abc import Iterable
+from contextlib import nullcontext
+from pathlib import Path
+from time import time
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from .cache import no_cache
+from .client import (
+    AsyncClient,
+    Client,
+    _SingletonAsyncClientManager,
+    _SingletonClientManager,
+)
+from .symbols import AsyncSymbols, Symbols
+from .utils import _error, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_TTL = 86_400.0
+DEFAULT_SEARCH_LIMIT = 10
+CSV_FIELDS = ('symbol', 'name', 'exchange', 'quote_type')
+
+_WORD_PATTERN = re.compile(r'[^\W_]+')
+
+
+class SearchEntry(NamedTuple):
+    """Symbol of search index.
+
+    Attributes:
+        symbol: Ticker symbol.
+        name: Long or short name.
+        exchange: Exchange code, e.g. NMS.
+        quote_type: Quote type, e.g. EQUITY.
+        updated: Timestamp in seconds of the last update.
+    """
+
+    symbol: str
+    name: str | None = None
+    exchange: str | None = None
+    quote_type: str | None = None
+    updated: float = 0.0
+
+
+def _get_name_keys(name: str | None) -> set[str]:
+    """Get index keys of name - whole name and its words, upper-cased."""
+    if not name:
+        return set()
+
+    upper_name = name.upper()
+    return {upper_name, *_WORD_PATTERN.findall(upper_name)}
+
+
+class SearchIndex:
+    """Local prefix index of symbols and their names.
+
+    Keys are kept in sorted arrays, so prefix query is a binary search and slice
+    of at most limit keys - symbols first (exact match first), then names and their
+    words.
+    """
+
+    def __init__(self, entries: Iterable[SearchEntry] = ()) -> None:
+        """Create new SearchIndex instance.
+
+        Args:
+            entries: Initial entries.
+        """
+        self._entries: dict[str, SearchEntry] = {}
+        self._symbol_keys: list[str] = []
+        # (key, symbol) of names and their words
+        self._name_keys: list[tuple[str, str]] = []
+        self.add(entries)
+
+    def __len__(self) -> int:
+        """Number of symbols in index."""
+        return len(self._entries)
+
+    def __contains__(self, symbol: object) -> bool:
+        """Whether symbol is in index."""
+        return isinstance(symbol, str) and _normalize_ticker(symbol) in self._entries
+
+    def get(self, symbol: str) -> SearchEntry | None:
+        """Get entry of symbol.
+
+        Args:
+            symbol: Ticker symbol.
+
+        Returns: Entry or None if symbol is not in index.
+        """
+        return self._entries.get(_normalize_ticker(symbol))
+
+    def add(self, entries: Iterable[SearchEntry]) -> None:
+        """Add or replace entries by symbol.
+
+        Args:
+            entries: Entries to add.
+        """
+        new_symbol_keys: list[str] = []
+        new_name_keys: list[tuple[str, str]] = []
+        # last entry of duplicated symbol wins, keys are computed once per symbol
+        batch = {
+            symbol: entry._replace(symbol=symbol)
+            for entry in entries
+            if (symbol := _normalize_ticker(entry.symbol))
+        }
+
+        for symbol, entry in batch.items():
+            previous = self._entries.get(symbol)
+            self._entries[symbol] = entry
+            name_keys = _get_name_keys(entry.name)
+
+            if previous is None:
+                new_symbol_keys.append(symbol)
+
+            else:
+                previous_name_keys = _get_name_keys(previous.name)
+
+                for key in previous_name_keys - name_keys:
+                    i = bisect.bisect_left(self._name_keys, (key, symbol))
+
+                    if i < len(self._name_keys) and self._name_keys[i] == (key, symbol):
+                        del self._name_keys[i]
+
+                name_keys -= previous_name_keys
+
+            new_name_keys.extend((key, symbol) for key in name_keys)
+
+        self._insert(self._symbol_keys, new_symbol_keys)
+        self._insert(self._name_keys, new_name_keys)
+
+    @staticmethod
+    def _insert(keys: list[Any], new_keys: list[Any]) -> None:
+        # bulk loads are sorted once, few new keys are inserted in place
+        if len(new_keys) > 64:
+            keys.extend(new_keys)
+            keys.sort()
+
+        else:
+            for key in new_keys:
+                bisect.insort(keys, key)
+
+    def add_search_results(self, quotes: list[dict[str, Any]], now: float) -> None:
+        """Add quotes of search results.
+
+        Args:
+            quotes: Quotes of search response json, e.g. get_search()['quotes'].
+            now: Timestamp in seconds of search.
+        """
+        self.add(
+            SearchEntry(
+                quote['symbol'],
+                quote.get('longname') or quote.get('shortname'),
+                quote.get('exchange'),
+                quote.get('quoteType'),
+                now,
+            )
+            for quote in quotes
+            if quote.get('symbol')
+        )
+
+    def add_quote_type_results(self, results: list[dict[str, Any]], now: float) -> None:
+        """Add quote type results.
+
+        Args:
+            results: Quote type results, e.g. from Symbols.get_quote_type.
+            now: Timestamp in seconds of quote type request.
+        """
+        self.add(
+            SearchEntry(
+                result['symbol'],
+                result.get('longName') or result.get('shortName'),
+                result.get('exchange'),
+                result.get('quoteType'),
+                now,
+            )
+            for result in results
+            if result.get('symbol')
+        )
+
+    def load_csv(self, path: str | os.PathLike[str], now: float | None = None) -> None:
+        """Add symbols from csv with header symbol,name,exchange,quote_type.
+
+        Args:
+            path: Path of csv file, e.g. bundled symbol list.
+            now:
+                Timestamp in seconds of symbols, they are refreshed ttl after it.
+                (optional, default: now)
+        """
+        path = Path(path)
+        # not file modification time, bundled lists would be stale right away
+        updated = time() if now is None else now
+
+        with path.open(newline='', encoding='utf-8') as f:
+            self.add(
+                SearchEntry(
+                    row['symbol'],
+                    row.get('name') or None,
+                    row.get('exchange') or None,
+                    row.get('quote_type') or None,
+                    updated,
+                )
+                for row in csv.DictReader(f)
+                if row.get('symbol')
+            )
+
+    def save_csv(self, path: str | os.PathLike[str]) -> None:
+        """Save symbols into csv with header symbol,name,exchange,quote_type.
+
+        Args:
+            path: Path of csv file.
+        """
+        with Path(path).open('w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(
+                (e.symbol, e.name or '', e.exchange or '', e.quote_type or '')
+                for e in self._entries.values()
+            )
+
+    def search(
+        self, query: str, limit: int = DEFAULT_SEARCH_LIMIT
+    ) -> list[SearchEntry]:
+        """Search symbols and names starting with query.
+
+        Args:
+            query: Prefix of symbol, name or word of name, case-insensitive.
+            limit: Max number of entries.
+
+        Returns: Entries of symbols first (exact match first), then of names.
+        """
+        prefix = query.strip().upper()
+
+        if not prefix or limit <= 0:
+            return []
+
+        symbols: dict[str, None] = {}
+        i = bisect.bisect_left(self._symbol_keys, prefix)
+
+        while (
+            len(symbols) < limit
+            and i < len(self._symbol_keys)
+            and self._symbol_keys[i].startswith(prefix)
+        ):
+            symbols[self._symbol_keys[i]] = None
+            i += 1
+
+        i = bisect.bisect_left(self._name_keys, (prefix, ''))
+
+        while (
+            len(symbols) < limit
+            and i < len(self._name_keys)
+            and self._name_keys[i][0].startswith(prefix)
+        ):
+            symbols[self._name_keys[i][1]] = None
+            i += 1
+
+        return [self._entries[symbol] for symbol in symbols]
+
+
+class SymbolSearchBase:
+    """Base for synchronous and asynchronous symbol search.
+
+    Queries are answered from local index. Network search is used only on miss
+    (fewer than min_results entries, through the response cache) or when entries
+    are older than ttl (bypassing the response cache), its results are written back
+    into the index. Each query is searched on network
+    at most once per ttl, even if it has no results.
+
+    Attributes:
+        index: Local search index.
+        ttl: Seconds after which entries and searched queries are stale.
+        min_results: Min number of entries to answer query locally.
+    """
+
+    def __init__(
+        self,
+        index: SearchIndex | None = None,
+        ttl: float = DEFAULT_SEARCH_TTL,
+        min_results: int = 1,
+    ) -> None:
+        """Create new symbol search instance.
+
+        Args:
+            index: Local search index. (optional, default: empty index)
+            ttl: Seconds after which entries and searched queries are stale.
+            min_results: Min number of entries to answer query locally.
+        """
+        if ttl < 0:
+            _error(msg=f'Invalid {ttl=}. Must not be negative.', err_cls=ValueError)
+
+        self.index = SearchIndex() if index is None else index
+        self.ttl = ttl
+        self.min_results = min_results
+        # normalized query -> timestamp of its network search
+        self._searched: dict[str, float] = {}
+
+    def _needs_search(
+        self, query: str, entries: list[SearchEntry], limit: int, now: float
+    ) -> bool:
+        searched = self._searched.get(query)
+
+        if not query or (searched is not None and 0 <= now - searched < self.ttl):
+            return False
+
+        return len(entries) < min(self.min_results, limit) or self._is_stale(
+            entries, now
+        )
+
+    def _is_stale(self, entries: list[SearchEntry], now: float) -> bool:
+        return any(now - entry.updated >= self.ttl for entry in entries)
+
+    def _add_search_results(
+        self, query: str, search_json: dict[str, Any], now: float
+    ) -> None:
+        self._searched[query] = now
+        self.index.add_search_results(search_json.get('quotes') or [], now)
+
+
+class SymbolSearch(SymbolSearchBase):
+    """Symbol search answered from local prefix index with network refills.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+    """
+
+    def __init__(
+        self,
+        index: SearchIndex | None = None,
+        ttl: float = DEFAULT_SEARCH_TTL,
+        min_results: int = 1,
+    ) -> None:
+        """Create new SymbolSearch instance.
+
+        Args:
+            index: Local search index. (optional, default: empty index)
+            ttl: Seconds after which entries and searched queries are stale.
+            min_results: Min number of entries to answer query locally.
+        """
+        super().__init__(index, ttl, min_results)
+        self._client: Client | None = None
+
+    def close(self) -> None:
+        """Release the client if open."""
+        if self._client is not None:
+            _SingletonClientManager._release_client()
+            self._client = None
+
+    def __enter__(self) -> Self:
+        """When entering context manager, return the search."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing context manager, release the client."""
+        self.close()
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        now: float | None = None,
+    ) -> list[SearchEntry]:
+        """Search symbols and names starting with query, refilled from network.
+
+        Args:
+            query: Prefix of symbol, name or word of name, case-insensitive.
+            limit: Max number of entries.
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Entries of symbols first (exact match first), then of names.
+        """
+        now = time() if now is None else now
+        query = query.strip().upper()
+        entries = self.index.search(query, limit)
+
+        if not self._needs_search(query, entries, limit, now):
+            return entries
+
+        if self._client is None:
+            self._client = _SingletonClientManager._get_client()
+
+        # misses are refilled through the response cache, stale entries bypass it
+        with no_cache() if self._is_stale(entries, now) else nullcontext():
+            search_json = self._client.get_search(query)
+
+        self._add_search_results(query, search_json, now)
+        return self.index.search(query, limit)
+
+    def add_tickers(self, tickers: str, now: float | None = None) -> None:
+        """Add tickers to index from quote type requests.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            now: Current timestamp in seconds. (optional, default: now)
+        """
+        now = time() if now is None else now
+
+        with Symbols(tickers) as symbols:
+            self.index.add_quote_type_results(symbols.get_quote_type(), now)
+
+
+class AsyncSymbolSearch(SymbolSearchBase):
+    """Asynchronous symbol search answered from local prefix index with refills.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+    """
+
+    def __init__(
+        self,
+        index: SearchIndex | None = None,
+        ttl: float = DEFAULT_SEARCH_TTL,
+        min_results: int = 1,
+    ) -> None:
+        """Create new AsyncSymbolSearch instance.
+
+        Args:
+            index: Local search index. (optional, default: empty index)
+            ttl: Seconds after which entries and searched queries are stale.
+            min_results: Min number of entries to answer query locally.
+        """
+        super().__init__(index, ttl, min_results)
+        self._client: AsyncClient | None = None
+
+    async def close(self) -> None:
+        """Release the client if open."""
+        if self._client is not None:
+            await _SingletonAsyncClientManager._release_client()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        """When entering async context manager, return the search."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing async context manager, release the client."""
+        await self.close()
+
+    async def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        now: float | None = None,
+    ) -> list[SearchEntry]:
+        """Search symbols and names starting with query, refilled from network.
+
+        Args:
+            query: Prefix of symbol, name or word of name, case-insensitive.
+            limit: Max number of entries.
+            now: Current timestamp in seconds. (optional, default: now)
+
+        Returns: Entries of symbols first (exact match first), then of names.
+        """
+        now = time() if now is None else now
+        query = query.strip().upper()
+        entries = self.index.search(query, limit)
+
+        if not self._needs_search(query, entries, limit, now):
+            return entries
+
+        if self._client is None:
+            self._client = _SingletonAsyncClientManager._get_client()
+
+        # misses are refilled through the response cache, stale entries bypass it
+        with no_cache() if self._is_stale(entries, now) else nullcontext():
+            search_json = await self._client.get_search(query)
+
+        self._add_search_results(query, search_json, now)
+        return self.index.search(query, limit)
+
+    async def add_tickers(self, tickers: str, now: float | None = None) -> None:
+        """Add tickers to index from quote type requests.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+            now: Current timestamp in seconds. (optional, default: now)
+        """
+        now = time() if now is None else now
+
+        async with AsyncSymbols(tickers) as symbols:
+            self.index.add_quote_type_results(await symbols.get_quote_type(), now)
@@ -0,0 +1,555 @@
+import json
+import logging
+import os
+import pathlib
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from itertools import repeat
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from .financials import Financials, pivot_financials
+from .utils import _error, _get_chart_array, _import_numpy, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+# fixed-width little-endian columns, row i of all columns is bar i
+COLUMNS = {
+    'timestamp': '<i8',
+    'open': '<f8',
+    'high': '<f8',
+    'low': '<f8',
+    'close': '<f8',
+    'volume': '<f8',
+}
+META_FILE_NAME = 'meta.json'
+SQL_FILE_NAME = 'yafin.sqlite'
+
+# clustered (WITHOUT ROWID) primary keys lead with ticker and time, so filters on
+# them are index range scans, also through the views, which sqlite flattens
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quote_snapshots (
+    ticker TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    price REAL,
+    volume REAL,
+    currency TEXT,
+    quote TEXT NOT NULL,
+    PRIMARY KEY (ticker, timestamp)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS financials (
+    ticker TEXT NOT NULL,
+    type TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    as_of_date TEXT NOT NULL,
+    currency TEXT,
+    value REAL,
+    PRIMARY KEY (ticker, type, frequency, as_of_date)
+) WITHOUT ROWID;
+CREATE VIEW IF NOT EXISTS latest_quotes AS
+    SELECT ticker, max(timestamp) AS timestamp, price, volume, currency, quote
+    FROM quote_snapshots
+    GROUP BY ticker;
+"""
+# bars of chart store mirrored for cross-ticker queries, temporary table is not
+# stored in database file, clustered primary key keeps ticker, interval and time
+# filters index range scans
+_BARS_SCHEMA = """
+CREATE TEMP TABLE IF NOT EXISTS bars (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume REAL,
+    PRIMARY KEY (ticker, interval, timestamp)
+) WITHOUT ROWID
+"""
+
+
+class StoredBars(NamedTuple):
+    """Stored bars of ticker and interval, zero-copy memory-mapped views.
+
+    Attributes:
+        timestamp: Sorted int numpy array of bar timestamps in seconds.
+        open: Float numpy array of open prices, NaN for bars without data.
+        high: Float numpy array of high prices.
+        low: Float numpy array of low prices.
+        close: Float numpy array of close prices.
+        volume: Float numpy array of volumes.
+    """
+
+    timestamp: Any
+    open: Any
+    high: Any
+    low: Any
+    close: Any
+    volume: Any
+
+
+class ChartStore:
+    """Append-only local store of chart bars per ticker and interval.
+
+    Each (interval, ticker) is a directory of fixed-width binary column files,
+    which are memory-mapped on read and only ever appended to or replaced.
+    Timestamp column is sorted, so range reads are binary searches and slices of
+    the mapped columns (no copy, no parsing). Row count, start of covered period
+    and last chart meta are kept in meta.json, which is replaced atomically after
+    columns are written, so readers never see partially appended rows.
+    Requires numpy.
+
+    Attributes:
+        path: Root directory of the store.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Create new ChartStore instance.
+
+        Args:
+            path: Root directory of the store, created if missing.
+        """
+        self.path = pathlib.Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        """Show store path."""
+        return f'{self.__class__.__name__}(path={str(self.path)!r})'
+
+    def _get_dir(self, ticker: str, interval: str) -> pathlib.Path:
+        return self.path.joinpath(interval, _normalize_ticker(ticker))
+
+    def _read_meta(self, directory: pathlib.Path) -> dict[str, Any]:
+        meta_path = directory.joinpath(META_FILE_NAME)
+
+        if not meta_path.exists():
+            return {'rows': 0, 'start': None, 'meta': {}}
+
+        return json.loads(meta_path.read_text())
+
+    def _write_meta(self, directory: pathlib.Path, meta: dict[str, Any]) -> None:
+        tmp_path = directory.joinpath(f'{META_FILE_NAME}.tmp')
+        tmp_path.write_text(json.dumps(meta))
+        os.replace(tmp_path, directory.joinpath(META_FILE_NAME))
+
+    def _map_column(self, directory: pathlib.Path, column: str, rows: int) -> Any:
+        np = _import_numpy()
+
+        if not rows:
+            return np.empty(0, dtype=COLUMNS[column])
+
+        return np.memmap(
+            directory.joinpath(column), dtype=COLUMNS[column], mode='r', shape=(rows,)
+        )
+
+    def get_range(self, ticker: str, interval: str) -> tuple[int, int] | None:
+        """Get stored time range.
+
+        Args:
+            ticker: Ticker symbol.
+            interval: Data interval.
+
+        Returns:
+            Start of covered period and last bar timestamp in seconds or None if
+                nothing is stored.
+        """
+        directory = self._get_dir(ticker, interval)
+        stored_meta = self._read_meta(directory)
+        rows = stored_meta['rows']
+
+        if not rows:
+            return None
+
+        timestamp = self._map_column(directory, 'timestamp', rows)
+        return int(stored_meta['start']), int(timestamp[-1])
+
+    def _get_versions(self) -> dict[tuple[str, str], tuple[int, int]]:
+        """Get version of each stored (ticker, interval), changed by every append.
+
+        Meta file is replaced on each append, so its inode and mtime are the version.
+        """
+        versions = {}
+
+        for meta_path in self.path.glob(f'*/*/{META_FILE_NAME}'):
+            stat = meta_path.stat()
+            key = (meta_path.parent.name, meta_path.parent.parent.name)
+            versions[key] = (stat.st_ino, stat.st_mtime_ns)
+
+        return versions
+
+    def append(
+        self,
+        chart: dict[str, Any],
+        start: int | float | None = None,
+        interval: str | None = None,
+    ) -> int:
+        """Append bars of chart result.
+
+        Stored bars from the first timestamp of chart on are replaced, so the last
+        (possibly incomplete) bar is refreshed by overlapping appends and chart
+        starting before the stored bars rewrites them. Replaced column files are
+        rewritten into new files, so views returned by read stay valid.
+
+        Args:
+            chart: Chart result, e.g. from Symbol.get_chart.
+            start:
+                Start timestamp of period covered by chart, e.g. requested period1,
+                which may be before its first bar (holidays, listing date, intraday
+                history limit). (optional, default: first bar timestamp)
+            interval:
+                Data interval to store bars under, e.g. requested interval, which
+                may differ from dataGranularity of chart meta.
+                (optional, default: dataGranularity of chart meta)
+
+        Returns: Number of rows written.
+
+        Raises:
+            ValueError: If chart meta lacks symbol or interval is not known.
+        """
+        np = _import_numpy()
+        meta = chart.get('meta', {})
+        ticker = meta.get('symbol')
+        interval = interval or meta.get('dataGranularity')
+
+        if not ticker or not interval:
+            _error(
+                msg='Chart meta has no symbol or dataGranularity.', err_cls=ValueError
+            )
+
+        timestamp = _get_chart_array(chart, 'timestamp')
+        # duplicated or unsorted bars are merged, keeping the last of each timestamp
+        reversed_index = np.unique(timestamp[::-1], return_index=True)[1]
+        index = len(timestamp) - 1 - reversed_index
+        values = {
+            column: (
+                timestamp if column == 'timestamp' else _get_chart_array(chart, column)
+            )[index].astype(dtype)
+            for column, dtype in COLUMNS.items()
+        }
+
+        directory = self._get_dir(ticker, interval)
+
+        with self._lock:
+            directory.mkdir(parents=True, exist_ok=True)
+            stored_meta = self._read_meta(directory)
+            rows = stored_meta['rows']
+            stored_timestamp = self._map_column(directory, 'timestamp', rows)
+            cut = (
+                int(np.searchsorted(stored_timestamp, values['timestamp'][0]))
+                if len(index)
+                else rows
+            )
+            del stored_timestamp
+
+            if cut < rows:
+                # shrink first, so rows being replaced are never visible as stale
+                self._write_meta(directory, {**stored_meta, 'rows': cut})
+
+            for column, dtype in COLUMNS.items():
+                itemsize = np.dtype(dtype).itemsize
+                column_path = directory.joinpath(column)
+
+                if cut < rows:
+                    # mapped views keep the replaced file, it is never shrunk in place
+                    tmp_path = directory.joinpath(f'{column}.tmp')
+
+                    with column_path.open('rb') as src, tmp_path.open('wb') as f:
+                        f.write(src.read(cut * itemsize))
+                        f.write(values[column].tobytes())
+
+                    os.replace(tmp_path, column_path)
+
+                else:
+                    with column_path.open('ab') as f:
+                        # drop tail of interrupted append, it is past mapped rows
+                        f.truncate(rows * itemsize)
+                        f.write(values[column].tobytes())
+
+            if not cut:
+                first_timestamp = int(values['timestamp'][0]) if len(index) else None
+                stored_meta['start'] = min(
+                    (int(t) for t in (start, first_timestamp) if t is not None),
+                    default=None,
+                )
+
+            self._write_meta(
+                directory,
+                {'rows': cut + len(index), 'start': stored_meta['start'], 'meta': meta},
+            )
+
+        logger.debug(f'Stored {len(index)} {interval} bars of {ticker} from {cut=}.')
+        return len(index)
+
+    def read(
+        self,
+        ticker: str,
+        interval: str,
+        start: int | float | None = None,
+        end: int | float | None = None,
+    ) -> StoredBars:
+        """Read stored bars in time range.
+
+        Args:
+            ticker: Ticker symbol.
+            interval: Data interval.
+            start: Start timestamp in seconds (incl.). (optional, default: None)
+            end: End timestamp in seconds (excl.). (optional, default: None)
+
+        Returns: Zero-copy memory-mapped views of stored columns in time range.
+        """
+        np = _import_numpy()
+        directory = self._get_dir(ticker, interval)
+        rows = self._read_meta(directory)['rows']
+        timestamp = self._map_column(directory, 'timestamp', rows)
+        time_slice = slice(
+            None if start is None else int(np.searchsorted(timestamp, start)),
+            None if end is None else int(np.searchsorted(timestamp, end)),
+        )
+        return StoredBars(
+            *(
+                timestamp[time_slice]
+                if column == 'timestamp'
+                else self._map_column(directory, column, rows)[time_slice]
+                for column in COLUMNS
+            )
+        )
+
+    def read_chart(
+        self,
+        ticker: str,
+        interval: str,
+        start: int | float | None = None,
+        end: int | float | None = None,
+    ) -> dict[str, Any]:
+        """Read stored bars in time range as chart result.
+
+        Args:
+            ticker: Ticker symbol.
+            interval: Data interval.
+            start: Start timestamp in seconds (incl.). (optional, default: None)
+            end: End timestamp in seconds (excl.). (optional, default: None)
+
+        Returns:
+            Chart result with meta of the last appended chart and stored bars,
+                NaN values are None as in Yahoo responses.
+        """
+        np = _import_numpy()
+        bars = self.read(ticker, interval, start, end)
+        quote = {}
+
+        for column, values in bars._asdict().items():
+            if column != 'timestamp':
+                quote[column] = np.where(np.isnan(values), None, values).tolist()
+
+        return {
+            'meta': self._read_meta(self._get_dir(ticker, interval))['meta'],
+            'timestamp': bars.timestamp.tolist(),
+            'indicators': {'quote': [quote]},
+        }
+
+
+class SqlStore:
+    """SQL query layer over locally stored charts, quotes and financials.
+
+    Quote snapshots and financial statements are stored in a SQLite database
+    (standard library, no extra dependency), so repeated questions are answered
+    locally by ad-hoc SQL instead of new requests. Bars of all tickers and
+    intervals of chart store are queried as temporary table bars (ticker, interval,
+    timestamp, open, high, low, close, volume), which is not stored in database
+    file. It is synced before queries, copying only charts appended since the
+    previous query. Tables bars, quote_snapshots and financials (and view
+    latest_quotes) are clustered by ticker and time, so filters on them are pushed
+    down to index range scans.
+
+    Attributes:
+        path: Path of the database file.
+        chart_store: Chart store queried as table bars.
+    """
+
+    def __init__(
+        self, path: str | os.PathLike[str], chart_store: ChartStore | None = None
+    ) -> None:
+        """Create new SqlStore instance.
+
+        Args:
+            path:
+                Database file or directory (database is yafin.sqlite in it), created
+                if missing. Use :memory: for in-memory database.
+            chart_store: Chart store queried as table bars. (optional, default: None)
+        """
+        path = pathlib.Path(path)
+
+        if path.is_dir():
+            path = path.joinpath(SQL_FILE_NAME)
+
+        self.path = path
+        self.chart_store = chart_store
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # version of each chart mirrored into table bars
+        self._bars_versions: dict[tuple[str, str], tuple[int, int]] = {}
+
+        if chart_store is not None:
+            self._connection.execute(_BARS_SCHEMA)
+
+    def __repr__(self) -> str:
+        """Show database path."""
+        return f'{self.__class__.__name__}(path={str(self.path)!r})'
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+
+    def __enter__(self) -> Self:
+        """When entering context manager, return the store."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing context manager, close the database connection."""
+        self.close()
+
+    def _write(self, sql: str, rows: Iterable[tuple[Any, ...]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(sql, rows)
+
+    def add_quotes(self, quotes: Iterable[dict[str, Any]]) -> None:
+        """Add snapshots of quote results.
+
+        Args:
+            quotes: Quote results, e.g. from Symbols.get_quote.
+        """
+        self._write(
+            'INSERT OR REPLACE INTO quote_snapshots VALUES (?, ?, ?, ?, ?, ?)',
+            (
+                (
+                    quote['symbol'],
+                    quote.get('regularMarketTime', 0),
+                    quote.get('regularMarketPrice'),
+                    quote.get('regularMarketVolume'),
+                    quote.get('currency'),
+                    json.dumps(quote),
+                )
+                for quote in quotes
+            ),
+        )
+
+    def add_financials(
+        self,
+        results: Iterable[list[dict[str, Any]]] | Mapping[str, list[dict[str, Any]]],
+    ) -> None:
+        """Add or replace financial statement values.
+
+        Args:
+            results:
+                Results of Symbols.get_income_statement, get_balance_sheet or
+                get_cash_flow, see yafin.financials.pivot_financials.
+        """
+        self._write(
+            'INSERT OR REPLACE INTO financials VALUES (?, ?, ?, ?, ?, ?)',
+            zip(*pivot_financials(results), strict=True),
+        )
+
+    def _sync_bars(self) -> None:
+        """Mirror charts appended since the last sync into table bars."""
+        if self.chart_store is None:
+            return
+
+        versions = self.chart_store._get_versions()
+        changed = [k for k, v in versions.items() if self._bars_versions.get(k) != v]
+        removed = [k for k in self._bars_versions if k not in versions]
+
+        if not changed and not removed:
+            return
+
+        with self._connection:
+            for ticker, interval in [*changed, *removed]:
+                self._connection.execute(
+                    'DELETE FROM temp.bars WHERE ticker = ? AND interval = ?',
+                    (ticker, interval),
+                )
+
+            for ticker, interval in changed:
+                bars = self.chart_store.read(ticker, interval)
+                self._connection.executemany(
+                    'INSERT INTO temp.bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    zip(
+                        repeat(ticker),
+                        repeat(interval),
+                        *(column.tolist() for column in bars),
+                        strict=False,
+                    ),
+                )
+
+        for key in removed:
+            del self._bars_versions[key]
+
+        self._bars_versions.update((key, versions[key]) for key in changed)
+        logger.debug(f'Synced {len(changed)} charts into bars, removed {len(removed)}.')
+
+    def query(
+        self, sql: str, parameters: Iterable[Any] | Mapping[str, Any] = ()
+    ) -> list[dict[str, Any]]:
+        """Run SQL query over stored data.
+
+        Args:
+            sql:
+                SQL query, e.g. SELECT ticker, max(close) FROM bars WHERE interval =
+                '1d' AND timestamp >= ? GROUP BY ticker.
+            parameters: Query parameters (qmark or named style).
+
+        Returns: Rows as dicts of column name and value, NaN values are None.
+        """
+        with self._lock:
+            # bars are synced only for queries, that may read them
+            if 'bars' in sql.lower():
+                self._sync_bars()
+
+            cursor = self._connection.execute(sql, parameters)  # type: ignore[arg-type]
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_financials(
+        self, tickers: str | list[str] | None = None, typ: str | None = None
+    ) -> Financials:
+        """Get stored financial statement values.
+
+        Args:
+            tickers:
+                Comma-separated string or list of ticker symbols.
+                (optional, default: all tickers)
+            typ: Type without frequency prefix, e.g. NetIncome. (optional, default: all)
+
+        Returns: Tidy columnar table, see yafin.financials.Financials.
+        """
+        if isinstance(tickers, str):
+            tickers = tickers.split(',')
+
+        conditions = []
+        parameters: list[Any] = []
+
+        if tickers is not None:
+            ticker_list = [_normalize_ticker(ticker) for ticker in tickers]
+            conditions.append(f'ticker IN ({", ".join("?" * len(ticker_list))})')
+            parameters.extend(ticker_list)
+
+        if typ is not None:
+            conditions.append('type = ?')
+            parameters.append(typ)
+
+        where = f' WHERE {" AND ".join(conditions)}' if conditions else ''
+        rows = self.query(
+            f'SELECT * FROM financials{where} ORDER BY ticker, type, as_of_date',
+            parameters,
+        )
+        return Financials(
+            *([row[column] for row in rows] for column in Financials._fields)
+        )
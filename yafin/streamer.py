@@ -0,0 +1,405 @@
+import asyncio
+import base64
+import json
+import logging
+import struct
+from collections.abc import AsyncGenerator
+from types import TracebackType
+from typing import Any, NamedTuple, Self
+
+from curl_cffi import CurlError
+from curl_cffi.requests import AsyncSession
+from curl_cffi.requests.websockets import AsyncWebSocket
+
+from .utils import _error, _normalize_ticker
+
+logger = logging.getLogger(__name__)
+
+STREAMER_URL = 'wss://streamer.finance.yahoo.com/?version=2'
+# max number of tickers in a single subscribe or unsubscribe message
+SUBSCRIBE_CHUNK_SIZE = 200
+DEFAULT_QUEUE_SIZE = 10_000
+
+
+class PricingData(NamedTuple):
+    """Decoded pricing message of Yahoo websocket feed.
+
+    Fields missing in message (proto3 defaults) are None. Prices are float32 in the
+    feed, so they may carry float32 rounding noise.
+
+    Attributes:
+        id: Ticker symbol.
+        price: Last price.
+        time: Timestamp in milliseconds.
+        currency: Currency code.
+        exchange: Exchange code.
+        quote_type: Quote type enum, e.g. 8 equity, 9 index, 20 ETF.
+        market_hours: Market hours enum, 0 pre, 1 regular, 2 post, 3 extended.
+        change_percent: Change in percent since previous close.
+        day_volume: Volume of the day.
+        day_high: High of the day.
+        day_low: Low of the day.
+        change: Change since previous close.
+        short_name: Short name.
+        expire_date: Expiration timestamp of derivatives.
+        open_price: Open price of the day.
+        previous_close: Previous close price.
+        strike_price: Strike price of options.
+        underlying_symbol: Underlying symbol of derivatives.
+        open_interest: Open interest of derivatives.
+        options_type: Options type enum, 0 call, 1 put.
+        mini_option: Mini option flag.
+        last_size: Size of the last trade.
+        bid: Bid price.
+        bid_size: Bid size.
+        ask: Ask price.
+        ask_size: Ask size.
+        price_hint: Number of decimal places of prices.
+        vol_24hr: 24 hour volume (crypto).
+        vol_all_currencies: Volume in all currencies (crypto).
+        from_currency: Base currency (currencies and crypto).
+        last_market: Last market (crypto).
+        circulating_supply: Circulating supply (crypto).
+        market_cap: Market capitalization.
+    """
+
+    id: str | None = None
+    price: float | None = None
+    time: int | None = None
+    currency: str | None = None
+    exchange: str | None = None
+    quote_type: int | None = None
+    market_hours: int | None = None
+    change_percent: float | None = None
+    day_volume: int | None = None
+    day_high: float | None = None
+    day_low: float | None = None
+    change: float | None = None
+    short_name: str | None = None
+    expire_date: int | None = None
+    open_price: float | None = None
+    previous_close: float | None = None
+    strike_price: float | None = None
+    underlying_symbol: str | None = None
+    open_interest: int | None = None
+    options_type: int | None = None
+    mini_option: int | None = None
+    last_size: int | None = None
+    bid: float | None = None
+    bid_size: int | None = None
+    ask: float | None = None
+    ask_size: int | None = None
+    price_hint: int | None = None
+    vol_24hr: int | None = None
+    vol_all_currencies: int | None = None
+    from_currency: str | None = None
+    last_market: str | None = None
+    circulating_supply: float | None = None
+    market_cap: float | None = None
+
+
+# protobuf field numbers of zigzag encoded (sint64) fields of PricingData, field
+# number n is PricingData field n - 1
+_SINT_FIELDS = frozenset({3, 9, 14, 19, 21, 22, 24, 26, 27, 28, 29})
+_FIELD_COUNT = len(PricingData._fields)
+_FLOAT = struct.Struct('<f')
+_DOUBLE = struct.Struct('<d')
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Read protobuf varint at position, returns value and next position."""
+    value = 0
+    shift = 0
+
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+
+        if byte < 0x80:
+            return value, pos
+
+        shift += 7
+
+
+def _read_value(data: bytes, pos: int, number: int, wire_type: int) -> tuple[Any, int]:
+    """Read protobuf field value at position, returns value and next position."""
+    if wire_type == 0:
+        value, pos = _read_varint(data, pos)
+
+        if number in _SINT_FIELDS:
+            return (value >> 1) ^ -(value & 1), pos
+
+        return value - (1 << 64) if value >= 1 << 63 else value, pos
+
+    if wire_type == 5:
+        return _FLOAT.unpack_from(data, pos)[0], pos + 4
+
+    if wire_type == 1:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+
+    if wire_type == 2:
+        length, pos = _read_varint(data, pos)
+
+        if pos + length > len(data):
+            raise ValueError('Truncated message.')
+
+        return data[pos : pos + length].decode(), pos + length
+
+    raise ValueError(f'Unsupported {wire_type=}.')
+
+
+def decode_pricing_data(message: str | bytes) -> PricingData:
+    """Decode base64 protobuf pricing message of Yahoo websocket feed.
+
+    Decodes protobuf wire format directly (no protobuf dependency), unknown fields
+    are skipped.
+
+    Args:
+        message: Base64 encoded protobuf PricingData message.
+
+    Returns: Decoded pricing data.
+
+    Raises:
+        ValueError: If message is not valid base64 protobuf.
+    """
+    try:
+        data = base64.b64decode(message)
+        values: list[Any] = [None] * _FIELD_COUNT
+        pos = 0
+
+        while pos < len(data):
+            key, pos = _read_varint(data, pos)
+            number = key >> 3
+            value, pos = _read_value(data, pos, number, key & 7)
+
+            if 1 <= number <= _FIELD_COUNT:
+                values[number - 1] = value
+
+    except (ValueError, IndexError, struct.error) as e:
+        _error(msg=f'Invalid pricing message: {e}', err_cls=ValueError)
+
+    return PricingData._make(values)
+
+
+def _split_tickers(tickers: str) -> list[str]:
+    """Split comma-separated ticker symbols into unique normalized tickers."""
+    return list(
+        dict.fromkeys(_normalize_ticker(t) for t in tickers.split(',') if t.strip())
+    )
+
+
+class _Consumer:
+    """Queue of pricing data of a single listener."""
+
+    __slots__ = ('queue', 'tickers')
+
+    def __init__(self, tickers: set[str] | None, queue_size: int) -> None:
+        self.tickers = tickers
+        self.queue: asyncio.Queue[PricingData | None] = asyncio.Queue(queue_size)
+
+    def put(self, data: PricingData | None) -> None:
+        if self.queue.full():
+            # slow listener drops the oldest data, not blocking the others
+            self.queue.get_nowait()
+
+        self.queue.put_nowait(data)
+
+
+class AsyncStreamer:
+    """Asynchronous client of Yahoo websocket pricing feed.
+
+    Subscribed tickers are streamed over a single websocket, pricing messages are
+    decoded into PricingData and fanned out to all listeners. The connection is
+    opened on the first subscription and reopened with exponential backoff and
+    resubscription of all tickers, when it drops.
+
+    Warning: HTTP resources closing
+        Uses http resources, so do not forget to close them after use to avoid resource
+            leakage or use context manager.
+
+    Attributes:
+        url: Websocket url.
+        queue_size: Max number of pending pricing data per listener, the oldest
+            are dropped for slow listeners.
+        reconnect_delay: Initial delay in seconds before reconnecting.
+        max_reconnect_delay: Max delay in seconds before reconnecting.
+    """
+
+    def __init__(
+        self,
+        url: str = STREAMER_URL,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 60.0,
+    ) -> None:
+        """Create new AsyncStreamer instance.
+
+        Args:
+            url: Websocket url.
+            queue_size: Max number of pending pricing data per listener.
+            reconnect_delay: Initial delay in seconds before reconnecting.
+            max_reconnect_delay: Max delay in seconds before reconnecting.
+        """
+        self.url = url
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self._subscriptions: set[str] = set()
+        self._consumers: set[_Consumer] = set()
+        self._session: AsyncSession[Any] | None = None
+        self._ws: AsyncWebSocket | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def subscriptions(self) -> set[str]:
+        """Subscribed tickers."""
+        return set(self._subscriptions)
+
+    async def __aenter__(self) -> Self:
+        """When entering async context manager, return the streamer."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_val: BaseException | None = None,
+        exc_tb: TracebackType | None = None,
+    ) -> None:
+        """When closing async context manager, close the connection."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the connection and end all listeners."""
+        if self._task is not None:
+            self._task.cancel()
+
+            try:
+                await self._task
+
+            except asyncio.CancelledError:
+                pass
+
+            self._task = None
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+        for consumer in self._consumers:
+            consumer.put(None)
+
+    async def _send(self, action: str, tickers: list[str]) -> None:
+        if self._ws is None:
+            # sent on (re)connect
+            return
+
+        for i in range(0, len(tickers), SUBSCRIBE_CHUNK_SIZE):
+            chunk = tickers[i : i + SUBSCRIBE_CHUNK_SIZE]
+            await self._ws.send_str(json.dumps({action: chunk}))
+
+    async def subscribe(self, tickers: str) -> None:
+        """Subscribe tickers, opens the connection if not open.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+        """
+        ticker_list = [
+            t for t in _split_tickers(tickers) if t not in self._subscriptions
+        ]
+        self._subscriptions.update(ticker_list)
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        elif ticker_list:
+            await self._send('subscribe', ticker_list)
+
+    async def unsubscribe(self, tickers: str) -> None:
+        """Unsubscribe tickers.
+
+        Args:
+            tickers: Comma-separated ticker symbols.
+        """
+        ticker_list = [t for t in _split_tickers(tickers) if t in self._subscriptions]
+        self._subscriptions.difference_update(ticker_list)
+
+        if ticker_list:
+            await self._send('unsubscribe', ticker_list)
+
+    async def listen(self, tickers: str | None = None) -> AsyncGenerator[PricingData]:
+        """Listen to pricing data of subscribed tickers until streamer is closed.
+
+        Args:
+            tickers:
+                Comma-separated ticker symbols to filter.
+                (optional, default: all subscribed tickers)
+
+        Yields: Pricing data.
+        """
+        ticker_set = None if tickers is None else set(_split_tickers(tickers))
+        consumer = _Consumer(ticker_set, self.queue_size)
+        self._consumers.add(consumer)
+
+        try:
+            while (data := await consumer.queue.get()) is not None:
+                yield data
+
+        finally:
+            self._consumers.discard(consumer)
+
+    def _dispatch(self, message: bytes) -> None:
+        """Decode websocket message and put it into queues of listeners."""
+        try:
+            text = message.decode()
+
+            if text.startswith('{'):
+                # version 2 feed wraps base64 message in json
+                payload = json.loads(text)
+
+                if payload.get('type') != 'pricing':
+                    return
+
+                text = payload['message']
+
+            data = decode_pricing_data(text)
+
+        except (ValueError, KeyError, AttributeError):
+            logger.debug(f'Skipping undecodable message {message[:100]!r}.')
+            return
+
+        for consumer in self._consumers:
+            if consumer.tickers is None or data.id in consumer.tickers:
+                consumer.put(data)
+
+    async def _run(self) -> None:
+        """Keep connection open, resubscribe and dispatch messages."""
+        delay = self.reconnect_delay
+
+        while True:
+            try:
+                if self._session is None:
+                    self._session = AsyncSession(impersonate='chrome')
+
+                self._ws = await self._session.ws_connect(self.url)
+                logger.debug(f'Connected to {self.url}.')
+                await self._send('subscribe', sorted(self._subscriptions))
+                delay = self.reconnect_delay
+
+                async for message in self._ws:
+                    self._dispatch(message)
+
+                logger.warning(f'Connection to {self.url} closed, reconnecting.')
+
+            except (CurlError, OSError) as e:
+                logger.warning(
+                    f'Connection to {self.url} failed: {e}, reconnecting in {delay}s.'
+                )
+
+            finally:
+                if self._ws is not None:
+                    self._ws.terminate()
+                    self._ws = None
+
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_reconnect_delay)
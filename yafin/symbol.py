@@ -1,6 +1,7 @@
 import logging
+from time import time
 from types import TracebackType
-from typing import Any, Literal, Self, overload
+from typing import TYPE_CHECKING, Any, Literal, Self, overload
 
 from .client import (
     AsyncClient,
@@ -9,7 +10,16 @@ from .client import (
     _SingletonClientManager,
 )
 from .const import _RESULT_KEY_MAP, QUOTE_SUMMARY_MODULES
-from .utils import _alog_func, _log_func, get_types_with_frequency
+from .utils import (
+    _alog_func,
+    _log_func,
+    _normalize_ticker,
+    get_types_with_frequency,
+)
+
+if TYPE_CHECKING:
+    # store (sqlite3, financials) is imported only by its users, not by every symbol
+    from .store import ChartStore
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +50,26 @@ class SymbolBase:
         Args:
             ticker: Ticker symbol.
         """
-        self.ticker = ticker
+        self.ticker = _normalize_ticker(ticker)
+
+    def _get_missing_period1(
+        self,
+        store: 'ChartStore',
+        interval: str,
+        period1: int | float,
+        period2: int | float | None,
+    ) -> int | float | None:
+        """Start of bars missing in store or None if all requested bars are stored."""
+        stored_range = store.get_range(self.ticker, interval)
+
+        if stored_range is None or period1 < stored_range[0]:
+            return period1
+
+        if period2 is not None and period2 <= stored_range[1]:
+            return None
+
+        # last stored bar is fetched again, as it may have been incomplete
+        return stored_range[1]
 
 
 class Symbol(SymbolBase):
@@ -58,6 +87,7 @@ class Symbol(SymbolBase):
 
     Methods:
         get_chart: Get chart data for the ticker.
+        get_stored_chart: Get chart data for the ticker via local store.
         get_quote: Get quote for the ticker.
         get_quote_type: Get quote type for the ticker.
         get_quote_summary_all_modules: Get quote summary for all modules for the ticker.
@@ -232,6 +262,48 @@ class Symbol(SymbolBase):
         chart_result_list = self._call_client_method('get_chart', kwargs)
         return chart_result_list[0]
 
+    @_log_func
+    def get_stored_chart(
+        self,
+        store: 'ChartStore',
+        interval: str,
+        period1: int | float,
+        period2: int | float | None = None,
+        include_pre_post: bool | None = None,
+    ) -> dict[str, Any]:
+        """Get chart data for the ticker, fetching only bars missing in local store.
+
+        Bars from the last stored bar on (or whole period, if it starts before stored
+        bars) are fetched and appended to the store, then the requested period is
+        served from disk. Events are not stored. Requires numpy.
+
+        Args:
+            store: Local chart store.
+            interval: Data interval.
+            period1: Start timestamp in seconds.
+            period2: End timestamp in seconds. (optional, default: now timestamp)
+            include_pre_post: Whether to include pre and post market.
+
+        Returns: Chart result read from store.
+        """
+        fetch_period1 = self._get_missing_period1(store, interval, period1, period2)
+
+        if fetch_period1 is not None:
+            chart_result = self.get_chart(
+                interval,
+                period1=fetch_period1,
+                # explicit end, so the response cache does not serve stale tail
+                period2=int(time()),
+                include_pre_post=include_pre_post,
+                include_div=False,
+                include_split=False,
+                include_earn=False,
+                include_capital_gain=False,
+            )
+            store.append(chart_result, start=fetch_period1, interval=interval)
+
+        return store.read_chart(self.ticker, interval, period1, period2)
+
     @_log_func
     def get_quote(self, include_pre_post: bool | None = None) -> dict[str, Any]:
         """Get quote for the ticker.
@@ -613,6 +685,7 @@ class AsyncSymbol(SymbolBase):
 
     Methods:
         get_chart: Get chart data for the ticker.
+        get_stored_chart: Get chart data for the ticker via local store.
         get_quote: Get quote for the ticker.
         get_quote_type: Get quote type for the ticker.
         get_quote_summary_all_modules: Get quote summary for all modules for the ticker.
@@ -787,6 +860,48 @@ class AsyncSymbol(SymbolBase):
         chart_result_list = await self._call_client_method('get_chart', kwargs)
         return chart_result_list[0]
 
+    @_alog_func
+    async def get_stored_chart(
+        self,
+        store: 'ChartStore',
+        interval: str,
+        period1: int | float,
+        period2: int | float | None = None,
+        include_pre_post: bool | None = None,
+    ) -> dict[str, Any]:
+        """Get chart data for the ticker, fetching only bars missing in local store.
+
+        Bars from the last stored bar on (or whole period, if it starts before stored
+        bars) are fetched and appended to the store, then the requested period is
+        served from disk. Events are not stored. Requires numpy.
+
+        Args:
+            store: Local chart store.
+            interval: Data interval.
+            period1: Start timestamp in seconds.
+            period2: End timestamp in seconds. (optional, default: now timestamp)
+            include_pre_post: Whether to include pre and post market.
+
+        Returns: Chart result read from store.
+        """
+        fetch_period1 = self._get_missing_period1(store, interval, period1, period2)
+
+        if fetch_period1 is not None:
+            chart_result = await self.get_chart(
+                interval,
+                period1=fetch_period1,
+                # explicit end, so the response cache does not serve stale tail
+                period2=int(time()),
+                include_pre_post=include_pre_post,
+                include_div=False,
+                include_split=False,
+                include_earn=False,
+                include_capital_gain=False,
+            )
+            store.append(chart_result, start=fetch_period1, interval=interval)
+
+        return store.read_chart(self.ticker, interval, period1, period2)
+
     @_alog_func
     async def get_quote(self, include_pre_post: bool | None = None) -> dict[str, Any]:
         """Get quote for the ticker.
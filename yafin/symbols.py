@@ -1,36 +1,137 @@
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable
+from time import sleep
 from types import TracebackType
 from typing import Any, Literal, Self, overload
 
+from curl_cffi.requests.exceptions import RequestException
+
 from .client import (
     AsyncClient,
     Client,
+    _single_attempt,
     _SingletonAsyncClientManager,
     _SingletonClientManager,
 )
 from .const import _RESULT_KEY_MAP
+from .deadline import _get_remaining
+from .exceptions import DeadlineExceededError, RetriesExhaustedError
+from .results import PartialResults, TickerResults
 from .symbol import AsyncSymbol, Symbol
-from .utils import _alog_func, _log_func
+from .utils import _alog_func, _error, _log_func, _normalize_ticker
 
 logger = logging.getLogger(__name__)
 
+# max number of tickers sent in a single multi-ticker request, keeps urls within
+# server limits for large universes
+DEFAULT_CHUNK_SIZE = 200
+# number of extra attempts (with backoff) for a failed chunk, which replace client
+# retries of chunk requests, other chunks are not refetched
+DEFAULT_CHUNK_RETRIES = 2
+
+# multi-ticker client methods with per symbol results, which are chunked
+_CHUNKED_METHODS = {'get_quote', 'get_quote_type', 'get_insights'}
+# results of multi-ticker methods carry their symbol, results of the other methods
+# follow order of tickers
+_SYMBOL_RESULT_METHODS = _CHUNKED_METHODS | {'get_recommendations'}
+
+
+def _is_retryable(exc: Exception) -> bool:
+    """Check if error is transient - timeouts, connection and server errors."""
+    if isinstance(exc, DeadlineExceededError):
+        # budget is spent, retry would fail again
+        return False
+
+    if isinstance(exc, RetriesExhaustedError):
+        # client has already retried it with backoff, unless it made single attempt
+        return exc.attempts == 1
+
+    if not isinstance(exc, RequestException):
+        return False
+
+    status_code = getattr(exc.response, 'status_code', None)
+    # client errors (e.g. 404 for unknown ticker) would fail again
+    return status_code is None or not 400 <= status_code <= 499 or status_code == 429
+
+
+def _get_retry_wait_time(retry: int, backoff: float = 1.0) -> float | None:
+    """Get exponential backoff before retry, None if it would exceed the deadline."""
+    wait_time = min(backoff * 2 ** (retry - 1), 60)
+    remaining = _get_remaining()
+    return None if remaining is not None and wait_time >= remaining else wait_time
+
 
 class SymbolsBase:
     """Base for synchronous and asynchronous Symbol classes for a specific ticker.
 
     Attributes:
         ticker: Ticker symbol.
+        chunk_size: Max number of tickers in a single multi-ticker request.
+        chunk_retries: Number of extra attempts for a failed chunk.
     """
 
-    def __init__(self, tickers: str) -> None:
+    def __init__(
+        self,
+        tickers: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_retries: int = DEFAULT_CHUNK_RETRIES,
+    ) -> None:
         """Create new Symbols instance.
 
         Args:
             tickers: Comma-separated ticker symbols.
+            chunk_size: Max number of tickers in a single multi-ticker request.
+            chunk_retries: Number of extra attempts for a failed chunk.
         """
+        if chunk_size < 1:
+            _error(msg=f'Invalid {chunk_size=}. Must be positive.', err_cls=ValueError)
+
         self.tickers = tickers
-        self._ticker_list = self.tickers.split(',')
+        self.chunk_size = chunk_size
+        self.chunk_retries = chunk_retries
+        # normalized and deduplicated, but in input order - results follow it
+        self._ticker_list = list(
+            dict.fromkeys(_normalize_ticker(t) for t in tickers.split(',') if t.strip())
+        )
+        self._ticker_order = {t: i for i, t in enumerate(self._ticker_list)}
+
+    def _get_ticker_chunks(self) -> list[str]:
+        return [
+            ','.join(self._ticker_list[i : i + self.chunk_size])
+            for i in range(0, len(self._ticker_list), self.chunk_size)
+        ]
+
+    def _merge_chunk_results(
+        self, chunk_results: list[list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Merge results of chunks back into input order of tickers.
+
+        Results with symbol not in input tickers (should not happen) are kept last.
+        """
+        results = [r for chunk_result in chunk_results for r in chunk_result]
+        missing_idx = len(self._ticker_order)
+        return sorted(
+            results,
+            key=lambda r: self._ticker_order.get(
+                _normalize_ticker(r.get('symbol') or ''), missing_idx
+            ),
+        )
+
+    def _check_indexed_method(self, method_name: str) -> None:
+        # search results are not per ticker
+        if (
+            not method_name.startswith('get_')
+            or method_name == 'get_search'
+            or not hasattr(self, method_name)
+        ):
+            _error(msg=f'Invalid {method_name=}.', err_cls=ValueError)
+
+    def _index_results(self, method_name: str, results: list[Any]) -> TickerResults:
+        if method_name in _SYMBOL_RESULT_METHODS:
+            return TickerResults.from_symbol_results(self._ticker_list, results)
+
+        return TickerResults.from_ordered_results(self._ticker_list, results)
 
     def _process_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
         kwargs_copy = kwargs.copy()
@@ -92,13 +193,22 @@ class Symbols(SymbolsBase):
         get_ratings: Get ratings for the ticker.
     """
 
-    def __init__(self, tickers: str) -> None:
+    def __init__(
+        self,
+        tickers: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_retries: int = DEFAULT_CHUNK_RETRIES,
+    ) -> None:
         """Create Symbols instance.
 
         Args:
             tickers: Comma-separated ticker symbols.
+            chunk_size:
+                Max number of tickers in a single multi-ticker (quote, quote type and
+                insights) request. Chunks are merged back in order of tickers.
+            chunk_retries: Number of extra attempts for a failed chunk.
         """
-        super().__init__(tickers)
+        super().__init__(tickers, chunk_size, chunk_retries)
         self._client: Client | None = None
         self._symbols: list[Symbol] | None = None
 
@@ -141,6 +251,27 @@ class Symbols(SymbolsBase):
         """When closing context manager, release the client."""
         self.close()
 
+    def index_results(self, method_name: str, **kwargs: Any) -> TickerResults:
+        """Call Symbols get method and index its results by ticker.
+
+        Results of multi-ticker methods (quote, quote type, insights and
+        recommendations) are keyed by their symbol, so missing and duplicate
+        tickers are recorded. Results of the other methods are keyed in order of
+        tickers.
+
+        Args:
+            method_name: Symbols method name, e.g. get_quote or get_chart.
+            **kwargs: Keyword arguments passed to the Symbols method.
+
+        Returns: Ticker keyed results.
+
+        Raises:
+            ValueError: If method_name is not Symbols get method with per ticker
+                results.
+        """
+        self._check_indexed_method(method_name)
+        return self._index_results(method_name, getattr(self, method_name)(**kwargs))
+
     @overload
     def _call_symbols_method(
         self,
@@ -206,11 +337,58 @@ class Symbols(SymbolsBase):
         self._get_client()
 
         method = getattr(self._client, method_name)
+
+        if method_name in _CHUNKED_METHODS:
+            chunk_results = [
+                self._call_chunk(
+                    method,
+                    _RESULT_KEY_MAP[method_name],
+                    processed_kwargs | {'tickers': c},
+                )
+                for c in self._get_ticker_chunks()
+            ]
+            return self._merge_chunk_results(chunk_results)
+
         response_json = method(**processed_kwargs)
 
         # search does not have result key
         return response_json[result_key]['result'] if result_key else response_json
 
+    def _call_chunk(
+        self,
+        method: Callable[..., dict[str, Any]],
+        result_key: str,
+        kwargs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        # retried here only, the client makes single attempt for each chunk attempt
+        for attempt in range(1, self.chunk_retries + 1):
+            try:
+                with _single_attempt():
+                    response_json = method(**kwargs)
+
+                return response_json[result_key]['result']
+
+            except Exception as exc:
+                if not _is_retryable(exc):
+                    raise
+
+                wait_time = _get_retry_wait_time(attempt)
+
+                if wait_time is None:
+                    raise
+
+                logger.warning(
+                    f'Chunk {kwargs["tickers"]!r} no. {attempt} failed, '
+                    f'retrying in {wait_time}s.'
+                )
+                sleep(wait_time)
+
+        # last attempt, errors are propagated
+        with _single_attempt():
+            response_json = method(**kwargs)
+
+        return response_json[result_key]['result']
+
     @_log_func
     def get_chart(
         self,
@@ -247,7 +425,7 @@ class Symbols(SymbolsBase):
 
     @_log_func
     def get_quote(self, include_pre_post: bool | None = None) -> list[dict[str, Any]]:
-        """Get quote for tickers in a single request.
+        """Get quote for tickers in chunked requests.
 
         Args:
             include_pre_post: Whether to include pre and post market.
@@ -258,7 +436,7 @@ class Symbols(SymbolsBase):
 
     @_log_func
     def get_quote_type(self) -> list[dict[str, Any]]:
-        """Get quote type for tickers in a single request.
+        """Get quote type for tickers in chunked requests.
 
         Returns: List of quote type response result jsons.
         """
@@ -558,7 +736,7 @@ class Symbols(SymbolsBase):
 
     @_log_func
     def get_insights(self) -> list[dict[str, Any]]:
-        """Get insights for tickers in a single request.
+        """Get insights for tickers in chunked requests.
 
         Returns: List of insights response result jsons.
         """
@@ -633,13 +811,22 @@ class AsyncSymbols(SymbolsBase):
         get_ratings: Get ratings for the ticker.
     """
 
-    def __init__(self, tickers: str) -> None:
+    def __init__(
+        self,
+        tickers: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_retries: int = DEFAULT_CHUNK_RETRIES,
+    ) -> None:
         """Create Symbols instance.
 
         Args:
             tickers: Comma-separated ticker symbols.
+            chunk_size:
+                Max number of tickers in a single multi-ticker (quote, quote type and
+                insights) request. Chunks are merged back in order of tickers.
+            chunk_retries: Number of extra attempts for a failed chunk.
         """
-        super().__init__(tickers)
+        super().__init__(tickers, chunk_size, chunk_retries)
         self._client: AsyncClient | None = None
         self._symbols: list[AsyncSymbol] | None = None
 
@@ -682,6 +869,28 @@ class AsyncSymbols(SymbolsBase):
         """When closing context manager, release the client."""
         await self.close()
 
+    async def index_results(self, method_name: str, **kwargs: Any) -> TickerResults:
+        """Call AsyncSymbols get method and index its results by ticker.
+
+        Results of multi-ticker methods (quote, quote type, insights and
+        recommendations) are keyed by their symbol, so missing and duplicate
+        tickers are recorded. Results of the other methods are keyed in order of
+        tickers.
+
+        Args:
+            method_name: AsyncSymbols method name, e.g. get_quote or get_chart.
+            **kwargs: Keyword arguments passed to the AsyncSymbols method.
+
+        Returns: Ticker keyed results.
+
+        Raises:
+            ValueError: If method_name is not AsyncSymbols get method with per
+                ticker results.
+        """
+        self._check_indexed_method(method_name)
+        results = await getattr(self, method_name)(**kwargs)
+        return self._index_results(method_name, results)
+
     @overload
     async def _call_symbols_method(
         self,
@@ -723,6 +932,90 @@ class AsyncSymbols(SymbolsBase):
 
         return await asyncio.gather(*results)
 
+    async def fan_out(
+        self,
+        method_name: str,
+        max_retries: int = 2,
+        backoff: float = 1.0,
+        **kwargs: Any,
+    ) -> PartialResults:
+        """Call AsyncSymbol method for all tickers, tolerating failed tickers.
+
+        Unlike the get methods, failure of a ticker does not discard results of the
+        others. Tickers failed with transient errors (timeouts, connection and server
+        errors) are re-queued with exponential backoff, so only they are requested
+        again. Requests are not retried by the client as well, so each ticker is
+        requested at most max_retries + 1 times.
+
+        Args:
+            method_name: AsyncSymbol method name, e.g. get_chart.
+            max_retries: Max number of retries for each failed ticker.
+            backoff: Wait time in seconds before first retry, doubled each retry.
+            **kwargs: Keyword arguments passed to the AsyncSymbol method.
+
+        Returns: Results of succeeded tickers with errors of failed tickers.
+
+        Raises:
+            ValueError: If method_name is not AsyncSymbol get method.
+        """
+        if not method_name.startswith('get_') or not hasattr(AsyncSymbol, method_name):
+            _error(msg=f'Invalid {method_name=}.', err_cls=ValueError)
+
+        self._get_symbols()
+
+        results: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+        attempts: dict[str, int] = {}
+        queue = self._symbols or []
+
+        for retry in range(max_retries + 1):
+            if retry:
+                wait_time = _get_retry_wait_time(retry, backoff)
+
+                if wait_time is None:
+                    logger.warning(f'Deadline exceeded, not retrying {len(queue)}.')
+                    break
+
+                logger.warning(f'Retrying {len(queue)} tickers in {wait_time}s.')
+                await asyncio.sleep(wait_time)
+
+            # retried here only, tickers are not retried by client as well
+            with _single_attempt():
+                outcomes = await asyncio.gather(
+                    *(getattr(symbol, method_name)(**kwargs) for symbol in queue),
+                    return_exceptions=True,
+                )
+            retry_queue = []
+
+            for symbol, outcome in zip(queue, outcomes, strict=True):
+                attempts[symbol.ticker] = attempts.get(symbol.ticker, 0) + 1
+
+                if not isinstance(outcome, BaseException):
+                    results[symbol.ticker] = outcome
+                    errors.pop(symbol.ticker, None)
+
+                elif isinstance(outcome, Exception):
+                    errors[symbol.ticker] = outcome
+
+                    if _is_retryable(outcome):
+                        retry_queue.append(symbol)
+
+                else:
+                    # cancellation, keyboard interrupt, ...
+                    raise outcome
+
+            queue = retry_queue
+
+            if not queue:
+                break
+
+        return PartialResults(
+            self._ticker_list,
+            [(t, results[t]) for t in self._ticker_list if t in results],
+            errors,
+            attempts,
+        )
+
     @overload
     async def _call_client_method(
         self, method_name: Literal['get_search'], kwargs: dict[str, Any] | None = None
@@ -747,11 +1040,60 @@ class AsyncSymbols(SymbolsBase):
         self._get_client()
 
         method = getattr(self._client, method_name)
+
+        if method_name in _CHUNKED_METHODS:
+            chunk_results = await asyncio.gather(
+                *(
+                    self._call_chunk(
+                        method,
+                        _RESULT_KEY_MAP[method_name],
+                        processed_kwargs | {'tickers': c},
+                    )
+                    for c in self._get_ticker_chunks()
+                )
+            )
+            return self._merge_chunk_results(list(chunk_results))
+
         response_json = await method(**processed_kwargs)
 
         # search does not have result key
         return response_json[result_key]['result'] if result_key else response_json
 
+    async def _call_chunk(
+        self,
+        method: Callable[..., Awaitable[dict[str, Any]]],
+        result_key: str,
+        kwargs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        # retried here only, the client makes single attempt for each chunk attempt
+        for attempt in range(1, self.chunk_retries + 1):
+            try:
+                with _single_attempt():
+                    response_json = await method(**kwargs)
+
+                return response_json[result_key]['result']
+
+            except Exception as exc:
+                if not _is_retryable(exc):
+                    raise
+
+                wait_time = _get_retry_wait_time(attempt)
+
+                if wait_time is None:
+                    raise
+
+                logger.warning(
+                    f'Chunk {kwargs["tickers"]!r} no. {attempt} failed, '
+                    f'retrying in {wait_time}s.'
+                )
+                await asyncio.sleep(wait_time)
+
+        # last attempt, errors are propagated
+        with _single_attempt():
+            response_json = await method(**kwargs)
+
+        return response_json[result_key]['result']
+
     @_alog_func
     async def get_chart(
         self,
@@ -790,7 +1132,7 @@ class AsyncSymbols(SymbolsBase):
     async def get_quote(
         self, include_pre_post: bool | None = None
     ) -> list[dict[str, Any]]:
-        """Get quote for tickers in a single request.
+        """Get quote for tickers in chunked requests.
 
         Args:
             include_pre_post: Whether to include pre and post market.
@@ -801,7 +1143,7 @@ class AsyncSymbols(SymbolsBase):
 
     @_alog_func
     async def get_quote_type(self) -> list[dict[str, Any]]:
-        """Get quote type for tickers in a single request.
+        """Get quote type for tickers in chunked requests.
 
         Returns: List of quote type response result jsons.
         """
@@ -1101,7 +1443,7 @@ class AsyncSymbols(SymbolsBase):
 
     @_alog_func
     async def get_insights(self) -> list[dict[str, Any]]:
-        """Get insights for tickers in a single request.
+        """Get insights for tickers in chunked requests.
 
         Returns: List of insights response result jsons.
         """
@@ -1,6 +1,8 @@
+import inspect
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Mapping
 from functools import wraps
+from types import ModuleType
 from typing import Any, NoReturn, Type
 from urllib.parse import urlencode
 
@@ -39,6 +41,115 @@ def _encode_url(url: str, params: dict[str, Any] | None = None) -> str:
     return f'{url}?{urlencode(params_copy)}'
 
 
+def _normalize_ticker(ticker: str) -> str:
+    """Normalize ticker symbol.
+
+    Args:
+        ticker: Ticker symbol.
+
+    Returns: stripped and upper-cased ticker symbol.
+    """
+    return ticker.strip().upper()
+
+
+def _normalize_tickers(tickers: str) -> str:
+    """Normalize comma-separated ticker symbols into canonical form.
+
+    Args:
+        tickers: Comma-separated ticker symbols.
+
+    Returns: sorted, deduplicated, stripped and upper-cased ticker symbols.
+    """
+    return _join_csv({_normalize_ticker(t) for t in tickers.split(',') if t.strip()})
+
+
+def _parse_csv(value: str) -> set[str]:
+    """Parse comma-separated values into set of stripped values.
+
+    Args:
+        value: Comma-separated values, e.g. modules, types or events.
+
+    Returns: set of stripped values.
+    """
+    return {v.strip() for v in value.split(',')}
+
+
+def _join_csv(values: Iterable[str]) -> str:
+    """Join values into canonical comma-separated string.
+
+    Args:
+        values: values, e.g. modules, types or events.
+
+    Returns: sorted comma-separated values.
+    """
+    return ','.join(sorted(values))
+
+
+def _normalize_csv(value: str | None) -> str | None:
+    if not value:
+        return value
+
+    return _join_csv(_parse_csv(value))
+
+
+def _normalize_timestamp(value: int | float | None) -> int | None:
+    return None if value is None else int(value)
+
+
+# request arg name -> normalizer into canonical form
+_ARG_NORMALIZERS: dict[str, Callable[[Any], Any]] = {
+    'ticker': _normalize_ticker,
+    'tickers': _normalize_tickers,
+    'events': _normalize_csv,
+    'modules': _normalize_csv,
+    'types': _normalize_csv,
+    'period1': _normalize_timestamp,
+    'period2': _normalize_timestamp,
+    'start_date': _normalize_timestamp,
+    'end_date': _normalize_timestamp,
+}
+
+
+def _canonical_args(
+    func: Callable[..., Any],
+    normalizers: Mapping[str, Callable[[Any], Any]] = _ARG_NORMALIZERS,
+) -> Callable[..., Any]:
+    """Decorator for calling function with canonical arguments.
+
+    Binds positional and keyword arguments to the signature, fills in defaults and
+    normalizes request args (tickers, comma-separated values, timestamps), so equal
+    requests produce equal cache keys (and urls), regardless of the call style.
+
+    Note:
+        Has to be applied on top of caching decorator (lru_cache, alru_cache).
+    """
+    signature = inspect.signature(func)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+
+        for name, value in bound.arguments.items():
+            normalizer = normalizers.get(name)
+
+            if normalizer is not None:
+                bound.arguments[name] = normalizer(value)
+
+        return func(*bound.args, **bound.kwargs)
+
+    return wrapper
+
+
+def _canonical_search_args(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Decorator for calling search function with canonical arguments.
+
+    Same as _canonical_args, but free-text query (tickers arg) is only stripped, as
+    its case, commas and word order are meaningful.
+    """
+    return _canonical_args(func, _ARG_NORMALIZERS | {'tickers': str.strip})
+
+
 def _error(msg: str, err_cls: Type[Exception] = Exception) -> NoReturn:
     """Log error message and raise exception.
 
@@ -50,6 +161,47 @@ def _error(msg: str, err_cls: Type[Exception] = Exception) -> NoReturn:
     raise err_cls(msg)
 
 
+def _import_numpy() -> ModuleType:
+    """Import optional numpy dependency with install hint if missing."""
+    try:
+        import numpy
+
+    except ImportError:
+        _error(
+            msg='NumPy is required, install it with: pip install yafin[numpy]',
+            err_cls=ImportError,
+        )
+
+    return numpy
+
+
+def _get_chart_array(chart_result: dict[str, Any], field: str) -> Any:
+    """Get chart OHLCV, adjclose or timestamp field as float numpy array.
+
+    None gaps, that Yahoo emits for bars without trades, are NaN. Requires numpy.
+    """
+    np = _import_numpy()
+    indicators = chart_result.get('indicators', {})
+
+    if field == 'timestamp':
+        values = chart_result.get('timestamp')
+
+    elif field == 'adjclose':
+        values = (indicators.get('adjclose') or [{}])[0].get(field)
+
+    else:
+        values = (indicators.get('quote') or [{}])[0].get(field)
+
+    if values is None:
+        # chart of range without any bars has no timestamps and no quote fields
+        if not chart_result.get('timestamp'):
+            return np.empty(0, dtype=np.float64)
+
+        _error(msg=f'Chart result has no {field=}.', err_cls=ValueError)
+
+    return np.array(values, dtype=np.float64)
+
+
 def _check_interval(interval: str) -> None:
     if interval not in INTERVALS:
         _error(
@@ -157,7 +309,7 @@ def get_types_with_frequency(typ: str, frequency: str | None = None) -> str:
 
     types = _TYPES[typ]
     types_with_frequency = [f'{frequency}{t}' if frequency else t for t in types]
-    return ','.join(types_with_frequency)
+    return _join_csv(types_with_frequency)
 
 
 def _get_func_name(func: Callable[..., Any], args: tuple[Any, ...]) -> str: